@@ -6,8 +6,25 @@ import click
 from openshift_cli_installer.cli_entrypoint import cli_entrypoint
 from openshift_cli_installer.utils.click_dict_type import DictParamType
 from openshift_cli_installer.utils.const import (
+    ADMISSION_CONTROL_DEFAULT_MAX_LOAD_PER_CPU,
+    ADMISSION_CONTROL_DEFAULT_PROCESS_MEMORY_GIB,
+    ASYNC_ENGINE_DEFAULT_WORKERS,
+    CLI_ROSA_BACKEND_STR,
+    CLUSTER_POOL_DEFAULT_SIZE,
+    CLUSTER_POOL_REFILL_STR,
     CREATE_STR,
+    DESTROY_ALL_STR,
     DESTROY_STR,
+    HIBERNATE_STR,
+    HYPERSHIFT_VPC_POOL_DEFAULT_SIZE,
+    OCM_RATE_LIMIT_DEFAULT,
+    POOL_REFILL_STR,
+    QUERY_CACHE_DEFAULT_TTL,
+    RESUME_STR,
+    SUPPORTED_CREATE_FAILURE_POLICIES,
+    SUPPORTED_ROSA_BACKENDS,
+    SUPPORTED_VPC_PROVISIONERS,
+    TERRAFORM_VPC_PROVISIONER_STR,
 )
 
 
@@ -15,8 +32,17 @@ from openshift_cli_installer.utils.const import (
 @click.option(
     "-a",
     "--action",
-    type=click.Choice([CREATE_STR, DESTROY_STR]),
-    help="Action to perform Openshift cluster/s",
+    type=click.Choice([CREATE_STR, DESTROY_STR, HIBERNATE_STR, RESUME_STR, POOL_REFILL_STR, CLUSTER_POOL_REFILL_STR]),
+    help="""
+\b
+Action to perform Openshift cluster/s.
+hibernate and resume run on OCM managed clusters from --clusters-install-data-directory,
+or from S3 bucket backups when --s3-bucket-name is passed (optional --s3-bucket-path and --s3-bucket-object-name filter).
+pool-refill creates hypershift VPCs until every --hypershift-vpc-pool-regions pool has --hypershift-vpc-pool-size
+available VPCs.
+cluster-pool-refill creates clusters until the clusters pool has --cluster-pool-size ready clusters
+of every --cluster spec.
+""",
 )
 @click.option(
     "-p",
@@ -25,6 +51,95 @@ from openshift_cli_installer.utils.const import (
     is_flag=True,
     show_default=True,
 )
+@click.option(
+    "--async-engine",
+    help="""
+\b
+Drive parallel clusters install/uninstall from a single asyncio event loop.
+Long waits (installer processes and OCM polling) do not hold a thread.
+""",
+    is_flag=True,
+    show_default=True,
+)
+@click.option(
+    "--async-engine-workers",
+    help="Number of threads used by the async engine for blocking calls",
+    type=int,
+    default=ASYNC_ENGINE_DEFAULT_WORKERS,
+    show_default=True,
+)
+@click.option(
+    "--max-parallel-clusters",
+    help="""
+\b
+Maximum number of clusters to install/uninstall concurrently with --parallel, defaults to all clusters.
+Clusters are created longest expected create duration first; low priority clusters
+(`priority=low`) which are not expected to be created before the longest cluster timeout are skipped.
+""",
+    type=int,
+)
+@click.option(
+    "--admission-control",
+    help="""
+\b
+Start `openshift-install` and `terraform` processes only when the host has enough available memory
+and CPU load allows it, to avoid OOM kills when running many clusters in parallel.
+""",
+    is_flag=True,
+    show_default=True,
+)
+@click.option(
+    "--admission-control-process-memory",
+    help="Memory (GiB) needed to start one `openshift-install` or `terraform` process",
+    type=float,
+    default=ADMISSION_CONTROL_DEFAULT_PROCESS_MEMORY_GIB,
+    show_default=True,
+)
+@click.option(
+    "--admission-control-max-load",
+    help="Maximum 1 minute load average per CPU to start a new `openshift-install` or `terraform` process",
+    type=float,
+    default=ADMISSION_CONTROL_DEFAULT_MAX_LOAD_PER_CPU,
+    show_default=True,
+)
+@click.option(
+    "--admission-control-cgroup-memory-limit",
+    help="""
+\b
+Memory limit (GiB) for each `openshift-install` process, applied with a cgroup using `systemd-run --scope`.
+""",
+    type=float,
+)
+@click.option(
+    "--resume",
+    help="""
+\b
+Resume create of clusters from their last completed phase.
+Completed phases are read from each cluster lifecycle journal in --clusters-install-data-directory.
+Clusters must be passed with `name` (not `name-prefix`).
+""",
+    is_flag=True,
+    show_default=True,
+)
+@click.option(
+    "--create-failure-policy",
+    help="""
+\b
+What to do when at least one cluster fails to create.
+    destroy-all: destroy all the clusters that were created successfully.
+    keep-successful: keep the clusters that were created successfully, failed clusters are rolled back.
+""",
+    type=click.Choice(SUPPORTED_CREATE_FAILURE_POLICIES),
+    default=DESTROY_ALL_STR,
+    show_default=True,
+)
+@click.option(
+    "--create-retries",
+    help="Number of times to retry creating clusters that failed to create",
+    type=int,
+    default=0,
+    show_default=True,
+)
 @click.option(
     "--ssh-key-file",
     help="id_rsa.pub file path for AWS IPI or ACM clusters",
@@ -89,6 +204,137 @@ File must include token for `registry.ci.openshift.org`
     help="OCM token.",
     default=os.environ.get("OCM_TOKEN"),
 )
+@click.option(
+    "--ocm-rate-limit",
+    help="""
+\b
+Maximum OCM API calls per second from all clusters (a ROSA command counts as 3 calls).
+The rate is halved when OCM throttles a call and recovers gradually.
+""",
+    type=float,
+    default=OCM_RATE_LIMIT_DEFAULT,
+    show_default=True,
+)
+@click.option(
+    "--rosa-backend",
+    help="""
+\b
+Backend for ROSA operations.
+    cli: run `rosa` commands.
+    ocm-api: call the OCM API directly with the shared OCM client for listing versions and regions,
+        deleting clusters and creating hypershift IDP; other operations and failed API calls use `rosa`.
+""",
+    type=click.Choice(SUPPORTED_ROSA_BACKENDS),
+    default=CLI_ROSA_BACKEND_STR,
+    show_default=True,
+)
+@click.option(
+    "--hypershift-vpc-provisioner",
+    help="""
+\b
+Provisioner for the hypershift clusters VPC (VPC, public and private subnets, NAT gateway and route tables).
+    terraform: apply the `setup-vpc.tf` manifest.
+    aws-api: create the resources with direct AWS API calls, no Terraform init and state.
+The provisioner is saved in the cluster data and used again on destroy.
+""",
+    type=click.Choice(SUPPORTED_VPC_PROVISIONERS),
+    default=TERRAFORM_VPC_PROVISIONER_STR,
+    show_default=True,
+)
+@click.option(
+    "--hypershift-shared-oidc-config",
+    help="""
+\b
+Hypershift clusters use an OIDC config and operator roles shared by all clusters of the same AWS account and region,
+created once, instead of creating and deleting their own.
+Clusters using the shared resources are tracked in a registry in the `--s3-bucket-name` bucket (required), the shared
+resources are deleted with the last cluster using them.
+""",
+    is_flag=True,
+    show_default=True,
+)
+@click.option(
+    "--hypershift-vpc-pool",
+    help="""
+\b
+Use the pre-provisioned hypershift VPCs pool (see `--action pool-refill`).
+On create, hypershift clusters without custom `cidr`/`private-subnets`/`public-subnets` claim an available VPC
+from their region pool; the VPC provisioner is used when the pool is empty.
+On destroy, the claimed VPC is cleaned and returned to the pool instead of deleted.
+""",
+    is_flag=True,
+    show_default=True,
+)
+@click.option(
+    "--hypershift-vpc-pool-regions",
+    help="Comma-separated AWS regions of the hypershift VPCs pools to refill with `--action pool-refill`",
+)
+@click.option(
+    "--hypershift-vpc-pool-size",
+    help="Number of available VPCs to keep in every hypershift VPCs pool with `--action pool-refill`",
+    type=int,
+    default=HYPERSHIFT_VPC_POOL_DEFAULT_SIZE,
+    show_default=True,
+)
+@click.option(
+    "--speculative-clusters",
+    help="""
+\b
+Number of extra clusters to create for every spec of clusters named by `name-prefix` (requires `--parallel`).
+The first ready clusters of a spec are kept, up to the number of requested clusters; the other clusters of the spec
+are cancelled and rolled back, or destroyed if they finished anyway (for example IPI clusters).
+""",
+    type=int,
+    default=0,
+    show_default=True,
+)
+@click.option(
+    "--cluster-pool",
+    help="""
+\b
+Claim ready clusters from the clusters pool (see `--action cluster-pool-refill`) instead of creating them.
+Pooled clusters match the cluster spec (all `--cluster` keys except name, name-prefix, timeout and priority),
+the claimed cluster data is written to the cluster directory; clusters are created when the pool has no match.
+The pool is kept in S3 when `--s3-bucket-name` is passed, else in `--clusters-install-data-directory`/cluster-pool.
+ACM hub and managed clusters are always created.
+""",
+    is_flag=True,
+    show_default=True,
+)
+@click.option(
+    "--cluster-pool-size",
+    help="Number of ready clusters to keep in the pool for every `--cluster` spec with `--action cluster-pool-refill`",
+    type=int,
+    default=CLUSTER_POOL_DEFAULT_SIZE,
+    show_default=True,
+)
+@click.option(
+    "--query-cache-ttl",
+    help="""
+\b
+Seconds to reuse cached read-only ROSA/OCM queries results (available versions and regions),
+the cache is on disk and shared between runs. 0 disables the cache.
+""",
+    type=int,
+    default=QUERY_CACHE_DEFAULT_TTL,
+    show_default=True,
+)
+@click.option(
+    "--bypass-query-cache",
+    help="Ignore cached read-only ROSA/OCM queries results and refresh them.",
+    is_flag=True,
+    show_default=True,
+)
+@click.option(
+    "--ocm-token-cache",
+    help="""
+\b
+Cache the OCM access token exchanged from --ocm-token on disk (readable only by the current user),
+following runs reuse it until shortly before it expires.
+""",
+    is_flag=True,
+    show_default=True,
+)
 @click.option(
     "--aws-access-key-id",
     help="AWS access-key-id, needed for OSD AWS clusters.",
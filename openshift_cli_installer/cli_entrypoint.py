@@ -1,10 +1,33 @@
+import copy
+import os
 import shutil
+import tempfile
+
+import click
+from simple_logger.logger import get_logger
 
 from openshift_cli_installer.libs.clusters.ocp_clusters import OCPClusters
 from openshift_cli_installer.libs.user_input import UserInput
-from openshift_cli_installer.utils.clusters import destroy_clusters_from_s3_bucket_or_local_directory
-from openshift_cli_installer.utils.const import CREATE_STR, DESTROY_CLUSTERS_FROM_S3_BASE_DATA_DIRECTORY
+from openshift_cli_installer.utils.cluster_pool import cluster_pool_refill_clusters, cluster_pool_spec_hash
+from openshift_cli_installer.utils.clusters import (
+    clusters_from_directories,
+    destroy_clusters_from_s3_bucket_or_local_directory,
+    get_destroy_clusters_kwargs,
+    power_state_clusters_from_s3_bucket_or_local_directory,
+)
+from openshift_cli_installer.utils.const import (
+    CLUSTER_POOL_REFILL_STR,
+    CREATE_STR,
+    DESTROY_CLUSTERS_FROM_S3_BASE_DATA_DIRECTORY,
+    DESTROYED_STR,
+    KEEP_SUCCESSFUL_STR,
+    POOL_REFILL_STR,
+    POWER_STATE_ACTIONS,
+)
 from openshift_cli_installer.utils.gcp_utils import restore_gcp_configuration, set_gcp_configuration
+from openshift_cli_installer.utils.hypershift_vpc_pool import refill_hypershift_vpc_pools
+
+LOGGER = get_logger(name=__name__)
 
 
 def cli_entrypoint(**kwargs):
@@ -13,10 +36,26 @@ def cli_entrypoint(**kwargs):
     if user_input.dry_run:
         return
 
+    if user_input.action == POOL_REFILL_STR:
+        refill_hypershift_vpc_pools(
+            regions=user_input.hypershift_vpc_pool_regions, size=user_input.hypershift_vpc_pool_size
+        )
+        return
+
     gcp_params = set_gcp_configuration(user_input=user_input)
 
     try:
-        if (
+        if user_input.action in POWER_STATE_ACTIONS:
+            user_input.destroy_from_s3_bucket_or_local_directory = True
+            user_input = power_state_clusters_from_s3_bucket_or_local_directory(user_input=user_input)
+
+            try:
+                clusters = OCPClusters(user_input=user_input)
+                clusters.run_create_or_destroy_clusters()
+            finally:
+                shutil.rmtree(DESTROY_CLUSTERS_FROM_S3_BASE_DATA_DIRECTORY, ignore_errors=True)
+
+        elif (
             user_input.destroy_clusters_from_s3_bucket
             or user_input.destroy_clusters_from_install_data_directory
             or user_input.destroy_clusters_from_install_data_directory_using_s3_bucket
@@ -31,6 +70,10 @@ def cli_entrypoint(**kwargs):
             finally:
                 shutil.rmtree(DESTROY_CLUSTERS_FROM_S3_BASE_DATA_DIRECTORY, ignore_errors=True)
 
+        elif user_input.action == CLUSTER_POOL_REFILL_STR:
+            user_input.destroy_from_s3_bucket_or_local_directory = False
+            refill_cluster_pool(user_input=user_input)
+
         else:
             user_input.destroy_from_s3_bucket_or_local_directory = False
             clusters = OCPClusters(user_input=user_input)
@@ -43,3 +86,70 @@ def cli_entrypoint(**kwargs):
 
     finally:
         restore_gcp_configuration(gcp_params=gcp_params)
+
+
+def reap_dead_pool_clusters(user_input, spec_hashes):
+    """
+    Destroy the pool clusters parked as dead by claimants, they are removed from the pool once destroyed.
+    Clusters which fail to destroy are kept for the next refill.
+    """
+    cluster_pool_store = user_input.cluster_pool_store
+    dead_clusters_dir = tempfile.mkdtemp(prefix="cluster-pool-dead-")
+    dead_clusters_spec_hashes = {}
+    try:
+        for _spec_hash in spec_hashes:
+            for _cluster_name in cluster_pool_store.dead(spec_hash=_spec_hash):
+                cluster_pool_store.fetch_dead(
+                    spec_hash=_spec_hash,
+                    cluster_name=_cluster_name,
+                    cluster_dir=os.path.join(dead_clusters_dir, _cluster_name),
+                )
+                dead_clusters_spec_hashes[_cluster_name] = _spec_hash
+
+        if not dead_clusters_spec_hashes:
+            return
+
+        LOGGER.info(f"Destroying dead pool clusters: {sorted(dead_clusters_spec_hashes)}")
+        destroy_user_input = get_destroy_clusters_kwargs(
+            clusters_data_list=clusters_from_directories(directories=[dead_clusters_dir]),
+            user_input=copy.copy(user_input),
+        )
+        destroy_user_input.create = False
+        destroy_user_input.destroy_from_s3_bucket_or_local_directory = True
+        clusters = OCPClusters(user_input=destroy_user_input)
+        try:
+            clusters.run_create_or_destroy_clusters()
+        except click.Abort:
+            LOGGER.error("Failed to destroy dead pool clusters, they are kept for the next refill")
+
+        for _cluster_name, _status in clusters.clusters_status.items():
+            if _status == DESTROYED_STR:
+                cluster_pool_store.remove_dead(
+                    spec_hash=dead_clusters_spec_hashes[_cluster_name], cluster_name=_cluster_name
+                )
+
+    finally:
+        shutil.rmtree(dead_clusters_dir, ignore_errors=True)
+
+
+def refill_cluster_pool(user_input):
+    reap_dead_pool_clusters(
+        user_input=user_input,
+        spec_hashes={cluster_pool_spec_hash(cluster=_cluster) for _cluster in user_input.clusters},
+    )
+    user_input.clusters = cluster_pool_refill_clusters(
+        clusters=user_input.clusters,
+        cluster_pool_store=user_input.cluster_pool_store,
+        size=user_input.cluster_pool_size,
+    )
+    if not user_input.clusters:
+        return
+
+    user_input.parallel = len(user_input.clusters) > 1 and user_input.user_kwargs.get("parallel")
+    # Clusters which failed to create are rolled back by themselves, the created ones join the pool
+    user_input.create_failure_policy = KEEP_SUCCESSFUL_STR
+    clusters = OCPClusters(user_input=user_input)
+    try:
+        clusters.run_create_or_destroy_clusters()
+    finally:
+        clusters.add_created_clusters_to_pool()
@@ -11,17 +11,27 @@ from ocp_utilities.utils import run_command
 from simple_logger.logger import get_logger
 
 from openshift_cli_installer.libs.clusters.ocp_cluster import OCPCluster
+from openshift_cli_installer.utils.async_utils import run_blocking, run_command_async
 from openshift_cli_installer.utils.cluster_versions import (
     get_cluster_version_to_install,
     get_ipi_cluster_versions,
     parse_openshift_release_url,
 )
-from openshift_cli_installer.utils.const import CREATE_STR, DESTROY_STR, PRODUCTION_STR, GCP_STR, AWS_STR
+from openshift_cli_installer.utils.const import (
+    AWS_STR,
+    CLUSTER_READY_PHASE,
+    CLUSTER_REQUESTED_PHASE,
+    CREATE_STR,
+    DESTROY_STR,
+    GCP_STR,
+    OPENSHIFT_INSTALL_STATE_FILENAME,
+    PRODUCTION_STR,
+    WAIT_FOR_INSTALL_STR,
+)
 from openshift_cli_installer.utils.general import (
     generate_unified_pull_secret,
     get_install_config_j2_template,
     get_local_ssh_key,
-    zip_and_upload_to_s3,
 )
 from openshift_cli_installer.utils.general import get_dict_from_json
 
@@ -47,17 +57,31 @@ class IpiCluster(OCPCluster):
 
     def _prepare_ipi_cluster(self):
         self.ipi_base_available_versions = get_ipi_cluster_versions()
-        self.cluster["version"] = get_cluster_version_to_install(
+        self.cluster["version"] = self.resolve_cluster_version(resolve_func=self._get_ipi_version_to_install)
+        self._set_install_version_url()
+        self._ipi_download_installer()
+        # When resuming a started install, install-config.yaml was already consumed by `openshift-install`
+        if self.user_input.create and not self.install_started:
+            self._create_install_config_file()
+
+    @property
+    def install_started(self):
+        """
+        The cluster was requested according to the lifecycle journal and `openshift-install` wrote its install
+        state; the journal is written before the installer runs, a crash in between leaves no install to wait for.
+        """
+        return self.journal.is_completed(CLUSTER_REQUESTED_PHASE) and os.path.exists(
+            os.path.join(self.cluster_info["cluster-dir"], OPENSHIFT_INSTALL_STATE_FILENAME)
+        )
+
+    def _get_ipi_version_to_install(self):
+        return get_cluster_version_to_install(
             wanted_version=self.cluster_info["user-requested-version"],
             base_versions_dict=self.ipi_base_available_versions,
             platform=self.cluster_info["platform"],
             stream=self.cluster_info["stream"],
             log_prefix=self.log_prefix,
         )
-        self._set_install_version_url()
-        self._ipi_download_installer()
-        if self.user_input.create:
-            self._create_install_config_file()
 
     def _ipi_download_installer(self):
         openshift_install_str = "openshift-install"
@@ -138,20 +162,44 @@ class IpiCluster(OCPCluster):
             )
             raise click.Abort()
 
-    def run_installer_command(self, action, raise_on_failure):
+    def installer_command(self, action):
+        installer_action = "wait-for install-complete" if action == WAIT_FOR_INSTALL_STR else f"{action} cluster"
+        return self.limit_command_resources(
+            command=shlex.split(
+                f"{self.openshift_install_binary_path} {installer_action} --dir"
+                f" {self.cluster_info['cluster-dir']} --log-level {self.log_level}"
+            )
+        )
+
+    @property
+    def installer_create_action(self):
+        """
+        When resuming a cluster which was already requested, wait for the running install instead of creating it.
+
+        Returns:
+            str or None: installer action to run, None if the cluster is already installed.
+        """
+        if self.journal.is_completed(CLUSTER_READY_PHASE):
+            self.logger.info(f"{self.log_prefix}: Cluster already installed according to lifecycle journal")
+            return None
+
+        if self.install_started:
+            return WAIT_FOR_INSTALL_STR
+
+        if self.journal.is_completed(CLUSTER_REQUESTED_PHASE):
+            self.logger.warning(f"{self.log_prefix}: Cluster was requested but the install did not start, creating it")
+        else:
+            self.journal.record(phase=CLUSTER_REQUESTED_PHASE)
+
+        return CREATE_STR
+
+    def log_installer_command(self, action):
         run_after_failed_create_str = (
             " after cluster creation failed" if action == DESTROY_STR and self.user_input.action == CREATE_STR else ""
         )
         self.logger.info(f"{self.log_prefix}: Running cluster {action}{run_after_failed_create_str}")
-        res, out, err = run_command(
-            command=shlex.split(
-                f"{self.openshift_install_binary_path} {action} cluster --dir"
-                f" {self.cluster_info['cluster-dir']} --log-level {self.log_level}"
-            ),
-            capture_output=False,
-            check=False,
-        )
 
+    def verify_installer_command_result(self, action, raise_on_failure, res, out, err):
         if not res:
             self.logger.error(
                 f"{self.log_prefix}: Failed to run cluster {action} \n\tERR: {err}\n\tOUT: {out}.",
@@ -161,35 +209,81 @@ class IpiCluster(OCPCluster):
 
         return res, out, err
 
-    def create_cluster(self):
-        def _rollback_on_error(_ex=None):
-            self.logger.error(f"{self.log_prefix}: Failed to create cluster: {_ex or 'No exception'}")
-            if self.user_input.must_gather_output_dir:
-                self.collect_must_gather()
+    def run_installer_command(self, action, raise_on_failure):
+        with self.host_resources_admission(process_name=f"openshift-install {action}"):
+            self.log_installer_command(action=action)
+            res, out, err = run_command(
+                command=self.installer_command(action=action),
+                capture_output=False,
+                check=False,
+            )
 
-            self.logger.warning(f"{self.log_prefix}: Cleaning cluster leftovers.")
-            self.destroy_cluster()
-            raise click.Abort()
+        return self.verify_installer_command_result(
+            action=action, raise_on_failure=raise_on_failure, res=res, out=out, err=err
+        )
+
+    async def run_installer_command_async(self, action, raise_on_failure):
+        async with self.host_resources_admission_async(process_name=f"openshift-install {action}"):
+            self.log_installer_command(action=action)
+            res, out, err = await run_command_async(command=self.installer_command(action=action), capture_output=False)
+
+        return self.verify_installer_command_result(
+            action=action, raise_on_failure=raise_on_failure, res=res, out=out, err=err
+        )
 
+    def prepare_create_retry(self):
+        super().prepare_create_retry()
+        # `openshift-install` consumes install-config.yaml
+        self._create_install_config_file()
+
+    def rollback_cluster_create(self, ex=None):
+        self.collect_failed_create_data(ex=ex)
+        self.logger.warning(f"{self.log_prefix}: Cleaning cluster leftovers.")
+        self.destroy_cluster()
+        raise click.Abort()
+
+    def finalize_cluster_create(self):
+        self.add_cluster_info_to_cluster_object()
+        self.logger.success(f"{self.log_prefix}: Cluster created successfully")
+
+    def create_cluster(self):
         self.timeout_watch = self.start_time_watcher()
-        res, _, _ = self.run_installer_command(action=CREATE_STR, raise_on_failure=False)
+        if installer_action := self.installer_create_action:
+            res, _, _ = self.run_installer_command(action=installer_action, raise_on_failure=False)
 
-        if not res:
-            _rollback_on_error()
+            if not res:
+                self.rollback_cluster_create()
+
+            self.journal.record(phase=CLUSTER_READY_PHASE)
 
         try:
-            self.add_cluster_info_to_cluster_object()
-            self.logger.success(f"{self.log_prefix}: Cluster created successfully")
+            self.finalize_cluster_create()
 
         except Exception as ex:
-            _rollback_on_error(_ex=ex)
+            self.rollback_cluster_create(ex=ex)
 
-        if self.user_input.s3_bucket_name:
-            zip_and_upload_to_s3(
-                install_dir=self.cluster_info["cluster-dir"],
-                s3_bucket_name=self.user_input.s3_bucket_name,
-                s3_bucket_object_name=self.cluster_info["s3-object-name"],
-            )
+        self.upload_cluster_data_to_s3()
+
+    async def create_cluster_async(self, executor):
+        self.timeout_watch = self.start_time_watcher()
+
+        try:
+            if installer_action := self.installer_create_action:
+                res, _, _ = await self.run_installer_command_async(action=installer_action, raise_on_failure=False)
+                if not res:
+                    raise click.Abort()
+
+                self.journal.record(phase=CLUSTER_READY_PHASE)
+
+            await run_blocking(executor=executor, func=self.finalize_cluster_create)
+
+        except Exception as ex:
+            await run_blocking(executor=executor, func=self.collect_failed_create_data, ex=ex)
+            self.logger.warning(f"{self.log_prefix}: Cleaning cluster leftovers.")
+            await self.destroy_cluster_async(executor=executor)
+            raise click.Abort()
+
+        await run_blocking(executor=executor, func=self.upload_cluster_data_to_s3)
 
     def destroy_cluster(self):
         self.timeout_watch = self.start_time_watcher()
@@ -197,6 +291,12 @@ class IpiCluster(OCPCluster):
         self.logger.success(f"{self.log_prefix}: Cluster destroyed")
         self.delete_cluster_s3_buckets()
 
+    async def destroy_cluster_async(self, executor):
+        self.timeout_watch = self.start_time_watcher()
+        await self.run_installer_command_async(action=DESTROY_STR, raise_on_failure=True)
+        self.logger.success(f"{self.log_prefix}: Cluster destroyed")
+        await run_blocking(executor=executor, func=self.delete_cluster_s3_buckets)
+
 
 class AwsIpiCluster(IpiCluster):
     def __init__(self, ocp_cluster, user_input):
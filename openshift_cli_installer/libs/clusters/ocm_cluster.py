@@ -1,14 +1,27 @@
 from datetime import datetime, timedelta
+import functools
 import re
 from typing import Dict, List
 import sys
-import rosa.cli
 from ocm_python_wrapper.cluster import Cluster
 from ocm_python_wrapper.versions import Versions
+from ocp_resources.job import Job
 from simple_logger.logger import get_logger
 
 from openshift_cli_installer.libs.clusters.ocp_cluster import OCPCluster
-from openshift_cli_installer.utils.const import HYPERSHIFT_STR, STAGE_STR
+from openshift_cli_installer.utils.async_utils import run_blocking, wait_for_async
+from openshift_cli_installer.utils.const import (
+    ASYNC_ENGINE_POLL_INTERVAL,
+    CLUSTER_READY_PHASE,
+    HIBERNATE_STR,
+    HYPERSHIFT_STR,
+    POWER_STATE_ACTIONS_OCM_STATES,
+    RESUME_STR,
+    STAGE_STR,
+)
+from openshift_cli_installer.utils.clusters import search_ocm_clusters_by_names
+from openshift_cli_installer.utils.ocm_status_poller import get_ocm_clusters_status_poller
+from openshift_cli_installer.utils.rosa_backends import get_rosa_backend
 from pyhelper_utils.general import tts
 
 
@@ -42,6 +55,198 @@ class OcmCluster(OCPCluster):
             name=self.cluster_info["name"],
         )
 
+    def prepare_create_retry(self):
+        super().prepare_create_retry()
+        # Cluster ID is cached in the cluster object, a new cluster will get a new ID
+        self.cluster_object = Cluster(
+            client=self.ocm_client,
+            name=self.cluster_info["name"],
+        )
+
+    def collect_failed_create_data(self, ex=None):
+        # Failed cluster is rolled back, nothing to resume
+        self.journal.clear()
+        if self.create_cancelled.is_set():
+            self.logger.info(f"{self.log_prefix}: Cluster create cancelled, rolling back")
+            return
+
+        self.logger.error(f"{self.log_prefix}: Failed to run cluster create\n{ex}")
+        self.set_cluster_auth()
+        if self.user_input.must_gather_output_dir:
+            self.collect_must_gather()
+
+    def is_pooled_cluster_alive(self, pool_cluster_info, kubeconfig_path):
+        """
+        Check a pooled cluster is not expired and is ready in OCM.
+        """
+        pool_cluster_name = pool_cluster_info["name"]
+        expiration_time = pool_cluster_info.get("expiration-time")
+        if expiration_time and datetime.fromisoformat(expiration_time.rstrip("Z")) <= datetime.now():
+            self.logger.warning(f"{self.log_prefix}: Pool cluster {pool_cluster_name} expired at {expiration_time}")
+            return False
+
+        ocm_clusters = search_ocm_clusters_by_names(ocm_client=self.ocm_client, names=[pool_cluster_name])
+        if not ocm_clusters or str(ocm_clusters[0].state) != "ready":
+            self.logger.warning(
+                f"{self.log_prefix}: Pool cluster {pool_cluster_name} is not ready in OCM "
+                f"(state: {ocm_clusters[0].state if ocm_clusters else 'not found'})"
+            )
+            return False
+
+        return True
+
+    @property
+    def clusters_status_poller(self):
+        return get_ocm_clusters_status_poller(ocm_client=self.ocm_client, ocm_env=self.cluster_info["ocm-env"])
+
+    def is_ocm_cluster_in_state(self, ocm_cluster, state):
+        if not ocm_cluster:
+            return False
+
+        cluster_state = str(ocm_cluster.state)
+        if cluster_state == "error":
+            raise ValueError(f"{self.log_prefix}: Cluster is in {cluster_state} state")
+
+        return cluster_state == state
+
+    def is_ocm_cluster_ready(self, ocm_cluster):
+        # Checked on every poll, stops waiting for a cancelled cluster
+        self.raise_if_create_cancelled()
+        return self.is_ocm_cluster_in_state(ocm_cluster=ocm_cluster, state="ready")
+
+    @staticmethod
+    def is_ocm_cluster_deleted(ocm_cluster):
+        return ocm_cluster is None
+
+    @staticmethod
+    def is_job_completed(job):
+        if not job.exists:
+            return False
+
+        return any(
+            condition.type == job.Condition.COMPLETE and condition.status == job.Condition.Status.TRUE
+            for condition in job.instance.status.conditions or []
+        )
+
+    def wait_for_cluster_ready(self):
+        """
+        Wait for the cluster to be ready using the OCM environment collective status poller.
+        """
+        if self.journal.is_completed(CLUSTER_READY_PHASE):
+            self.logger.info(f"{self.log_prefix}: Cluster already ready according to lifecycle journal")
+            return
+
+        self.logger.info(f"{self.log_prefix}: Wait for cluster to be ready")
+        ocm_cluster = self.clusters_status_poller.wait_for_cluster(
+            name=self.cluster_info["name"],
+            func=self.is_ocm_cluster_ready,
+            wait_timeout=self.timeout_watch.remaining_time(),
+        )
+        self.cluster_object.cluster_id = ocm_cluster.id
+
+        if self.cluster_info["platform"] != HYPERSHIFT_STR:
+            self.cluster_object.wait_for_osd_cluster_ready_job(wait_timeout=self.timeout_watch.remaining_time())
+
+        self.journal.record(phase=CLUSTER_READY_PHASE)
+
+    async def wait_for_cluster_ready_async(self, executor):
+        """
+        Async version of `wait_for_cluster_ready`; waits do not hold an executor thread.
+        """
+        if self.journal.is_completed(CLUSTER_READY_PHASE):
+            self.logger.info(f"{self.log_prefix}: Cluster already ready according to lifecycle journal")
+            return
+
+        self.logger.info(f"{self.log_prefix}: Wait for cluster to be ready")
+        ocm_cluster = await self.clusters_status_poller.wait_for_cluster_async(
+            name=self.cluster_info["name"],
+            func=self.is_ocm_cluster_ready,
+            wait_timeout=self.timeout_watch.remaining_time(),
+        )
+        self.cluster_object.cluster_id = ocm_cluster.id
+
+        if self.cluster_info["platform"] != HYPERSHIFT_STR:
+            ocp_client = await run_blocking(executor=executor, func=lambda: self.cluster_object.ocp_client)
+            await wait_for_async(
+                func=self.is_job_completed,
+                wait_timeout=self.timeout_watch.remaining_time(),
+                sleep=ASYNC_ENGINE_POLL_INTERVAL,
+                executor=executor,
+                job=Job(client=ocp_client, name="osd-cluster-ready", namespace="openshift-monitoring"),
+            )
+
+        self.journal.record(phase=CLUSTER_READY_PHASE)
+
+    def wait_for_cluster_deletion(self):
+        self.logger.info(f"{self.log_prefix}: Wait for cluster to be deleted")
+        self.clusters_status_poller.wait_for_cluster(
+            name=self.cluster_info["name"],
+            func=self.is_ocm_cluster_deleted,
+            wait_timeout=self.timeout_watch.remaining_time(),
+        )
+
+    async def wait_for_cluster_deletion_async(self, executor):
+        self.logger.info(f"{self.log_prefix}: Wait for cluster to be deleted")
+        await self.clusters_status_poller.wait_for_cluster_async(
+            name=self.cluster_info["name"],
+            func=self.is_ocm_cluster_deleted,
+            wait_timeout=self.timeout_watch.remaining_time(),
+        )
+
+    def request_cluster_power_state(self, action):
+        """
+        Request OCM to hibernate or resume the cluster, nothing is requested if the cluster is already in the
+        action target state.
+
+        Args:
+            action (str): hibernate or resume.
+        """
+        target_state = POWER_STATE_ACTIONS_OCM_STATES[action]
+        if str(self.cluster_object.instance.state) == target_state:
+            self.logger.info(f"{self.log_prefix}: Cluster is already {target_state}")
+            return
+
+        self.logger.info(f"{self.log_prefix}: Request cluster {action}")
+        getattr(self.ocm_client, f"api_clusters_mgmt_v1_clusters_cluster_id_{action}_post")(
+            cluster_id=self.cluster_object.cluster_id
+        )
+
+    def change_cluster_power_state(self, action):
+        self.timeout_watch = self.start_time_watcher()
+        self.request_cluster_power_state(action=action)
+        target_state = POWER_STATE_ACTIONS_OCM_STATES[action]
+        self.logger.info(f"{self.log_prefix}: Wait for cluster to be {target_state}")
+        self.clusters_status_poller.wait_for_cluster(
+            name=self.cluster_info["name"],
+            func=functools.partial(self.is_ocm_cluster_in_state, state=target_state),
+            wait_timeout=self.timeout_watch.remaining_time(),
+        )
+        self.logger.success(f"{self.log_prefix}: Cluster {action} completed successfully")
+
+    async def change_cluster_power_state_async(self, action, executor):
+        self.timeout_watch = self.start_time_watcher()
+        await run_blocking(executor=executor, func=self.request_cluster_power_state, action=action)
+        target_state = POWER_STATE_ACTIONS_OCM_STATES[action]
+        self.logger.info(f"{self.log_prefix}: Wait for cluster to be {target_state}")
+        await self.clusters_status_poller.wait_for_cluster_async(
+            name=self.cluster_info["name"],
+            func=functools.partial(self.is_ocm_cluster_in_state, state=target_state),
+            wait_timeout=self.timeout_watch.remaining_time(),
+        )
+        self.logger.success(f"{self.log_prefix}: Cluster {action} completed successfully")
+
+    def hibernate_cluster(self):
+        self.change_cluster_power_state(action=HIBERNATE_STR)
+
+    def resume_cluster(self):
+        self.change_cluster_power_state(action=RESUME_STR)
+
+    async def hibernate_cluster_async(self, executor):
+        await self.change_cluster_power_state_async(action=HIBERNATE_STR, executor=executor)
+
+    async def resume_cluster_async(self, executor):
+        await self.change_cluster_power_state_async(action=RESUME_STR, executor=executor)
+
     def _set_expiration_time(self):
         expiration_time = self.cluster.get("expiration-time")
         if expiration_time:
@@ -53,9 +258,14 @@ class OcmCluster(OCPCluster):
     @cache
     def get_osd_versions(self):
         updated_versions_dict: Dict[str, Dict[str, List[str]]] = {}
-        for channel, versions in (
-            Versions(client=self.ocm_client).get(channel_group=self.cluster_info["channel-group"]).items()
-        ):
+        channel_group = self.cluster_info["channel-group"]
+        osd_versions = self.user_input.query_cache.get_or_fetch(
+            "osd versions",
+            func=lambda: Versions(client=self.ocm_client).get(channel_group=channel_group),
+            ocm_env=self.cluster_info["ocm-env"],
+            flags={"channel_group": channel_group},
+        )
+        for channel, versions in osd_versions.items():
             updated_versions_dict[channel] = {}
             for version in versions:
                 _version_key = re.findall(r"^\d+.\d+", version)[0]
@@ -63,18 +273,22 @@ class OcmCluster(OCPCluster):
 
         self.osd_base_available_versions_dict.update(updated_versions_dict)
 
+    @property
+    def rosa_backend(self):
+        return get_rosa_backend(
+            backend_name=self.user_input.rosa_backend,
+            ocm_client=self.ocm_client,
+            aws_region=self.cluster_info["region"],
+            ocm_env=self.cluster_info["ocm-env"],
+            query_cache=self.user_input.query_cache,
+        )
+
     @cache
     def get_rosa_versions(self):
         _cannel_group = self.cluster_info["channel-group"]
-        base_available_versions = rosa.cli.execute(
-            command=(
-                f"list versions --channel-group={_cannel_group} "
-                f"{'--hosted-cp' if self.cluster_info['platform'] == HYPERSHIFT_STR else ''}"
-            ),
-            aws_region=self.cluster_info["region"],
-            ocm_client=self.ocm_client,
-        )["out"]
-        _all_versions = [ver["raw_id"] for ver in base_available_versions]
+        _all_versions = self.rosa_backend.list_versions(
+            channel_group=_cannel_group, hosted_cp=self.cluster_info["platform"] == HYPERSHIFT_STR
+        )
         self.rosa_base_available_versions_dict[_cannel_group] = {}
         for version in _all_versions:
             _version_key = re.findall(r"^\d+.\d+", version)[0]
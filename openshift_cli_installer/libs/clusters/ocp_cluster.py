@@ -3,15 +3,18 @@ import copy
 import os
 import shlex
 import shutil
+import tempfile
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import asynccontextmanager, contextmanager
 from datetime import timedelta
 from pathlib import Path
 
 import click
 import shortuuid
 import yaml
+from botocore.exceptions import BotoCoreError, ClientError
 from clouds.aws.session_clients import s3_client
-from ocm_python_wrapper.ocm_client import OCMPythonClient
 from ocp_resources.cluster_version import ClusterVersion
 from ocp_resources.managed_cluster import ManagedCluster
 from ocp_resources.multi_cluster_hub import MultiClusterHub
@@ -26,26 +29,43 @@ from ocp_utilities.utils import run_command
 from simple_logger.logger import get_logger
 from clouds.aws.aws_utils import aws_region_names, get_least_crowded_aws_vpc_region
 
+from openshift_cli_installer.utils.async_utils import run_blocking
 from openshift_cli_installer.utils.cluster_versions import (
     get_cluster_stream,
 )
 from openshift_cli_installer.utils.const import (
     AWS_OSD_STR,
     AWS_STR,
+    BACKED_UP_PHASE,
     CLUSTER_DATA_YAML_FILENAME,
+    CLUSTER_POOL_SPEC_HASH_KEY,
+    EXPECTED_CREATE_DURATIONS,
+    LOW_PRIORITY_STR,
     PRODUCTION_STR,
     S3_STR,
     STAGE_STR,
     TIMEOUT_60MIN,
+    VERSION_RESOLVED_PHASE,
 )
+from openshift_cli_installer.utils.cluster_pool import cluster_pool_spec_hash, release_cluster_pool_claim
+from openshift_cli_installer.utils.clusters import get_ocm_client
+from openshift_cli_installer.utils.general import zip_and_upload_to_s3
+from openshift_cli_installer.utils.lifecycle_journal import LifecycleJournal
+from openshift_cli_installer.utils.resource_waits import condition_is, status_phase_is, wait_for_resource
 from pyhelper_utils.general import tts
 
 
+class ClusterCreateCancelledError(Exception):
+    pass
+
+
 class OCPCluster:
     def __init__(self, ocp_cluster, user_input):
         self.user_input = user_input
         self.logger = get_logger(f"{self.__class__.__module__}-{self.__class__.__name__}")
         self.cluster = ocp_cluster
+        self.pool_spec_hash = cluster_pool_spec_hash(cluster=self.cluster)
+        self.cluster.pop(CLUSTER_POOL_SPEC_HASH_KEY, None)
 
         self.s3_bucket_name = self.user_input.s3_bucket_name or self.cluster.get("cluster_info", {}).get(
             "s3_bucket_name"
@@ -54,6 +74,7 @@ class OCPCluster:
             "s3_bucket_path"
         )
 
+        self.journal = None
         if self.user_input.destroy_from_s3_bucket_or_local_directory:
             self.cluster_info = self.cluster["cluster_info"]
         else:
@@ -95,10 +116,15 @@ class OCPCluster:
             self.cluster_info["auth-path"] = auth_path = os.path.join(cluster_dir, "auth")
             self.cluster_info["kubeconfig-path"] = os.path.join(auth_path, "kubeconfig")
             Path(auth_path).mkdir(parents=True, exist_ok=True)
+            self._init_lifecycle_journal()
             self._add_s3_bucket_data()
 
         self.log_prefix = f"[C:{self.cluster_info['name']}|P:{self.cluster_info['platform']}|R:{self.cluster_info.get('region', 'auto-region')}]"
         self.timeout = tts(ts=self.cluster.get("timeout", TIMEOUT_60MIN))
+        self.expected_create_duration = tts(
+            ts=self.cluster.get("expected-duration", EXPECTED_CREATE_DURATIONS[self.cluster_info["platform"]])
+        )
+        self.low_priority = self.cluster.get("priority") == LOW_PRIORITY_STR
 
         if not self.user_input.destroy_from_s3_bucket_or_local_directory:
             self.dump_cluster_data_to_file()
@@ -109,6 +135,8 @@ class OCPCluster:
         self.timeout_watch = None
         self.cluster_object = None
         self.ocp_client = None
+        # Set when enough clusters of the same spec are ready, see `--speculative-clusters`
+        self.create_cancelled = threading.Event()
 
     @property
     def to_dict(self):
@@ -125,6 +153,177 @@ class OCPCluster:
         self.logger.info(f"{self.log_prefix}: Start timeout watcher, time left: {timedelta(seconds=self.timeout)}")
         return TimeoutWatch(timeout=self.timeout)
 
+    @property
+    def host_resources_admission_timeout(self):
+        return self.timeout_watch.remaining_time() if self.timeout_watch else self.timeout
+
+    @contextmanager
+    def host_resources_admission(self, process_name):
+        """
+        Wait for host resources (when `--admission-control` is set) before starting a heavy child process.
+        """
+        if not (admission := self.user_input.host_resources_admission):
+            yield
+            return
+
+        with admission.admit(
+            name=f"{self.log_prefix}: {process_name}", wait_timeout=self.host_resources_admission_timeout
+        ):
+            yield
+
+    @asynccontextmanager
+    async def host_resources_admission_async(self, process_name):
+        if not (admission := self.user_input.host_resources_admission):
+            yield
+            return
+
+        async with admission.admit_async(
+            name=f"{self.log_prefix}: {process_name}", wait_timeout=self.host_resources_admission_timeout
+        ):
+            yield
+
+    def limit_command_resources(self, command):
+        if admission := self.user_input.host_resources_admission:
+            return admission.limit_command(command=command)
+
+        return command
+
+    async def create_cluster_async(self, executor):
+        """
+        Create the cluster from the async engine.
+
+        Clusters with long waits should override it to await the waits instead of holding an executor thread.
+        """
+        await run_blocking(executor=executor, func=self.create_cluster)
+
+    async def destroy_cluster_async(self, executor):
+        await run_blocking(executor=executor, func=self.destroy_cluster)
+
+    def cancel_create(self):
+        self.logger.info(f"{self.log_prefix}: Cancelling cluster create, enough clusters of the same spec are ready")
+        self.create_cancelled.set()
+
+    def raise_if_create_cancelled(self):
+        if self.create_cancelled.is_set():
+            raise ClusterCreateCancelledError(f"{self.log_prefix}: Cluster create cancelled")
+
+    def collect_failed_create_data(self, ex=None):
+        # Failed cluster is rolled back, nothing to resume
+        self.journal.clear()
+        if self.create_cancelled.is_set():
+            self.logger.info(f"{self.log_prefix}: Cluster create cancelled, rolling back")
+            return
+
+        self.logger.error(f"{self.log_prefix}: Failed to create cluster: {ex or 'No exception'}")
+        if self.user_input.must_gather_output_dir:
+            self.collect_must_gather()
+
+    def upload_cluster_data_to_s3(self):
+        if self.s3_bucket_name:
+            zip_and_upload_to_s3(
+                install_dir=self.cluster_info["cluster-dir"],
+                s3_bucket_name=self.s3_bucket_name,
+                s3_bucket_object_name=self.cluster_info["s3-object-name"],
+            )
+            self.journal.record(phase=BACKED_UP_PHASE)
+
+    def prepare_create_retry(self):
+        """
+        Reset cluster state left from a failed create so `create_cluster` can run again.
+        """
+        self.logger.info(f"{self.log_prefix}: Prepare cluster for create retry")
+        self.timeout_watch = None
+
+    def claim_pooled_cluster(self, cluster_pool_store):
+        """
+        Take over a ready cluster of the same spec from the clusters pool instead of creating one.
+
+        The pooled cluster data (`cluster_data.yaml`, auth) is written to this cluster directory, the cluster keeps
+        its pool name.
+        Pooled clusters which are no longer alive (expired, deleted, API not reachable) are parked in the pool dead
+        clusters, `--action cluster-pool-refill` destroys them.
+
+        Returns:
+            bool: True if a cluster was claimed.
+        """
+        cluster_dir = self.cluster_info["cluster-dir"]
+        while True:
+            pool_cluster_dir = tempfile.mkdtemp(prefix="cluster-pool-claim-")
+            try:
+                pool_cluster_name = cluster_pool_store.claim(
+                    spec_hash=self.pool_spec_hash, cluster_dir=pool_cluster_dir
+                )
+            except (BotoCoreError, ClientError, OSError) as ex:
+                self.logger.warning(f"{self.log_prefix}: Failed to claim a cluster from the pool: {ex}")
+                shutil.rmtree(pool_cluster_dir, ignore_errors=True)
+                return False
+
+            if not pool_cluster_name:
+                self.logger.info(f"{self.log_prefix}: No ready cluster in the pool (spec {self.pool_spec_hash})")
+                shutil.rmtree(pool_cluster_dir, ignore_errors=True)
+                return False
+
+            with open(os.path.join(pool_cluster_dir, CLUSTER_DATA_YAML_FILENAME)) as fd:
+                cluster_data = yaml.safe_load(fd)
+
+            if self.is_pooled_cluster_alive(
+                pool_cluster_info=cluster_data["cluster_info"],
+                kubeconfig_path=os.path.join(pool_cluster_dir, "auth", "kubeconfig"),
+            ):
+                break
+
+            self.logger.warning(
+                f"{self.log_prefix}: Pool cluster {pool_cluster_name} (spec {self.pool_spec_hash}) is not alive, "
+                "parking it to be destroyed by the pool refill"
+            )
+            try:
+                cluster_pool_store.park_dead(
+                    spec_hash=self.pool_spec_hash, cluster_name=pool_cluster_name, cluster_dir=pool_cluster_dir
+                )
+            except (BotoCoreError, ClientError, OSError) as ex:
+                self.logger.error(f"{self.log_prefix}: Failed to park dead pool cluster {pool_cluster_name}: {ex}")
+                shutil.rmtree(pool_cluster_dir, ignore_errors=True)
+
+        shutil.copytree(pool_cluster_dir, cluster_dir, dirs_exist_ok=True)
+        shutil.rmtree(pool_cluster_dir, ignore_errors=True)
+        auth_path = os.path.join(cluster_dir, "auth")
+        cluster_data["cluster_info"].update({
+            "cluster-dir": cluster_dir,
+            "auth-path": auth_path,
+            "kubeconfig-path": os.path.join(auth_path, "kubeconfig"),
+        })
+        self.cluster_info = cluster_data["cluster_info"]
+        if claim_info := cluster_pool_store.claim_info(spec_hash=self.pool_spec_hash):
+            # Released once the cluster is destroyed
+            self.cluster_info["cluster-pool-claim"] = claim_info
+
+        self._add_s3_bucket_data()
+        with open(os.path.join(cluster_dir, CLUSTER_DATA_YAML_FILENAME), "w") as fd:
+            fd.write(yaml.dump(cluster_data))
+
+        self.journal = LifecycleJournal(cluster_dir=cluster_dir)
+        self.logger.success(f"{self.log_prefix}: Claimed cluster {pool_cluster_name} from the pool")
+        return True
+
+    def is_pooled_cluster_alive(self, pool_cluster_info, kubeconfig_path):
+        """
+        Check a pooled cluster API answers with its kubeconfig.
+
+        Args:
+            pool_cluster_info (dict): Pooled cluster info.
+            kubeconfig_path (str): Pooled cluster kubeconfig path.
+
+        Returns:
+            bool: True if the cluster is alive.
+        """
+        try:
+            return bool(ClusterVersion(client=get_client(config_file=kubeconfig_path), name="version").exists)
+        except Exception as ex:
+            self.logger.warning(
+                f"{self.log_prefix}: Pool cluster {pool_cluster_info['name']} API is not reachable: {ex}"
+            )
+            return False
+
     def prepare_cluster_data(self):
         supported_envs = (PRODUCTION_STR, STAGE_STR)
         if self.cluster_info["ocm-env"] not in supported_envs:
@@ -137,12 +336,43 @@ class OCPCluster:
         self.ocm_client = self.get_ocm_client()
 
     def get_ocm_client(self):
-        return OCMPythonClient(
-            token=self.user_input.ocm_token,
-            endpoint="https://sso.redhat.com/auth/realms/redhat-external/protocol/openid-connect/token",
-            api_host=self.cluster_info["ocm-env"],
-            discard_unknown_keys=True,
-        ).client
+        return get_ocm_client(
+            ocm_token=self.user_input.ocm_token,
+            ocm_env=self.cluster_info["ocm-env"],
+            token_cache=self.user_input.ocm_token_cache,
+        )
+
+    def _init_lifecycle_journal(self):
+        self.journal = LifecycleJournal(cluster_dir=self.cluster_info["cluster-dir"])
+        if not self.user_input.create:
+            return
+
+        if self.user_input.resume and self.journal.completed_phases:
+            self.logger.info(
+                f"Resuming cluster {self.cluster_info['name']} after phases: {self.journal.completed_phases}"
+            )
+            self.cluster_info["shortuuid"] = self.journal.data.get("shortuuid", self.cluster_info["shortuuid"])
+        else:
+            self.journal.clear()
+
+    def resolve_cluster_version(self, resolve_func):
+        """
+        Resolve the cluster version to install or take it from the lifecycle journal when resuming.
+
+        Args:
+            resolve_func (callable): Function which returns the cluster version to install.
+
+        Returns:
+            str: Cluster version to install.
+        """
+        if self.journal.is_completed(VERSION_RESOLVED_PHASE):
+            version = self.journal.data["version"]
+            self.logger.info(f"{self.log_prefix}: Using cluster version {version} from lifecycle journal")
+            return version
+
+        version = resolve_func()
+        self.journal.record(phase=VERSION_RESOLVED_PHASE, version=version, shortuuid=self.cluster_info["shortuuid"])
+        return version
 
     def _add_s3_bucket_data(self):
         object_name = (
@@ -181,11 +411,16 @@ class OCPCluster:
             "osd_base_available_versions_dict",
             "rosa_base_available_versions_dict",
             "timeout",
+            "expected_create_duration",
+            "low_priority",
             "terraform",
             "timeout_watch",
             "ipi_base_available_versions",
             "_already_processed",
             "user_input",
+            "journal",
+            "hypershift_idp",
+            "create_cancelled",
         )
         for _key, _val in self.to_dict.items():
             if _key in keys_to_pop or not _val:
@@ -214,7 +449,7 @@ class OCPCluster:
         try:
             kubeconfig_path = self.cluster_info["kubeconfig-path"]
             if not os.path.exists(kubeconfig_path):
-                self.logger.error(f"{self.log_prefix}: kubeconfig does not exist; cannot run" " must-gather.")
+                self.logger.error(f"{self.log_prefix}: kubeconfig does not exist; cannot run must-gather.")
                 return
 
             self.logger.info(f"{self.log_prefix}: Prepare must-gather target extracted directory {target_dir}.")
@@ -287,6 +522,13 @@ class OCPCluster:
             s3_client().delete_object(Bucket=self.s3_bucket_name, Key=s3_file)
             self.logger.success(f"{self.log_prefix}: {s3_file} deleted ")
 
+        if claim_info := self.cluster_info.get("cluster-pool-claim"):
+            self.logger.info(f"{self.log_prefix}: Releasing clusters pool claim")
+            try:
+                release_cluster_pool_claim(claim_info=claim_info, cluster_name=self.cluster_info["name"])
+            except (BotoCoreError, ClientError) as ex:
+                self.logger.warning(f"{self.log_prefix}: Failed to release clusters pool claim: {ex}")
+
     def install_acm(self):
         self.logger.info(f"{self.log_prefix}: Installing ACM")
         run_command(
@@ -297,9 +539,12 @@ class OCPCluster:
             name="multiclusterhub",
             namespace="open-cluster-management",
         )
-        cluster_hub.wait_for_status(
-            status=cluster_hub.Status.RUNNING,
+        wait_for_resource(
+            resource=cluster_hub,
+            predicate=status_phase_is(status=cluster_hub.Status.RUNNING),
+            stop_predicate=status_phase_is(status=cluster_hub.Status.FAILED),
             timeout=self.timeout_watch.remaining_time(),
+            description=f"status to be {cluster_hub.Status.RUNNING}",
         )
 
         self.logger.success(f"{self.log_prefix}: ACM installed successfully")
@@ -362,10 +607,14 @@ class OCPCluster:
                 metric_object_storage=multi_cluster_observability_data,
             )
             multi_cluster_observability.deploy(wait=True)
-            multi_cluster_observability.wait_for_condition(
-                condition=multi_cluster_observability.Condition.READY,
-                status=multi_cluster_observability.Condition.Status.TRUE,
+            wait_for_resource(
+                resource=multi_cluster_observability,
+                predicate=condition_is(
+                    condition=multi_cluster_observability.Condition.READY,
+                    status=multi_cluster_observability.Condition.Status.TRUE,
+                ),
                 timeout=self.timeout_watch.remaining_time(),
+                description=f"{multi_cluster_observability.Condition.READY} condition",
             )
             self.logger.success(f"{self.log_prefix}: Observability enabled")
         except Exception as ex:
@@ -433,10 +682,13 @@ class OCPCluster:
         )
 
         managed_cluster = ManagedCluster(client=self.ocp_client, name=managed_acm_cluster_name)
-        managed_cluster.wait_for_condition(
-            condition="ManagedClusterImportSucceeded",
-            status=managed_cluster.Condition.Status.TRUE,
+        wait_for_resource(
+            resource=managed_cluster,
+            predicate=condition_is(
+                condition="ManagedClusterImportSucceeded", status=managed_cluster.Condition.Status.TRUE
+            ),
             timeout=self.timeout_watch.remaining_time(),
+            description="ManagedClusterImportSucceeded condition",
         )
         self.logger.success(
             f"{self.log_prefix}: attached {managed_acm_cluster_name} to cluster {self.cluster_info['name']}"
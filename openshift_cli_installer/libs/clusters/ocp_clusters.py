@@ -1,24 +1,39 @@
+import copy
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import click
-import rosa.cli
-from clouds.aws.aws_utils import set_and_verify_aws_credentials
 from clouds.gcp.utils import get_gcp_regions
 from simple_logger.logger import get_logger
 
 from openshift_cli_installer.libs.clusters.ipi_cluster import AwsIpiCluster, GcpIpiCluster
 from openshift_cli_installer.libs.clusters.osd_cluster import OsdCluster
 from openshift_cli_installer.libs.clusters.rosa_cluster import RosaCluster
+from openshift_cli_installer.utils.async_utils import run_clusters_action_async
+from openshift_cli_installer.utils.cluster_pool import cluster_pool_spec_hash
+from openshift_cli_installer.utils.clusters import get_existing_ocm_clusters_names
+from openshift_cli_installer.utils.scheduling import schedule_longest_job_first
 from openshift_cli_installer.utils.const import (
+    ACTIONS_SUCCESS_STATUSES,
     AWS_OSD_STR,
     AWS_STR,
+    CLUSTER_REQUESTED_PHASE,
+    CREATE_STR,
+    CREATED_STR,
+    DESTROY_STR,
+    FAILED_STR,
     GCP_OSD_STR,
     HYPERSHIFT_STR,
+    KEEP_SUCCESSFUL_STR,
+    POWER_STATE_ACTIONS,
     PRODUCTION_STR,
     ROSA_STR,
+    SKIPPED_STR,
     STAGE_STR,
     GCP_STR,
 )
+from openshift_cli_installer.utils.rate_limiter import configure_ocm_rate_limiter, get_ocm_rate_limiter
+from openshift_cli_installer.utils.rosa_backends import get_rosa_backend
+from openshift_cli_installer.utils.aws_credentials import verify_aws_credentials_regions
 
 
 class OCPClusters:
@@ -33,6 +48,18 @@ class OCPClusters:
         self.gcp_osd_clusters = []
 
         self.s3_target_dirs = []
+        self.clusters_status = {}
+        # Clusters taken from the clusters pool instead of created
+        self.claimed_clusters = []
+        # Spec hash as key, clusters created for the spec and how many are needed as value
+        self.speculative_groups = {}
+        # Clusters user input by spec hash, before cluster objects update it
+        self.clusters_specs = (
+            {cluster_pool_spec_hash(cluster=_cluster): copy.deepcopy(_cluster) for _cluster in user_input.clusters}
+            if self.user_input.create and self.user_input.speculative_clusters
+            else {}
+        )
+        configure_ocm_rate_limiter(rate=self.user_input.ocm_rate_limit)
 
         for _cluster in user_input.clusters:
             self.add_to_cluster_lists(ocp_cluster=_cluster)
@@ -45,23 +72,32 @@ class OCPClusters:
 
     def add_to_cluster_lists(self, ocp_cluster):
         _cluster_platform = ocp_cluster["platform"]
+        cluster = None
         if _cluster_platform == AWS_STR:
-            self.aws_ipi_clusters.append(AwsIpiCluster(ocp_cluster=ocp_cluster, user_input=self.user_input))
+            cluster = AwsIpiCluster(ocp_cluster=ocp_cluster, user_input=self.user_input)
+            self.aws_ipi_clusters.append(cluster)
 
         if _cluster_platform == GCP_STR:
-            self.gcp_ipi_clusters.append(GcpIpiCluster(ocp_cluster=ocp_cluster, user_input=self.user_input))
+            cluster = GcpIpiCluster(ocp_cluster=ocp_cluster, user_input=self.user_input)
+            self.gcp_ipi_clusters.append(cluster)
 
         if _cluster_platform == AWS_OSD_STR:
-            self.aws_osd_clusters.append(OsdCluster(ocp_cluster=ocp_cluster, user_input=self.user_input))
+            cluster = OsdCluster(ocp_cluster=ocp_cluster, user_input=self.user_input)
+            self.aws_osd_clusters.append(cluster)
 
         if _cluster_platform == ROSA_STR:
-            self.rosa_clusters.append(RosaCluster(ocp_cluster=ocp_cluster, user_input=self.user_input))
+            cluster = RosaCluster(ocp_cluster=ocp_cluster, user_input=self.user_input)
+            self.rosa_clusters.append(cluster)
 
         if _cluster_platform == HYPERSHIFT_STR:
-            self.hypershift_clusters.append(RosaCluster(ocp_cluster=ocp_cluster, user_input=self.user_input))
+            cluster = RosaCluster(ocp_cluster=ocp_cluster, user_input=self.user_input)
+            self.hypershift_clusters.append(cluster)
 
         if _cluster_platform == GCP_OSD_STR:
-            self.gcp_osd_clusters.append(OsdCluster(ocp_cluster=ocp_cluster, user_input=self.user_input))
+            cluster = OsdCluster(ocp_cluster=ocp_cluster, user_input=self.user_input)
+            self.gcp_osd_clusters.append(cluster)
+
+        return cluster
 
     @property
     def list_clusters(self):
@@ -74,6 +110,17 @@ class OCPClusters:
             + self.gcp_ipi_clusters
         )
 
+    @property
+    def clusters_lists(self):
+        return (
+            self.aws_ipi_clusters,
+            self.gcp_ipi_clusters,
+            self.aws_osd_clusters,
+            self.rosa_clusters,
+            self.hypershift_clusters,
+            self.gcp_osd_clusters,
+        )
+
     @property
     def aws_managed_clusters(self):
         return self.rosa_clusters + self.hypershift_clusters + self.aws_osd_clusters
@@ -85,10 +132,22 @@ class OCPClusters:
     def check_ocm_managed_existing_clusters(self):
         if self.ocm_managed_clusters:
             self.logger.info("Check for existing OCM-managed clusters.")
-            existing_clusters_list = []
+            clusters_by_ocm_env = {}
             for _cluster in self.ocm_managed_clusters:
-                if _cluster.cluster_object.exists:
-                    existing_clusters_list.append(_cluster.cluster_info["name"])
+                if _cluster.journal.is_completed(CLUSTER_REQUESTED_PHASE):
+                    self.logger.info(f"Cluster {_cluster.cluster_info['name']} already requested, resuming create")
+                    continue
+
+                clusters_by_ocm_env.setdefault(_cluster.cluster_info["ocm-env"], []).append(_cluster)
+
+            existing_clusters_list = []
+            for _clusters in clusters_by_ocm_env.values():
+                existing_clusters_list.extend(
+                    get_existing_ocm_clusters_names(
+                        ocm_client=_clusters[0].ocm_client,
+                        names=[_cluster.cluster_info["name"] for _cluster in _clusters],
+                    )
+                )
 
             if existing_clusters_list:
                 self.logger.error(
@@ -96,14 +155,14 @@ class OCPClusters:
                 )
                 raise click.Abort()
 
-    @staticmethod
-    def _hypershift_regions(ocm_client):
-        rosa_regions = rosa.cli.execute(
-            command="list regions",
-            aws_region="us-west-2",
+    def _hypershift_regions(self, ocm_client, ocm_env):
+        return get_rosa_backend(
+            backend_name=self.user_input.rosa_backend,
             ocm_client=ocm_client,
-        )["out"]
-        return [region["id"] for region in rosa_regions if region["supports_hypershift"] is True]
+            aws_region="us-west-2",
+            ocm_env=ocm_env,
+            query_cache=self.user_input.query_cache,
+        ).list_hypershift_regions()
 
     def is_region_support_hypershift(self):
         if self.hypershift_clusters:
@@ -115,7 +174,7 @@ class OCPClusters:
                 ocm_env = _cluster.cluster_info["ocm-env"]
                 _hypershift_regions = hypershift_regions_dict[ocm_env]
                 if not _hypershift_regions:
-                    _hypershift_regions = self._hypershift_regions(ocm_client=_cluster.ocm_client)
+                    _hypershift_regions = self._hypershift_regions(ocm_client=_cluster.ocm_client, ocm_env=ocm_env)
                     hypershift_regions_dict[ocm_env] = _hypershift_regions
 
                 if region not in _hypershift_regions:
@@ -137,8 +196,7 @@ class OCPClusters:
             for _cluster in self.aws_ipi_clusters + self.aws_managed_clusters:
                 _regions_to_verify.add(_cluster.cluster_info["region"])
 
-            for _region in _regions_to_verify:
-                set_and_verify_aws_credentials(region_name=_region)
+            verify_aws_credentials_regions(regions=_regions_to_verify, bypass_cache=self.user_input.bypass_query_cache)
 
     def is_region_support_gcp(self):
         if _clusters := self.gcp_ipi_clusters + self.gcp_osd_clusters:
@@ -155,39 +213,402 @@ class OCPClusters:
                 raise click.Abort()
 
     def run_create_or_destroy_clusters(self):
-        futures = []
-        action_str = "create_cluster" if self.user_input.create else "destroy_cluster"
+        """
+        Create, destroy, hibernate or resume all clusters according to user input.
+
+        When clusters fail to create, they are retried `--create-retries` times; if they still fail,
+        `--create-failure-policy` decides whether the successfully created clusters are destroyed or kept.
+
+        Returns:
+            dict: cluster name as key and cluster status (created, destroyed, hibernated, resumed, failed or skipped)
+                as value.
+        """
+        if self.user_input.action == CREATE_STR and self.user_input.cluster_pool:
+            self.claim_pooled_clusters()
+            if not self.list_clusters:
+                self.log_clusters_status()
+                return self.clusters_status
+
+        if self.user_input.create and self.user_input.speculative_clusters:
+            self.add_speculative_clusters()
+
+        clusters = self.schedule_create_clusters() if self.user_input.create else self.list_clusters
+        failed_clusters = self.execute_clusters_action(clusters=clusters)
+        if self.speculative_groups:
+            failed_clusters = self.settle_speculative_clusters(failed_clusters=failed_clusters)
+
+        if self.user_input.create:
+            failed_clusters = self.retry_failed_clusters(failed_clusters=failed_clusters)
+
+        if failed_clusters:
+            if self.user_input.create:
+                self.rollback_clusters_by_create_failure_policy()
+
+            self.log_clusters_status()
+            raise click.Abort()
+
+        self.log_clusters_status()
+        return self.clusters_status
+
+    def claim_pooled_clusters(self):
+        """
+        Claim ready clusters from the clusters pool, claimed clusters are not created.
+
+        ACM hubs and managed clusters are always created, they are referenced by name and configured after create.
+        """
+        acm_managed_clusters_names = {
+            _name for _cluster in self.list_clusters for _name in _cluster.cluster_info.get("acm-clusters") or []
+        }
+        clusters = [
+            _cluster
+            for _cluster in self.list_clusters
+            if not (
+                _cluster.cluster_info.get("acm")
+                or _cluster.cluster_info.get("acm-clusters")
+                or _cluster.cluster_info["name"] in acm_managed_clusters_names
+                or _cluster.journal.completed_phases
+            )
+        ]
+        if not clusters:
+            return
+
+        cluster_pool_store = self.user_input.cluster_pool_store
+        with ThreadPoolExecutor(max_workers=len(clusters)) as executor:
+            futures = {
+                executor.submit(_cluster.claim_pooled_cluster, cluster_pool_store=cluster_pool_store): _cluster
+                for _cluster in clusters
+            }
+
+        for _future, _cluster in futures.items():
+            if _future.result():
+                self.remove_cluster(cluster=_cluster)
+                self.claimed_clusters.append(_cluster)
+                _cluster.upload_cluster_data_to_s3()
+                self.set_cluster_status(cluster=_cluster)
+
+    def add_speculative_clusters(self):
+        """
+        Add `--speculative-clusters` extra clusters for every spec of clusters named by `name-prefix`.
+
+        The first ready clusters of a spec are kept, up to the number of requested clusters; once they are ready,
+        the other clusters of the spec are cancelled (rolled back) or destroyed.
+        ACM hubs and managed clusters are never speculative, they are referenced by name.
+        """
+        acm_managed_clusters_names = {
+            _name for _cluster in self.list_clusters for _name in _cluster.cluster_info.get("acm-clusters") or []
+        }
+        for _cluster in self.list_clusters:
+            if (
+                _cluster.cluster.get("name")
+                or _cluster.cluster_info.get("acm")
+                or _cluster.cluster_info.get("acm-clusters")
+                or _cluster.cluster_info["name"] in acm_managed_clusters_names
+                or _cluster.journal.completed_phases
+            ):
+                continue
+
+            speculative_group = self.speculative_groups.setdefault(
+                _cluster.pool_spec_hash, {"needed": 0, "clusters": [], "ready": []}
+            )
+            speculative_group["needed"] += 1
+            speculative_group["clusters"].append(_cluster)
+
+        if not self.speculative_groups:
+            self.logger.warning("No cluster created with `name-prefix`, no speculative clusters to add")
+            return
+
+        for _spec_hash, _speculative_group in self.speculative_groups.items():
+            for _ in range(self.user_input.speculative_clusters):
+                cluster_spec = copy.deepcopy(self.clusters_specs[_spec_hash])
+                _speculative_group["clusters"].append(self.add_to_cluster_lists(ocp_cluster=cluster_spec))
+
+            self.logger.info(
+                f"Speculative clusters {[_cluster.cluster_info['name'] for _cluster in _speculative_group['clusters']]}"
+                f", keeping the first {_speculative_group['needed']} ready"
+            )
+
+    def speculative_cluster_done(self, cluster, failed):
+        """
+        Cancel the other clusters of the cluster spec once enough clusters of the spec are ready.
+        """
+        if failed or not (speculative_group := self.speculative_groups.get(cluster.pool_spec_hash)):
+            return
+
+        if cluster not in speculative_group["clusters"]:
+            return
+
+        speculative_group["ready"].append(cluster)
+        if len(speculative_group["ready"]) == speculative_group["needed"]:
+            for _cluster in speculative_group["clusters"]:
+                if _cluster not in speculative_group["ready"]:
+                    _cluster.cancel_create()
+
+    def settle_speculative_clusters(self, failed_clusters):
+        """
+        Keep the first ready clusters of every speculative spec, destroy the surplus ready clusters and drop
+        the cancelled or failed clusters which are not needed.
+
+        Returns:
+            list: Clusters objects which failed to create and are still needed.
+        """
+        surplus_clusters = []
+        dropped_clusters = []
+        for _speculative_group in self.speculative_groups.values():
+            ready_clusters = _speculative_group["ready"]
+            surplus_clusters.extend(ready_clusters[_speculative_group["needed"] :])
+            missing = max(_speculative_group["needed"] - len(ready_clusters), 0)
+            group_failed_clusters = [
+                _cluster for _cluster in _speculative_group["clusters"] if _cluster in failed_clusters
+            ]
+            dropped_clusters.extend(group_failed_clusters[missing:])
+
+        self.speculative_groups = {}
+        for _cluster in surplus_clusters + dropped_clusters:
+            self.remove_cluster(cluster=_cluster)
+            self.clusters_status.pop(_cluster.cluster_info["name"], None)
+
+        if surplus_clusters:
+            surplus_clusters_names = [_cluster.cluster_info["name"] for _cluster in surplus_clusters]
+            self.logger.info(f"Destroying surplus speculative clusters {surplus_clusters_names}")
+            with ThreadPoolExecutor(max_workers=len(surplus_clusters)) as executor:
+                futures = {executor.submit(_cluster.destroy_cluster): _cluster for _cluster in surplus_clusters}
+
+            for _future, _cluster in futures.items():
+                if _future.exception():
+                    self.logger.error(f"Failed to destroy surplus speculative cluster {_cluster.cluster_info['name']}")
+
+        return [_cluster for _cluster in failed_clusters if _cluster not in dropped_clusters]
+
+    def run_cluster_action(self, cluster, action_func):
+        # Speculative clusters may be cancelled before their create started
+        if self.user_input.create:
+            cluster.raise_if_create_cancelled()
+
+        return action_func()
+
+    def return_claimed_clusters_to_pool(self):
+        for _cluster in self.claimed_clusters:
+            self.logger.info(f"Returning cluster {_cluster.cluster_info['name']} to the pool")
+            # The cluster data is backed up to S3 once claimed
+            _cluster.delete_cluster_s3_buckets()
+            self.user_input.cluster_pool_store.add(
+                spec_hash=_cluster.pool_spec_hash,
+                cluster_name=_cluster.cluster_info["name"],
+                cluster_dir=_cluster.cluster_info["cluster-dir"],
+            )
+            self.clusters_status.pop(_cluster.cluster_info["name"], None)
+
+        self.claimed_clusters = []
+
+    def add_created_clusters_to_pool(self):
+        """
+        Move the created clusters data to the clusters pool, used by `--action cluster-pool-refill`.
+        """
+        for _cluster in self.list_clusters:
+            if self.clusters_status.get(_cluster.cluster_info["name"]) == CREATED_STR:
+                self.user_input.cluster_pool_store.add(
+                    spec_hash=_cluster.pool_spec_hash,
+                    cluster_name=_cluster.cluster_info["name"],
+                    cluster_dir=_cluster.cluster_info["cluster-dir"],
+                )
+
+    def schedule_create_clusters(self):
+        """
+        Order clusters create by longest expected create duration first.
+
+        The run deadline is the longest cluster timeout; low priority clusters which are not expected to be created
+        before the deadline (with `--max-parallel-clusters` clusters created concurrently) are skipped.
+
+        Returns:
+            list: Clusters objects to create, in start order.
+        """
+        if self.user_input.parallel:
+            slots = self.user_input.max_parallel_clusters or len(self.list_clusters)
+        else:
+            slots = 1
+
+        scheduled_clusters, skipped_clusters = schedule_longest_job_first(
+            jobs=[
+                (_cluster, _cluster.expected_create_duration, _cluster.low_priority) for _cluster in self.list_clusters
+            ],
+            slots=slots,
+            deadline=max(_cluster.timeout for _cluster in self.list_clusters),
+        )
+        for _cluster in skipped_clusters:
+            self.logger.warning(
+                f"Skipping low priority cluster {_cluster.cluster_info['name']}, "
+                "it is not expected to be created before the run deadline"
+            )
+            self.clusters_status[_cluster.cluster_info["name"]] = SKIPPED_STR
+            self.remove_cluster(cluster=_cluster)
+
+        self.logger.info(f"Clusters create order: {[_cluster.cluster_info['name'] for _cluster in scheduled_clusters]}")
+        return scheduled_clusters
+
+    def remove_cluster(self, cluster):
+        for _clusters_list in self.clusters_lists:
+            if cluster in _clusters_list:
+                _clusters_list.remove(cluster)
 
-        with ThreadPoolExecutor() as executor:
-            for cluster in self.list_clusters:
+    @property
+    def clusters_action(self):
+        if self.user_input.action in POWER_STATE_ACTIONS:
+            return self.user_input.action
+
+        # Create failure policy rollback destroys created clusters during a create run
+        return CREATE_STR if self.user_input.create else DESTROY_STR
+
+    def execute_clusters_action(self, clusters):
+        """
+        Run create, destroy, hibernate or resume on the given clusters.
+
+        Args:
+            clusters (list): Clusters objects to run the action on.
+
+        Returns:
+            list: Clusters objects which failed to run the action.
+        """
+        futures = {}
+        failed_clusters = []
+        action_str = f"{self.clusters_action}_cluster"
+
+        if self.user_input.parallel and self.user_input.async_engine:
+            return self.execute_clusters_action_async(clusters=clusters)
+
+        with ThreadPoolExecutor(max_workers=self.user_input.max_parallel_clusters) as executor:
+            for cluster in clusters:
                 action_func = getattr(cluster, action_str)
                 self.logger.info(
-                    f"Executing {self.user_input.action} cluster {cluster.cluster_info['name']} [parallel: {self.user_input.parallel}]"
+                    f"Executing {self.clusters_action} cluster {cluster.cluster_info['name']} [parallel: {self.user_input.parallel}]"
                 )
                 if self.user_input.parallel:
-                    futures.append(executor.submit(action_func))
+                    futures[executor.submit(self.run_cluster_action, cluster=cluster, action_func=action_func)] = (
+                        cluster
+                    )
                 else:
-                    action_func()
+                    try:
+                        action_func()
+                        self.set_cluster_status(cluster=cluster)
+                    except Exception as ex:
+                        self.log_cluster_action_failure(cluster=cluster, exception=ex)
+                        self.set_cluster_status(cluster=cluster, failed=True)
+                        failed_clusters.append(cluster)
+                        if not self.continue_on_failure:
+                            break
 
             if futures:
-                self.process_create_destroy_clusters_threads_results(futures=futures)
+                failed_clusters.extend(self.process_create_destroy_clusters_threads_results(futures=futures))
+
+        return failed_clusters
+
+    def execute_clusters_action_async(self, clusters):
+        self.logger.info(
+            f"Executing {self.clusters_action} clusters {[_cluster.cluster_info['name'] for _cluster in clusters]} "
+            f"[async engine, workers: {self.user_input.async_engine_workers}]"
+        )
+        failed_clusters = []
+        for _cluster, _exception in run_clusters_action_async(
+            clusters=clusters,
+            action=self.clusters_action,
+            max_workers=self.user_input.async_engine_workers,
+            max_parallel_clusters=self.user_input.max_parallel_clusters,
+            before_action=self.before_cluster_action_async,
+            on_done=self.on_cluster_action_done_async,
+        ).items():
+            self.set_cluster_status(cluster=_cluster, failed=_exception is not None)
+            if _exception:
+                self.log_cluster_action_failure(cluster=_cluster, exception=_exception)
+                failed_clusters.append(_cluster)
+
+        return failed_clusters
+
+    def before_cluster_action_async(self, cluster):
+        if self.user_input.create:
+            cluster.raise_if_create_cancelled()
+
+    def on_cluster_action_done_async(self, cluster, exception):
+        if self.speculative_groups:
+            self.speculative_cluster_done(cluster=cluster, failed=exception is not None)
 
     def process_create_destroy_clusters_threads_results(self, futures):
-        create_clusters_error = False
+        failed_clusters = []
         for result in as_completed(futures):
-            _exception = result.exception()
-            if _exception:
-                if self.user_input.create:
-                    create_clusters_error = True
-                else:
-                    raise click.Abort()
+            _cluster = futures[result]
+            if _exception := result.exception():
+                self.log_cluster_action_failure(cluster=_cluster, exception=_exception)
+                self.set_cluster_status(cluster=_cluster, failed=True)
+                failed_clusters.append(_cluster)
+            else:
+                self.set_cluster_status(cluster=_cluster)
 
-        # If one cluster failed to create we want to destroy all clusters
-        if create_clusters_error:
-            self.user_input.create = False
-            self.logger.error("One cluster failed to create, destroying all clusters")
-            self.run_create_or_destroy_clusters()
-            raise click.Abort()
+            if self.speculative_groups:
+                self.speculative_cluster_done(cluster=_cluster, failed=bool(result.exception()))
+
+        return failed_clusters
+
+    @property
+    def continue_on_failure(self):
+        return self.user_input.create and (
+            self.user_input.create_failure_policy == KEEP_SUCCESSFUL_STR or self.user_input.create_retries > 0
+        )
+
+    def log_cluster_action_failure(self, cluster, exception):
+        # click.Abort has no message
+        self.logger.error(f"Failed to {self.clusters_action} cluster {cluster.cluster_info['name']}: {exception!r}")
+
+    def set_cluster_status(self, cluster, failed=False):
+        if failed:
+            status = FAILED_STR
+        else:
+            status = ACTIONS_SUCCESS_STATUSES[self.clusters_action]
+
+        self.clusters_status[cluster.cluster_info["name"]] = status
+
+    def retry_failed_clusters(self, failed_clusters):
+        for attempt in range(1, self.user_input.create_retries + 1):
+            if not failed_clusters:
+                break
+
+            self.logger.warning(
+                f"Retry create clusters {[_cluster.cluster_info['name'] for _cluster in failed_clusters]} "
+                f"[attempt {attempt}/{self.user_input.create_retries}]"
+            )
+            for _cluster in failed_clusters:
+                _cluster.prepare_create_retry()
+
+            failed_clusters = self.execute_clusters_action(clusters=failed_clusters)
+
+        return failed_clusters
+
+    def rollback_clusters_by_create_failure_policy(self):
+        # Failed clusters are already rolled back by their own `create_cluster`
+        if self.user_input.create_failure_policy == KEEP_SUCCESSFUL_STR:
+            self.logger.error("At least one cluster failed to create, keeping successfully created clusters")
+            return
+
+        created_clusters = [
+            _cluster
+            for _cluster in self.list_clusters
+            if self.clusters_status.get(_cluster.cluster_info["name"]) == CREATED_STR
+        ]
+        self.logger.error("One cluster failed to create, destroying all clusters")
+        # Claimed clusters are ready, no need to destroy them
+        self.return_claimed_clusters_to_pool()
+        self.user_input.create = False
+        self.execute_clusters_action(clusters=created_clusters)
+
+    def log_clusters_status(self):
+        for _name, _status in self.clusters_status.items():
+            if _status == FAILED_STR:
+                log_func = self.logger.error
+            elif _status == SKIPPED_STR:
+                log_func = self.logger.warning
+            else:
+                log_func = self.logger.info
+
+            log_func(f"Cluster {_name}: {_status}")
+
+        self.logger.info(f"OCM rate limiter counters: {get_ocm_rate_limiter().counters}")
 
     def attach_clusters_to_acm_cluster_hub(self):
         for cluster in self.list_clusters:
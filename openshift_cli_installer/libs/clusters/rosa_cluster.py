@@ -1,56 +1,79 @@
+import asyncio
+import functools
 import os
-import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 import click
-import rosa.cli
+import shortuuid
+from botocore.exceptions import BotoCoreError, ClientError
 from python_terraform import IsNotFlagged, Terraform
 from simple_logger.logger import get_logger
 import secrets
 import string
 from openshift_cli_installer.libs.clusters.ocm_cluster import OcmCluster
+from openshift_cli_installer.utils.async_utils import run_blocking
 from openshift_cli_installer.utils.cluster_versions import get_cluster_version_to_install
-from openshift_cli_installer.utils.const import HYPERSHIFT_STR
-from openshift_cli_installer.utils.general import (
-    get_manifests_path,
-    zip_and_upload_to_s3,
+from openshift_cli_installer.utils.const import (
+    AUTH_WRITTEN_PHASE,
+    AWS_API_VPC_PROVISIONER_STR,
+    CLUSTER_READY_PHASE,
+    CLUSTER_REQUESTED_PHASE,
+    HYPERSHIFT_IDP_CREATED_PHASE,
+    HYPERSHIFT_IDP_GRANTED_PHASE,
+    HYPERSHIFT_STR,
+    HYPERSHIFT_TERRAFORM_PLAN_FILENAME,
+    OIDC_CREATED_PHASE,
+    OPERATOR_ROLES_CREATED_PHASE,
+    TERRAFORM_VPC_PROVISIONER_STR,
+    VPC_APPLIED_PHASE,
 )
+from openshift_cli_installer.utils.aws_roles import get_missing_iam_roles
+from openshift_cli_installer.utils.general import get_manifests_path
+from openshift_cli_installer.utils.hypershift_shared_iam import HypershiftSharedIamRegistry
+from openshift_cli_installer.utils.hypershift_vpc import HypershiftVpcProvisioner, hypershift_az_ids
+from openshift_cli_installer.utils.hypershift_vpc_pool import HypershiftVpcPool
+from openshift_cli_installer.utils.resource_waits import wait_for_resource
+from openshift_cli_installer.utils.task_graph import TaskGraphError, run_task_graph
+from openshift_cli_installer.utils.terraform_cache import TerraformInitError, prepare_terraform_working_dir
 from ocp_resources.group import Group
-from timeout_sampler import TimeoutSampler
-from clouds.aws.roles.roles import get_roles
+from timeout_sampler import TimeoutExpiredError
 
 
 class RosaCluster(OcmCluster):
     def __init__(self, ocp_cluster, user_input):
         super().__init__(ocp_cluster=ocp_cluster, user_input=user_input)
         self.logger = get_logger(f"{self.__class__.__module__}-{self.__class__.__name__}")
+        self.hypershift_idp = self.init_hypershift_idp()
         if self.user_input.create:
             self.cluster_info["aws-account-id"] = self.user_input.aws_account_id
             self.assert_hypershift_missing_roles()
-            self.get_rosa_versions()
-            self.cluster["version"] = get_cluster_version_to_install(
-                wanted_version=self.cluster_info["user-requested-version"],
-                base_versions_dict=self.rosa_base_available_versions_dict,
-                platform=self.cluster_info["platform"],
-                stream=self.cluster_info["stream"],
-                log_prefix=self.log_prefix,
-            )
+            self.cluster["version"] = self.resolve_cluster_version(resolve_func=self.get_rosa_version_to_install)
 
         if not self.user_input.destroy_from_s3_bucket_or_local_directory:
             if self.cluster_info["platform"] == HYPERSHIFT_STR:
                 self.terraform = None
                 self.cluster["tags"] = "dns:external"
                 self.cluster["machine-cidr"] = self.cluster.get("cidr", "10.0.0.0/16")
+                self.cluster_info["vpc-provisioner"] = self.user_input.hypershift_vpc_provisioner
 
             self.dump_cluster_data_to_file()
 
+    def get_rosa_version_to_install(self):
+        self.get_rosa_versions()
+        return get_cluster_version_to_install(
+            wanted_version=self.cluster_info["user-requested-version"],
+            base_versions_dict=self.rosa_base_available_versions_dict,
+            platform=self.cluster_info["platform"],
+            stream=self.cluster_info["stream"],
+            log_prefix=self.log_prefix,
+        )
+
     def terraform_init(self):
         self.logger.info(f"{self.log_prefix}: Init Terraform")
-        # az_id example: us-east-2 -> ["use2-az1", "use2-az2"]
-        az_id_prefix = "".join(re.match(r"(.*)-(\w).*-(\d)", self.cluster_info["region"]).groups())
         cluster_parameters = {
             "aws_region": self.cluster_info["region"],
-            "az_ids": [f"{az_id_prefix}-az1", f"{az_id_prefix}-az2"],
+            "az_ids": hypershift_az_ids(region=self.cluster_info["region"]),
             "cluster_name": self.cluster_info["name"],
         }
         cidr = self.cluster.get("cidr")
@@ -66,96 +89,234 @@ class RosaCluster(OcmCluster):
             cluster_parameters["public_subnets"] = public_subnets
 
         self.terraform = Terraform(working_dir=self.cluster_info["cluster-dir"], variables=cluster_parameters)
-        shutil.copy(
-            os.path.join(get_manifests_path(), "setup-vpc.tf"),
-            self.cluster_info["cluster-dir"],
-        )
+        manifest_path = os.path.join(get_manifests_path(), "setup-vpc.tf")
+        try:
+            # Modules and providers are downloaded once and shared by all clusters and runs
+            prepare_terraform_working_dir(manifest_path=manifest_path, working_dir=self.cluster_info["cluster-dir"])
+        except (TerraformInitError, OSError) as ex:
+            self.logger.warning(f"{self.log_prefix}: Failed to use shared Terraform cache, init from scratch: {ex}")
+            shutil.copy(manifest_path, self.cluster_info["cluster-dir"])
+
         rc, out, err = self.terraform.init()
         if rc != 0:
             self.logger.error(f"{self.log_prefix}: Terraform init failed. Err: {err}, Out: {out}")
             raise click.Abort()
 
-    def create_oidc(self):
-        self.logger.info(f"{self.log_prefix}: Create OIDC config")
-        res = rosa.cli.execute(
-            command="create oidc-config --managed=true",
-            aws_region=self.cluster_info["region"],
-            ocm_client=self.ocm_client,
-        )
+    def create_oidc_config(self):
+        res = self.rosa_backend.execute(command="create oidc-config --managed=true")
         oidc_id = res["out"].get("id")
         if not oidc_id:
             self.logger.error(f"{self.log_prefix}: Failed to get OIDC config")
             raise click.Abort()
 
-        self.cluster["oidc-config-id"] = self.cluster_info["oidc-config-id"] = oidc_id
+        return oidc_id
+
+    def create_oidc(self):
+        self.logger.info(f"{self.log_prefix}: Create OIDC config")
+        self.cluster["oidc-config-id"] = self.cluster_info["oidc-config-id"] = self.create_oidc_config()
+
+    def create_shared_oidc_and_operator_roles(self):
+        self.logger.info(f"{self.log_prefix}: Create shared OIDC config and operator roles")
+        oidc_config_id = self.create_oidc_config()
+        operator_roles_prefix = f"ocli-{self.cluster_info['region']}-{shortuuid.uuid()[:4].lower()}"
+        try:
+            self.create_operator_role(prefix=operator_roles_prefix, oidc_config_id=oidc_config_id)
+        except Exception:
+            # Not registered yet, no cluster would ever delete it
+            self.rosa_backend.execute(command=f"delete oidc-config --oidc-config-id={oidc_config_id}")
+            raise
+
+        return {"oidc_config_id": oidc_config_id, "operator_roles_prefix": operator_roles_prefix}
+
+    def use_shared_oidc_and_operator_roles(self, oidc_config_id, operator_roles_prefix):
+        self.cluster["oidc-config-id"] = self.cluster_info["oidc-config-id"] = oidc_config_id
+        self.cluster_info["operator-roles-prefix"] = operator_roles_prefix
+        # Saved in cluster_data.yaml, shared resources are released instead of deleted on destroy
+        self.cluster_info["shared-oidc-config"] = True
+
+    def delete_shared_oidc_and_operator_roles(self, oidc_config_id, operator_roles_prefix):
+        self.logger.info(f"{self.log_prefix}: Delete shared OIDC config and operator roles")
+        rosa_backend = self.rosa_backend
+        rosa_backend.execute(command=f"delete operator-roles --prefix={operator_roles_prefix}")
+        rosa_backend.execute(command=f"delete oidc-provider --oidc-config-id={oidc_config_id}")
+        rosa_backend.execute(command=f"delete oidc-config --oidc-config-id={oidc_config_id}")
+
+    @property
+    def shared_iam_registry(self):
+        # Kept next to the clusters data, the reference count outlives the host
+        return HypershiftSharedIamRegistry(s3_bucket_name=self.s3_bucket_name, s3_bucket_path=self.s3_bucket_path)
+
+    def acquire_shared_oidc_and_operator_roles(self):
+        shared_iam = self.shared_iam_registry.acquire(
+            aws_account_id=self.cluster_info["aws-account-id"],
+            region=self.cluster_info["region"],
+            cluster_name=self.cluster_info["name"],
+            create_func=self.create_shared_oidc_and_operator_roles,
+        )
+        self.use_shared_oidc_and_operator_roles(**shared_iam)
 
     def delete_oidc(self):
+        if self.cluster_info.get("shared-oidc-config"):
+            self.shared_iam_registry.release(
+                aws_account_id=self.cluster_info["aws-account-id"],
+                region=self.cluster_info["region"],
+                cluster_name=self.cluster_info["name"],
+                delete_func=self.delete_shared_oidc_and_operator_roles,
+            )
+            return
+
         self.logger.info(f"{self.log_prefix}: Delete OIDC config")
         oidc_config_id = self.cluster_info.get("oidc-config-id")
         if not oidc_config_id:
             self.logger.warning(f"{self.log_prefix}: No OIDC config ID to delete")
             return
 
-        rosa.cli.execute(
-            command=f"delete oidc-config --oidc-config-id={oidc_config_id}",
-            aws_region=self.cluster_info["region"],
-            ocm_client=self.ocm_client,
-        )
+        self.rosa_backend.execute(command=f"delete oidc-config --oidc-config-id={oidc_config_id}")
 
-    def create_operator_role(self):
+    def create_operator_role(self, prefix=None, oidc_config_id=None):
         self.logger.info(f"{self.log_prefix}: Create operator role")
-        rosa.cli.execute(
+        self.rosa_backend.execute(
             command=(
                 "create operator-roles --hosted-cp"
-                f" --prefix={self.cluster_info['name']} "
-                f"--oidc-config-id={self.cluster_info['oidc-config-id']} "
+                f" --prefix={prefix or self.cluster_info['name']} "
+                f"--oidc-config-id={oidc_config_id or self.cluster_info['oidc-config-id']} "
                 "--installer-role-arn="
                 f"arn:aws:iam::{self.cluster_info['aws-account-id']}:role/ManagedOpenShift-HCP-ROSA-Installer-Role"
-            ),
-            aws_region=self.cluster_info["region"],
-            ocm_client=self.ocm_client,
+            )
         )
 
     def delete_operator_role(self):
+        if self.cluster_info.get("shared-oidc-config"):
+            self.logger.info(f"{self.log_prefix}: Keeping shared operator roles")
+            return
+
         self.logger.info(f"{self.log_prefix}: Delete operator role")
         name = self.cluster_info["name"]
-        rosa.cli.execute(
-            command=f"delete operator-roles --prefix={name} --cluster={name}",
-            aws_region=self.cluster_info["region"],
-            ocm_client=self.ocm_client,
+        self.rosa_backend.execute(command=f"delete operator-roles --prefix={name} --cluster={name}")
+
+    @property
+    def vpc_provisioner(self):
+        # Clusters created before the provisioner was saved used Terraform
+        return self.cluster_info.get("vpc-provisioner", TERRAFORM_VPC_PROVISIONER_STR)
+
+    @property
+    def hypershift_vpc_provisioner(self):
+        return HypershiftVpcProvisioner(
+            # Resources of a VPC claimed from the pool are tagged with the pool VPC name
+            cluster_name=self.cluster_info.get("vpc-pool-name", self.cluster_info["name"]),
+            region=self.cluster_info["region"],
+            cidr=self.cluster.get("cidr"),
+            private_subnets=self.cluster.get("private-subnets"),
+            public_subnets=self.cluster.get("public-subnets"),
         )
 
+    def claim_hypershift_pool_vpc(self):
+        """
+        Returns:
+            bool: True if a VPC was claimed from the region VPCs pool.
+        """
+        if not self.user_input.hypershift_vpc_pool:
+            return False
+
+        if any(self.cluster.get(_key) for _key in ("cidr", "private-subnets", "public-subnets")):
+            self.logger.info(f"{self.log_prefix}: Custom VPC network requested, not using the VPCs pool")
+            return False
+
+        try:
+            pool_vpc_name = HypershiftVpcPool(region=self.cluster_info["region"]).claim(
+                claimant=self.cluster_info["name"]
+            )
+        except (BotoCoreError, ClientError) as ex:
+            self.logger.warning(f"{self.log_prefix}: Failed to claim a VPC from the pool: {ex}")
+            return False
+
+        if not pool_vpc_name:
+            return False
+
+        self.cluster_info["vpc-pool-name"] = pool_vpc_name
+        self.cluster_info["vpc-provisioner"] = AWS_API_VPC_PROVISIONER_STR
+        return True
+
     def destroy_hypershift_vpc(self):
+        pool_vpc_name = self.cluster_info.get("vpc-pool-name")
+        if pool_vpc_name and self.user_input.hypershift_vpc_pool:
+            if HypershiftVpcPool(region=self.cluster_info["region"]).release(pool_vpc_name=pool_vpc_name):
+                return
+
+            self.logger.warning(f"{self.log_prefix}: Failed to return {pool_vpc_name} to the pool, deleting it")
+
+        if self.vpc_provisioner == AWS_API_VPC_PROVISIONER_STR:
+            self.logger.info(f"{self.log_prefix}: Destroy hypershift VPCs with AWS API")
+            try:
+                self.hypershift_vpc_provisioner.destroy()
+            except (BotoCoreError, ClientError, TimeoutExpiredError) as ex:
+                self.logger.error(f"{self.log_prefix}: Failed to destroy hypershift VPCs with error: {ex}")
+                raise click.Abort()
+
+            return
+
         self.terraform_init()
         self.logger.info(f"{self.log_prefix}: Destroy hypershift VPCs")
-        rc, _, err = self.terraform.destroy(
-            force=IsNotFlagged,
-            auto_approve=True,
-            capture_output=True,
-        )
+        with self.host_resources_admission(process_name="terraform destroy"):
+            rc, _, err = self.terraform.destroy(
+                force=IsNotFlagged,
+                auto_approve=True,
+                capture_output=True,
+            )
+
         if rc != 0:
             self.logger.error(f"{self.log_prefix}: Failed to destroy hypershift VPCs with error: {err}")
             raise click.Abort()
 
-    def prepare_hypershift_vpc(self):
+    def apply_hypershift_vpc_terraform(self):
+        """
+        Returns:
+            tuple: VPC subnets dict (None on failure) and the failure error.
+        """
         self.terraform_init()
-        self.logger.info(f"{self.log_prefix}: Preparing hypershift VPCs")
-        self.terraform.plan(dir_or_plan="hypershift.plan")
-        rc, _, err = self.terraform.apply(capture_output=True, skip_plan=True, auto_approve=True)
+        with self.host_resources_admission(process_name="terraform apply"):
+            rc, _, err = self.terraform.plan(out=HYPERSHIFT_TERRAFORM_PLAN_FILENAME, detailed_exitcode=IsNotFlagged)
+            if rc == 0:
+                # Apply the saved plan instead of planning again, variables are already in the plan
+                rc, _, err = self.terraform.apply(
+                    dir_or_plan=HYPERSHIFT_TERRAFORM_PLAN_FILENAME, var=None, capture_output=True, skip_plan=True
+                )
+
         if rc != 0:
-            self.logger.error(
-                f"{self.log_prefix}: Create hypershift VPC failed with error: {err}, rolling back.",
-            )
-            self.delete_oidc()
-            self.delete_operator_role()
-            # Clean up already created resources from the plan
-            self.destroy_hypershift_vpc()
-            raise click.Abort()
+            return None, err
 
         terraform_output = self.terraform.output()
-        private_subnet = terraform_output["cluster-private-subnet"]["value"]
-        public_subnet = terraform_output["cluster-public-subnet"]["value"]
-        self.cluster["subnet-ids"] = f'"{public_subnet},{private_subnet}"'
+        return {
+            "public_subnets": [terraform_output["cluster-public-subnet"]["value"]],
+            "private_subnets": [terraform_output["cluster-private-subnet"]["value"]],
+        }, None
+
+    def apply_hypershift_vpc_aws_api(self):
+        """
+        Returns:
+            tuple: VPC subnets dict (None on failure) and the failure error.
+        """
+        try:
+            return self.hypershift_vpc_provisioner.create(), None
+        except (BotoCoreError, ClientError) as ex:
+            return None, ex
+
+    def prepare_hypershift_vpc(self):
+        if self.claim_hypershift_pool_vpc():
+            self.logger.info(f"{self.log_prefix}: Using {self.cluster_info['vpc-pool-name']} VPC from the pool")
+        else:
+            self.logger.info(f"{self.log_prefix}: Preparing hypershift VPCs with {self.vpc_provisioner}")
+
+        if self.vpc_provisioner == AWS_API_VPC_PROVISIONER_STR:
+            subnets, err = self.apply_hypershift_vpc_aws_api()
+        else:
+            subnets, err = self.apply_hypershift_vpc_terraform()
+
+        if not subnets:
+            self.logger.error(f"{self.log_prefix}: Create hypershift VPC failed with error: {err}")
+            raise click.Abort()
+
+        self.cluster["subnet-ids"] = f'"{subnets["public_subnets"][0]},{subnets["private_subnets"][0]}"'
 
     def build_rosa_command(self):
         ignore_keys = (
@@ -163,6 +324,8 @@ class RosaCluster(OcmCluster):
             "platform",
             "ocm-env",
             "timeout",
+            "priority",
+            "expected-duration",
             "cidr",
             "private-subnets",
             "public-subnets",
@@ -182,7 +345,7 @@ class RosaCluster(OcmCluster):
                 f" --role-arn=arn:aws:iam::{self.cluster_info['aws-account-id']}:role/ManagedOpenShift-HCP-ROSA-Installer-Role "
                 f"--support-role-arn=arn:aws:iam::{self.cluster_info['aws-account-id']}:role/ManagedOpenShift-HCP-ROSA-Support-Role "
                 f" --worker-iam-role=arn:aws:iam::{self.cluster_info['aws-account-id']}:role/ManagedOpenShift-HCP-ROSA-Worker-Role "
-                f"--hosted-cp --operator-roles-prefix={name} "
+                f"--hosted-cp --operator-roles-prefix={self.cluster_info.get('operator-roles-prefix', name)} "
             )
 
         for _key, _val in self.cluster.items():
@@ -193,102 +356,259 @@ class RosaCluster(OcmCluster):
 
         return command
 
-    def create_cluster(self):
-        idp_user, idp_password = None, None
+    def create_hypershift_oidc_step(self):
+        if self.journal.is_completed(OIDC_CREATED_PHASE):
+            journal_data = self.journal.data
+            if operator_roles_prefix := journal_data.get("shared_operator_roles_prefix"):
+                self.use_shared_oidc_and_operator_roles(
+                    oidc_config_id=journal_data["oidc_config_id"], operator_roles_prefix=operator_roles_prefix
+                )
+            else:
+                self.cluster["oidc-config-id"] = self.cluster_info["oidc-config-id"] = journal_data["oidc_config_id"]
 
-        self.timeout_watch = self.start_time_watcher()
-        if self.cluster_info["platform"] == HYPERSHIFT_STR:
+            return
+
+        if self.user_input.hypershift_shared_oidc_config:
+            self.acquire_shared_oidc_and_operator_roles()
+        else:
             self.create_oidc()
+
+        self.journal.record(
+            phase=OIDC_CREATED_PHASE,
+            oidc_config_id=self.cluster_info["oidc-config-id"],
+            shared_operator_roles_prefix=self.cluster_info.get("operator-roles-prefix"),
+        )
+
+    def create_hypershift_operator_roles_step(self):
+        if self.cluster_info.get("shared-oidc-config"):
+            return
+
+        if not self.journal.is_completed(OPERATOR_ROLES_CREATED_PHASE):
             self.create_operator_role()
-            self.prepare_hypershift_vpc()
+            self.journal.record(phase=OPERATOR_ROLES_CREATED_PHASE)
 
-        self.dump_cluster_data_to_file()
+    def prepare_hypershift_vpc_step(self):
+        if self.journal.is_completed(VPC_APPLIED_PHASE):
+            journal_data = self.journal.data
+            self.cluster["subnet-ids"] = journal_data["subnet_ids"]
+            if pool_vpc_name := journal_data.get("vpc_pool_name"):
+                self.cluster_info["vpc-pool-name"] = pool_vpc_name
+                self.cluster_info["vpc-provisioner"] = AWS_API_VPC_PROVISIONER_STR
+
+            return
+
+        self.prepare_hypershift_vpc()
+        self.journal.record(
+            phase=VPC_APPLIED_PHASE,
+            subnet_ids=self.cluster["subnet-ids"],
+            vpc_pool_name=self.cluster_info.get("vpc-pool-name"),
+        )
+
+    def rollback_hypershift_pre_create(self, started_steps):
+        rollback_tasks = {}
+        if VPC_APPLIED_PHASE in started_steps:
+            # Clean up already created resources
+            rollback_tasks["destroy-vpc"] = (self.destroy_hypershift_vpc, ())
+
+        if OPERATOR_ROLES_CREATED_PHASE in started_steps:
+            rollback_tasks["delete-operator-roles"] = (self.delete_operator_role, ())
+
+        if OIDC_CREATED_PHASE in started_steps:
+            rollback_tasks["delete-oidc"] = (self.delete_oidc, ())
 
         try:
-            rosa.cli.execute(
-                command=self.build_rosa_command(),
-                ocm_client=self.ocm_client,
-                aws_region=self.cluster_info["region"],
+            run_task_graph(tasks=rollback_tasks)
+        except TaskGraphError as ex:
+            self.logger.error(f"{self.log_prefix}: Hypershift pre-create rollback failed: {ex}")
+
+        # Rolled back resources must not be reused by a resumed create
+        self.journal.clear()
+
+    def prepare_hypershift_cluster_create(self):
+        """
+        Create the hypershift cluster AWS resources; operator roles need the OIDC config, the VPC does not depend
+        on them and is applied in parallel.
+        Steps completed according to the lifecycle journal are not run again.
+        """
+        try:
+            run_task_graph(
+                tasks={
+                    OIDC_CREATED_PHASE: (self.create_hypershift_oidc_step, ()),
+                    OPERATOR_ROLES_CREATED_PHASE: (self.create_hypershift_operator_roles_step, (OIDC_CREATED_PHASE,)),
+                    VPC_APPLIED_PHASE: (self.prepare_hypershift_vpc_step, ()),
+                }
             )
+        except TaskGraphError as ex:
+            self.logger.error(f"{self.log_prefix}: Hypershift pre-create failed: {ex}, rolling back.")
+            self.rollback_hypershift_pre_create(started_steps=ex.started)
+            raise click.Abort()
 
-            self.cluster_object.wait_for_cluster_ready(wait_timeout=self.timeout_watch.remaining_time())
+    def prepare_cluster_create(self):
+        self.timeout_watch = self.start_time_watcher()
+        if self.cluster_info["platform"] == HYPERSHIFT_STR:
+            self.prepare_hypershift_cluster_create()
 
-            # Must be called right after the cluster is ready.
-            self.add_cluster_info_to_cluster_object()
+        self.dump_cluster_data_to_file()
 
-            if self.cluster_info["platform"] == HYPERSHIFT_STR:
-                idp_user, idp_password = self.create_hypershift_idp()
+    def request_cluster_create(self):
+        if self.journal.is_completed(CLUSTER_REQUESTED_PHASE):
+            self.logger.info(f"{self.log_prefix}: Cluster already requested according to lifecycle journal")
+            return
 
-            self.set_cluster_auth(idp_user=idp_user, idp_password=idp_password)
-            self.logger.success(f"{self.log_prefix}: Cluster created successfully")
+        self.rosa_backend.execute(command=self.build_rosa_command())
+        self.journal.record(phase=CLUSTER_REQUESTED_PHASE)
 
-        except Exception as ex:
-            self.logger.error(
-                f"{self.log_prefix}: Failed to run cluster create\n{ex}",
-            )
-            self.set_cluster_auth()
-            if self.user_input.must_gather_output_dir:
-                self.collect_must_gather()
+    def finalize_cluster_create(self):
+        idp_user, idp_password = None, None
 
+        # Must be called right after the cluster is ready.
+        self.add_cluster_info_to_cluster_object()
+
+        if self.journal.is_completed(AUTH_WRITTEN_PHASE):
+            self.logger.info(f"{self.log_prefix}: Cluster auth already written according to lifecycle journal")
+            return
+
+        if self.cluster_info["platform"] == HYPERSHIFT_STR:
+            idp_user, idp_password = self.create_hypershift_idp()
+
+        self.set_cluster_auth(idp_user=idp_user, idp_password=idp_password)
+        self.journal.record(phase=AUTH_WRITTEN_PHASE)
+        self.logger.success(f"{self.log_prefix}: Cluster created successfully")
+
+    def create_cluster(self):
+        self.prepare_cluster_create()
+
+        try:
+            self.request_cluster_create()
+            # Hypershift IDP only needs the cluster ID, request it while the cluster installs
+            with ThreadPoolExecutor(max_workers=1) as idp_executor:
+                idp_executor.submit(self.request_hypershift_idp_early)
+                self.wait_for_cluster_ready()
+
+            self.finalize_cluster_create()
+
+        except Exception as ex:
+            self.collect_failed_create_data(ex=ex)
             self.destroy_cluster()
             raise click.Abort()
 
-        if self.s3_bucket_name:
-            zip_and_upload_to_s3(
-                install_dir=self.cluster_info["cluster-dir"],
-                s3_bucket_name=self.s3_bucket_name,
-                s3_bucket_object_name=self.cluster_info["s3-object-name"],
-            )
+        self.upload_cluster_data_to_s3()
+
+    async def create_cluster_async(self, executor):
+        await run_blocking(executor=executor, func=self.prepare_cluster_create)
 
-    def destroy_cluster(self):
-        self.timeout_watch = self.start_time_watcher()
-        should_raise = False
         try:
-            res = rosa.cli.execute(
-                command=f"delete cluster --cluster={self.cluster_info['name']}",
-                ocm_client=self.ocm_client,
-                aws_region=self.cluster_info["region"],
-            )
-            self.cluster_object.wait_for_cluster_deletion(wait_timeout=self.timeout_watch.remaining_time())
-            self.remove_leftovers(res=res)
+            await run_blocking(executor=executor, func=self.request_cluster_create)
+            idp_request = asyncio.create_task(self.request_hypershift_idp_early_async(executor=executor))
+            try:
+                await self.wait_for_cluster_ready_async(executor=executor)
+            except Exception:
+                idp_request.cancel()
+                raise
+
+            await idp_request
+            await run_blocking(executor=executor, func=self.finalize_cluster_create)
 
         except Exception as ex:
-            should_raise = ex
+            await run_blocking(executor=executor, func=self.collect_failed_create_data, ex=ex)
+            await self.destroy_cluster_async(executor=executor)
+            raise click.Abort()
 
-        if self.cluster_info["platform"] == HYPERSHIFT_STR:
-            self.destroy_hypershift_vpc()
-            self.delete_oidc()
-            self.delete_operator_role()
+        await run_blocking(executor=executor, func=self.upload_cluster_data_to_s3)
+
+    def request_cluster_delete(self):
+        shared_oidc_config = self.cluster_info.get("shared-oidc-config")
+        leftover_commands = self.rosa_backend.delete_cluster(
+            cluster_name=self.cluster_info["name"],
+            cluster_id=self.cluster_object.cluster_id,
+            hypershift=self.cluster_info["platform"] == HYPERSHIFT_STR,
+            oidc_config_id=None if shared_oidc_config else self.cluster_info.get("oidc-config-id"),
+        )
+        if shared_oidc_config:
+            # OIDC provider and operator roles are used by other clusters
+            return [
+                _command
+                for _command in leftover_commands
+                if "oidc-provider" not in _command and "operator-roles" not in _command
+            ]
 
-        if should_raise:
-            self.logger.error(f"{self.log_prefix}: Failed to run cluster destroy\n{should_raise}")
+        return leftover_commands
+
+    def finalize_cluster_destroy(self, destroy_exception=None, leftover_commands=None):
+        try:
+            self.remove_cluster_aws_resources(leftover_commands=leftover_commands or [])
+        except TaskGraphError as ex:
+            destroy_exception = destroy_exception or ex
+
+        if destroy_exception:
+            self.logger.error(f"{self.log_prefix}: Failed to run cluster destroy\n{destroy_exception}")
             raise click.Abort()
 
         self.logger.success(f"{self.log_prefix}: Cluster destroyed successfully")
         self.delete_cluster_s3_buckets()
 
-    def remove_leftovers(self, res):
-        leftovers = re.search(
-            r"INFO: Once the cluster is uninstalled use the following commands to"
-            r" remove"
-            r" the above "
-            r"aws resources(.*?)INFO:",
-            res.get("out", ""),
-            re.DOTALL,
+    def destroy_cluster(self):
+        self.timeout_watch = self.start_time_watcher()
+        destroy_exception = None
+        leftover_commands = None
+        try:
+            _leftover_commands = self.request_cluster_delete()
+            self.wait_for_cluster_deletion()
+            leftover_commands = _leftover_commands
+
+        except Exception as ex:
+            destroy_exception = ex
+
+        self.finalize_cluster_destroy(destroy_exception=destroy_exception, leftover_commands=leftover_commands)
+
+    async def destroy_cluster_async(self, executor):
+        self.timeout_watch = self.start_time_watcher()
+        destroy_exception = None
+        leftover_commands = None
+        try:
+            _leftover_commands = await run_blocking(executor=executor, func=self.request_cluster_delete)
+            await self.wait_for_cluster_deletion_async(executor=executor)
+            leftover_commands = _leftover_commands
+
+        except Exception as ex:
+            destroy_exception = ex
+
+        await run_blocking(
+            executor=executor,
+            func=self.finalize_cluster_destroy,
+            destroy_exception=destroy_exception,
+            leftover_commands=leftover_commands,
         )
-        if leftovers:
-            for line in leftovers.group(1).splitlines():
-                _line = line.strip()
-                if _line.startswith("rosa"):
-                    base_command = _line.split(maxsplit=1)[-1]
-                    command = base_command.replace("-c ", "--cluster=")
-                    command = command.replace("--prefix ", "--prefix=")
-                    command = command.replace("--oidc-config-id ", "--oidc-config-id=")
-                    rosa.cli.execute(
-                        command=command,
-                        ocm_client=self.ocm_client,
-                        aws_region=self.cluster_info["region"],
-                    )
+
+    def remove_cluster_aws_resources(self, leftover_commands):
+        """
+        Remove the cluster AWS resources once the cluster is gone, concurrently.
+
+        `rosa delete cluster` leftover commands (operator roles and OIDC provider) are run only if the cluster
+        deletion completed; hypershift VPC, operator roles (when not a leftover command) and OIDC config are deleted
+        in any case.
+
+        Raises:
+            TaskGraphError: If any removal failed, after all the independent removals ran.
+        """
+        rosa_backend = self.rosa_backend
+        tasks = {
+            _command: (functools.partial(rosa_backend.execute, command=_command), ()) for _command in leftover_commands
+        }
+        if self.cluster_info["platform"] == HYPERSHIFT_STR:
+            tasks["destroy-vpc"] = (self.destroy_hypershift_vpc, ())
+            # The `rosa delete cluster` leftover command deletes the same operator roles
+            if not any("operator-roles" in _command for _command in leftover_commands):
+                tasks["delete-operator-roles"] = (self.delete_operator_role, ())
+
+            # The OIDC provider is created from the OIDC config issuer, remove it first
+            tasks["delete-oidc"] = (
+                self.delete_oidc,
+                tuple(_command for _command in leftover_commands if "oidc-provider" in _command),
+            )
+
+        if tasks:
+            run_task_graph(tasks=tasks)
 
     def assert_hypershift_missing_roles(self):
         if self.cluster_info["platform"] == HYPERSHIFT_STR:
@@ -298,48 +618,143 @@ class RosaCluster(OcmCluster):
                 "ManagedOpenShift-HCP-ROSA-Worker-Role",
             }
 
-            if missing_roles := hcp_roles - {role["RoleName"] for role in get_roles()}:
+            if missing_roles := get_missing_iam_roles(
+                role_names=hcp_roles, aws_account_id=self.cluster_info["aws-account-id"]
+            ):
                 self.logger.error(f"The following roles are missing for {HYPERSHIFT_STR} deployment: {missing_roles}")
                 raise click.Abort()
 
+    def new_hypershift_idp(self):
+        """
+        Hypershift IDP requests state, requests may be issued while the cluster is installing.
+        """
+        return {
+            "user": "rosa-admin",
+            "password": self.generate_hypershift_password(),
+            "created": False,
+            "granted": False,
+        }
+
+    def init_hypershift_idp(self):
+        """
+        When resuming, the IDP password and requests state are taken from the lifecycle journal, the IDP may already
+        exist with the journaled password.
+        """
+        hypershift_idp = self.new_hypershift_idp()
+        if self.journal and self.journal.is_completed(HYPERSHIFT_IDP_CREATED_PHASE):
+            hypershift_idp.update(
+                password=self.journal.data["hypershift_idp_password"],
+                created=True,
+                granted=self.journal.is_completed(HYPERSHIFT_IDP_GRANTED_PHASE),
+            )
+
+        return hypershift_idp
+
+    def prepare_create_retry(self):
+        super().prepare_create_retry()
+        # The IDP belonged to the failed cluster
+        self.hypershift_idp = self.new_hypershift_idp()
+
+    def request_hypershift_idp(self, cluster_id):
+        """
+        Create the hypershift htpasswd IDP and grant its user cluster-admin, requests which already succeeded
+        are not sent again.
+        """
+        rosa_backend = self.rosa_backend
+        idp_user = self.hypershift_idp["user"]
+        if not self.hypershift_idp["created"]:
+            rosa_backend.create_htpasswd_idp(
+                cluster_id=cluster_id,
+                idp_name="rosa-htpasswd",
+                username=idp_user,
+                password=self.hypershift_idp["password"],
+            )
+            self.hypershift_idp["created"] = True
+            self.journal.record(
+                phase=HYPERSHIFT_IDP_CREATED_PHASE, hypershift_idp_password=self.hypershift_idp["password"]
+            )
+
+        if not self.hypershift_idp["granted"]:
+            rosa_backend.grant_cluster_admin(cluster_id=cluster_id, username=idp_user)
+            self.hypershift_idp["granted"] = True
+            self.journal.record(phase=HYPERSHIFT_IDP_GRANTED_PHASE)
+
+    def hypershift_idp_early_request_needed(self):
+        return self.cluster_info["platform"] == HYPERSHIFT_STR and not self.journal.is_completed(CLUSTER_READY_PHASE)
+
+    @staticmethod
+    def ocm_cluster_exists(ocm_cluster):
+        return ocm_cluster is not None
+
+    def _request_hypershift_idp_early(self, ocm_cluster):
+        try:
+            self.request_hypershift_idp(cluster_id=ocm_cluster.id)
+            self.logger.info(f"{self.log_prefix}: Hypershift IDP requested while the cluster installs")
+
+        except Exception as ex:
+            self.logger.info(f"{self.log_prefix}: Hypershift IDP will be requested once the cluster is ready: {ex}")
+
+    def request_hypershift_idp_early(self):
+        """
+        Request the hypershift IDP as soon as the cluster ID is known, failures are retried by
+        `create_hypershift_idp` once the cluster is ready.
+        """
+        if not self.hypershift_idp_early_request_needed():
+            return
+
+        try:
+            ocm_cluster = self.clusters_status_poller.wait_for_cluster(
+                name=self.cluster_info["name"],
+                func=self.ocm_cluster_exists,
+                wait_timeout=self.timeout_watch.remaining_time(),
+            )
+        except TimeoutExpiredError:
+            return
+
+        self._request_hypershift_idp_early(ocm_cluster=ocm_cluster)
+
+    async def request_hypershift_idp_early_async(self, executor):
+        if not self.hypershift_idp_early_request_needed():
+            return
+
+        try:
+            ocm_cluster = await self.clusters_status_poller.wait_for_cluster_async(
+                name=self.cluster_info["name"],
+                func=self.ocm_cluster_exists,
+                wait_timeout=self.timeout_watch.remaining_time(),
+            )
+        except TimeoutExpiredError:
+            return
+
+        await run_blocking(executor=executor, func=self._request_hypershift_idp_early, ocm_cluster=ocm_cluster)
+
     def create_hypershift_idp(self):
         """
         For hypershift cluster create IDP to be able to login to the cluster with user and password.
 
+        The IDP may already be requested while the cluster was installing, then only the cluster-admins
+        membership is verified.
+
         Returns:
             tuple: idp_user and idp_password.
         """
-        idp_user = "rosa-admin"
-        idp_password = self.generate_hypershift_password()
-        aws_region = self.cluster_info["region"]
-        commands = [
-            f"create idp -c {self.cluster_object.cluster_id} --type htpasswd --name rosa-htpasswd --username={idp_user} --password={idp_password}",
-            f"grant user cluster-admin --user={idp_user} --cluster={self.cluster_object.cluster_id}",
-        ]
+        idp_user = self.hypershift_idp["user"]
+        idp_password = self.hypershift_idp["password"]
         rosa_command_success = True
-        for command in commands:
-            try:
-                rosa.cli.execute(
-                    command=command,
-                    ocm_client=self.ocm_client,
-                    aws_region=aws_region,
-                )
-            except Exception as ex:
-                rosa_command_success = False
-                self.logger.error(f"{self.log_prefix}: Failed to create IDP\n{ex}")
-                break
+        try:
+            self.request_hypershift_idp(cluster_id=self.cluster_object.cluster_id)
+        except Exception as ex:
+            rosa_command_success = False
+            self.logger.error(f"{self.log_prefix}: Failed to create IDP\n{ex}")
 
         if rosa_command_success:
             try:
-                for sampler in TimeoutSampler(
-                    wait_timeout=300,
-                    sleep=10,
-                    func=Group,
-                    client=self.ocp_client,
-                    name="cluster-admins",
-                ):
-                    if sampler and idp_user in sampler.instance.users:
-                        break
+                wait_for_resource(
+                    resource=Group(client=self.ocp_client, name="cluster-admins"),
+                    predicate=lambda group_dict: idp_user in (group_dict.get("users") or []),
+                    timeout=300,
+                    description=f"to include {idp_user}",
+                )
 
             except Exception as ex:
                 self.logger.error(f"{self.log_prefix}: {idp_user} is not part of cluster-admins\n{ex}")
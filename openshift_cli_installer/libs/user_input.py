@@ -10,19 +10,41 @@ from openshift_cli_installer.utils.cli_utils import (
     get_managed_acm_clusters_from_user_input,
 )
 from openshift_cli_installer.utils.const import (
+    ADMISSION_CONTROL_DEFAULT_MAX_LOAD_PER_CPU,
+    ADMISSION_CONTROL_DEFAULT_PROCESS_MEMORY_GIB,
+    ASYNC_ENGINE_DEFAULT_WORKERS,
     AWS_OSD_STR,
+    CLI_ROSA_BACKEND_STR,
+    CLUSTER_POOL_DEFAULT_SIZE,
+    CLUSTER_POOL_REFILL_STR,
     CREATE_STR,
+    DESTROY_ALL_STR,
     GCP_STR,
     GCP_OSD_STR,
+    HIGH_PRIORITY_STR,
+    HYPERSHIFT_VPC_POOL_DEFAULT_SIZE,
+    POWER_STATE_ACTIONS,
     HYPERSHIFT_STR,
+    LOW_PRIORITY_STR,
     OBSERVABILITY_SUPPORTED_STORAGE_TYPES,
+    OCM_RATE_LIMIT_DEFAULT,
+    POOL_REFILL_STR,
+    QUERY_CACHE_DEFAULT_TTL,
     ROSA_STR,
     S3_STR,
     SUPPORTED_ACTIONS,
+    SUPPORTED_CLUSTER_PRIORITIES,
+    SUPPORTED_CREATE_FAILURE_POLICIES,
     SUPPORTED_PLATFORMS,
+    SUPPORTED_ROSA_BACKENDS,
+    SUPPORTED_VPC_PROVISIONERS,
+    TERRAFORM_VPC_PROVISIONER_STR,
     USER_INPUT_CLUSTER_BOOLEAN_KEYS,
     IPI_BASED_PLATFORMS,
 )
+from openshift_cli_installer.utils.cluster_pool import get_cluster_pool_store
+from openshift_cli_installer.utils.host_admission import HostResourcesAdmission
+from openshift_cli_installer.utils.query_cache import QueryResultsCache
 
 
 class UserInputError(Exception):
@@ -68,7 +90,74 @@ class UserInput:
         self.ssh_key_file = self.user_kwargs.get("ssh_key_file")
         self.docker_config_file = self.user_kwargs.get("docker_config_file")
         self.must_gather_output_dir = self.user_kwargs.get("must_gather_output_dir")
-        self.create = self.action == CREATE_STR
+        # Cluster pool refill creates the pool clusters
+        self.create = self.action in (CREATE_STR, CLUSTER_POOL_REFILL_STR)
+        self.create_failure_policy = self.user_kwargs.get("create_failure_policy") or DESTROY_ALL_STR
+        self.create_retries = self.user_kwargs.get("create_retries") or 0
+        self.async_engine = self.user_kwargs.get("async_engine")
+        self.resume = self.user_kwargs.get("resume")
+        self.async_engine_workers = self.user_kwargs.get("async_engine_workers") or ASYNC_ENGINE_DEFAULT_WORKERS
+        self.max_parallel_clusters = self.user_kwargs.get("max_parallel_clusters")
+        self.ocm_token_cache = self.user_kwargs.get("ocm_token_cache")
+        self.ocm_rate_limit = self.user_kwargs.get("ocm_rate_limit") or OCM_RATE_LIMIT_DEFAULT
+        self.rosa_backend = self.user_kwargs.get("rosa_backend") or CLI_ROSA_BACKEND_STR
+        self.hypershift_vpc_provisioner = (
+            self.user_kwargs.get("hypershift_vpc_provisioner") or TERRAFORM_VPC_PROVISIONER_STR
+        )
+        self.hypershift_shared_oidc_config = self.user_kwargs.get("hypershift_shared_oidc_config")
+        self.hypershift_vpc_pool = self.user_kwargs.get("hypershift_vpc_pool")
+        self.hypershift_vpc_pool_regions = [
+            _region.strip()
+            for _region in (self.user_kwargs.get("hypershift_vpc_pool_regions") or "").split(",")
+            if _region.strip()
+        ]
+        self.hypershift_vpc_pool_size = self.user_kwargs.get("hypershift_vpc_pool_size")
+        if self.hypershift_vpc_pool_size is None:
+            self.hypershift_vpc_pool_size = HYPERSHIFT_VPC_POOL_DEFAULT_SIZE
+
+        self.speculative_clusters = self.user_kwargs.get("speculative_clusters") or 0
+        if self.speculative_clusters and self.user_kwargs.get("parallel"):
+            # Speculative clusters are created in parallel with the requested ones, even for a single cluster
+            self.parallel = True
+
+        self.cluster_pool = self.user_kwargs.get("cluster_pool")
+        self.cluster_pool_size = self.user_kwargs.get("cluster_pool_size")
+        if self.cluster_pool_size is None:
+            self.cluster_pool_size = CLUSTER_POOL_DEFAULT_SIZE
+
+        self.cluster_pool_store = (
+            get_cluster_pool_store(
+                clusters_install_data_directory=self.clusters_install_data_directory,
+                s3_bucket_name=self.s3_bucket_name,
+                s3_bucket_path=self.s3_bucket_path,
+            )
+            if self.cluster_pool or self.action == CLUSTER_POOL_REFILL_STR
+            else None
+        )
+
+        self.query_cache_ttl = self.user_kwargs.get("query_cache_ttl")
+        if self.query_cache_ttl is None:
+            self.query_cache_ttl = QUERY_CACHE_DEFAULT_TTL
+
+        self.bypass_query_cache = self.user_kwargs.get("bypass_query_cache")
+        self.query_cache = QueryResultsCache(ttl=self.query_cache_ttl, bypass=self.bypass_query_cache)
+        self.admission_control = self.user_kwargs.get("admission_control")
+        self.admission_control_process_memory = (
+            self.user_kwargs.get("admission_control_process_memory") or ADMISSION_CONTROL_DEFAULT_PROCESS_MEMORY_GIB
+        )
+        self.admission_control_max_load = (
+            self.user_kwargs.get("admission_control_max_load") or ADMISSION_CONTROL_DEFAULT_MAX_LOAD_PER_CPU
+        )
+        self.admission_control_cgroup_memory_limit = self.user_kwargs.get("admission_control_cgroup_memory_limit")
+        self.host_resources_admission = (
+            HostResourcesAdmission(
+                process_memory_gib=self.admission_control_process_memory,
+                max_load_per_cpu=self.admission_control_max_load,
+                cgroup_memory_limit_gib=self.admission_control_cgroup_memory_limit,
+            )
+            if self.admission_control
+            else None
+        )
 
         # We need to make sure that we don't process the same input twice
         self._already_processed = "__openshift_cli_installer_user_input_processed__"
@@ -113,8 +202,16 @@ class UserInput:
         return clusters
 
     def verify_user_input(self):
+        if self.action == POOL_REFILL_STR:
+            self.assert_pool_refill_user_input()
+            return
+
         self.abort_no_ocm_token()
 
+        if self.action in POWER_STATE_ACTIONS:
+            self.assert_power_state_action_user_input()
+            return
+
         if self.destroy_clusters_from_s3_bucket or self.destroy_clusters_from_s3_bucket_query:
             if not self.s3_bucket_name:
                 raise UserInputError(
@@ -160,6 +257,48 @@ class UserInput:
             self.assert_missing_cluster_region()
             self.assert_clusters_data_directory_missing_permissions()
             self.assert_platform_not_match_channel_or_stream()
+            self.assert_create_failure_policy_user_input()
+            self.assert_async_engine_user_input()
+            self.assert_resume_user_input()
+            self.assert_clusters_scheduling_user_input()
+            self.assert_admission_control_user_input()
+            self.assert_ocm_rate_limit_user_input()
+            self.assert_rosa_backend_user_input()
+            self.assert_hypershift_vpc_provisioner_user_input()
+            self.assert_hypershift_shared_oidc_config_user_input()
+            self.assert_query_cache_user_input()
+            self.assert_cluster_pool_user_input()
+            self.assert_speculative_clusters_user_input()
+
+    def assert_power_state_action_user_input(self):
+        if (
+            self.destroy_clusters_from_s3_bucket
+            or self.destroy_clusters_from_s3_bucket_query
+            or self.destroy_clusters_from_install_data_directory
+            or self.destroy_clusters_from_install_data_directory_using_s3_bucket
+        ):
+            raise UserInputError(f"Destroy clusters options are not supported with `--action {self.action}`")
+
+        if self.clusters:
+            raise UserInputError(
+                f"`--cluster` is not supported with `--action {self.action}`, clusters are taken from "
+                "`--clusters-install-data-directory` or `--s3-bucket-name`"
+            )
+
+        self.assert_async_engine_user_input()
+        self.assert_ocm_rate_limit_user_input()
+
+    def assert_pool_refill_user_input(self):
+        if self.clusters:
+            raise UserInputError(f"`--cluster` is not supported with `--action {POOL_REFILL_STR}`")
+
+        if not self.hypershift_vpc_pool_regions:
+            raise UserInputError(f"`--hypershift-vpc-pool-regions` is required with `--action {POOL_REFILL_STR}`")
+
+        if not isinstance(self.hypershift_vpc_pool_size, int) or self.hypershift_vpc_pool_size < 0:
+            raise UserInputError(
+                f"Hypershift VPC pool size must be a non-negative integer, got {self.hypershift_vpc_pool_size}"
+            )
 
     def abort_no_ocm_token(self):
         if not self.ocm_token:
@@ -372,3 +511,108 @@ class UserInput:
                 raise UserInputError(
                     f"{_platform} platform does not support channel-group {cluster['channel-group']}, supported channels are {osd_supported_channels}",
                 )
+
+    def assert_create_failure_policy_user_input(self):
+        if self.create_failure_policy not in SUPPORTED_CREATE_FAILURE_POLICIES:
+            raise UserInputError(
+                f"Create failure policy {self.create_failure_policy} is not supported, supported policies are {SUPPORTED_CREATE_FAILURE_POLICIES}"
+            )
+
+        if not isinstance(self.create_retries, int) or self.create_retries < 0:
+            raise UserInputError(f"Create retries must be a non-negative integer, got {self.create_retries}")
+
+    def assert_async_engine_user_input(self):
+        if self.async_engine and (not isinstance(self.async_engine_workers, int) or self.async_engine_workers < 1):
+            raise UserInputError(f"Async engine workers must be a positive integer, got {self.async_engine_workers}")
+
+    def assert_resume_user_input(self):
+        if not self.resume:
+            return
+
+        if not self.create:
+            raise UserInputError("`--resume` is supported only with `create` action")
+
+        if clusters_without_name := [_cluster["name-prefix"] for _cluster in self.clusters if not _cluster.get("name")]:
+            raise UserInputError(
+                f"`--resume` requires cluster `name`, the following clusters use `name-prefix`: {clusters_without_name}"
+            )
+
+    def assert_clusters_scheduling_user_input(self):
+        if self.max_parallel_clusters is not None and (
+            not isinstance(self.max_parallel_clusters, int) or self.max_parallel_clusters < 1
+        ):
+            raise UserInputError(f"Max parallel clusters must be a positive integer, got {self.max_parallel_clusters}")
+
+        acm_clusters_names = set()
+        for _cluster in self.clusters:
+            acm_clusters_names.update(_cluster.get("acm-clusters", []))
+            _priority = _cluster.get("priority", HIGH_PRIORITY_STR)
+            if _priority not in SUPPORTED_CLUSTER_PRIORITIES:
+                raise UserInputError(
+                    f"Cluster priority {_priority} is not supported, supported priorities are {SUPPORTED_CLUSTER_PRIORITIES}"
+                )
+
+        if low_priority_acm_clusters := [
+            _cluster.get("name")
+            for _cluster in self.clusters
+            if _cluster.get("priority") == LOW_PRIORITY_STR and _cluster.get("name") in acm_clusters_names
+        ]:
+            raise UserInputError(
+                f"Clusters attached to ACM hub cannot have {LOW_PRIORITY_STR} priority: {low_priority_acm_clusters}"
+            )
+
+    def assert_admission_control_user_input(self):
+        if not self.admission_control:
+            return
+
+        for _option, _value in (
+            ("process memory", self.admission_control_process_memory),
+            ("max load", self.admission_control_max_load),
+            ("cgroup memory limit", self.admission_control_cgroup_memory_limit or 1),
+        ):
+            if not isinstance(_value, (int, float)) or _value <= 0:
+                raise UserInputError(f"Admission control {_option} must be a positive number, got {_value}")
+
+    def assert_ocm_rate_limit_user_input(self):
+        if not isinstance(self.ocm_rate_limit, (int, float)) or self.ocm_rate_limit <= 0:
+            raise UserInputError(f"OCM rate limit must be a positive number, got {self.ocm_rate_limit}")
+
+    def assert_rosa_backend_user_input(self):
+        if self.rosa_backend not in SUPPORTED_ROSA_BACKENDS:
+            raise UserInputError(
+                f"ROSA backend {self.rosa_backend} is not supported, supported backends are {SUPPORTED_ROSA_BACKENDS}"
+            )
+
+    def assert_hypershift_vpc_provisioner_user_input(self):
+        if self.hypershift_vpc_provisioner not in SUPPORTED_VPC_PROVISIONERS:
+            raise UserInputError(
+                f"Hypershift VPC provisioner {self.hypershift_vpc_provisioner} is not supported, "
+                f"supported provisioners are {SUPPORTED_VPC_PROVISIONERS}"
+            )
+
+    def assert_hypershift_shared_oidc_config_user_input(self):
+        if self.hypershift_shared_oidc_config and not self.s3_bucket_name:
+            raise UserInputError("`--hypershift-shared-oidc-config` requires `--s3-bucket-name`")
+
+    def assert_cluster_pool_user_input(self):
+        if not isinstance(self.cluster_pool_size, int) or self.cluster_pool_size < 0:
+            raise UserInputError(f"Cluster pool size must be a non-negative integer, got {self.cluster_pool_size}")
+
+        if self.action == CLUSTER_POOL_REFILL_STR and self.resume:
+            raise UserInputError(f"`--resume` is not supported with `--action {CLUSTER_POOL_REFILL_STR}`")
+
+    def assert_speculative_clusters_user_input(self):
+        if not self.speculative_clusters:
+            return
+
+        if not isinstance(self.speculative_clusters, int) or self.speculative_clusters < 0:
+            raise UserInputError(
+                f"Speculative clusters must be a non-negative integer, got {self.speculative_clusters}"
+            )
+
+        if self.create and not self.parallel:
+            raise UserInputError("`--speculative-clusters` requires `--parallel`")
+
+    def assert_query_cache_user_input(self):
+        if not isinstance(self.query_cache_ttl, int) or self.query_cache_ttl < 0:
+            raise UserInputError(f"Query cache TTL must be a non-negative integer, got {self.query_cache_ttl}")
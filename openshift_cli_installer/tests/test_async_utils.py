@@ -0,0 +1,89 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from timeout_sampler import TimeoutExpiredError
+
+from openshift_cli_installer.utils.async_utils import run_clusters_action_async, run_command_async, wait_for_async
+
+
+class FakeCluster:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.action = None
+
+    async def create_cluster_async(self, executor):
+        await self._run(action="create")
+
+    async def destroy_cluster_async(self, executor):
+        await self._run(action="destroy")
+
+    async def hibernate_cluster_async(self, executor):
+        await self._run(action="hibernate")
+
+    async def _run(self, action):
+        self.action = action
+        await asyncio.sleep(0)
+        if self.fail:
+            raise ValueError(f"{action} failed")
+
+
+def test_wait_for_async():
+    samples = iter([None, False, "ready"])
+
+    async def _wait():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return await wait_for_async(func=lambda: next(samples), wait_timeout=5, sleep=0, executor=executor)
+
+    assert asyncio.run(_wait()) == "ready"
+
+
+def test_wait_for_async_timeout():
+    async def _wait():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            await wait_for_async(func=lambda: False, wait_timeout=0.1, sleep=0.05, executor=executor)
+
+    with pytest.raises(TimeoutExpiredError):
+        asyncio.run(_wait())
+
+
+@pytest.mark.parametrize(
+    "command, expected",
+    [
+        (["echo", "test"], (True, "test\n", "")),
+        (["false"], (False, "", "")),
+    ],
+)
+def test_run_command_async(command, expected):
+    assert asyncio.run(run_command_async(command=command)) == expected
+
+
+@pytest.mark.parametrize("action", ["create", "destroy", "hibernate"])
+def test_run_clusters_action_async(action):
+    good_cluster, bad_cluster = FakeCluster(), FakeCluster(fail=True)
+    results = run_clusters_action_async(clusters=[good_cluster, bad_cluster], action=action, max_workers=1)
+
+    assert results[good_cluster] is None
+    assert isinstance(results[bad_cluster], ValueError)
+    assert good_cluster.action == bad_cluster.action == action
+
+
+def test_run_clusters_action_async_hooks():
+    skipped_cluster, good_cluster, bad_cluster = FakeCluster(), FakeCluster(), FakeCluster(fail=True)
+    done = {}
+
+    def _before_action(cluster):
+        if cluster is skipped_cluster:
+            raise ValueError("skipped")
+
+    results = run_clusters_action_async(
+        clusters=[skipped_cluster, good_cluster, bad_cluster],
+        action="create",
+        max_workers=1,
+        before_action=_before_action,
+        on_done=lambda cluster, exception: done.update({cluster: exception}),
+    )
+
+    assert skipped_cluster.action is None
+    assert isinstance(results[skipped_cluster], ValueError)
+    assert done == results
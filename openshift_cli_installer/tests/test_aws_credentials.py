@@ -0,0 +1,32 @@
+import pytest
+
+from openshift_cli_installer.utils.aws_credentials import verify_aws_credentials_regions
+
+
+@pytest.fixture()
+def verify_region(mocker, monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "AKIA123")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "secret")
+    return mocker.patch("openshift_cli_installer.utils.aws_credentials.verify_aws_region_credentials")
+
+
+def test_verify_aws_credentials_regions_cached(tmp_path, verify_region):
+    verify_aws_credentials_regions(regions={"us-east-1", "us-east-2"}, cache_dir=str(tmp_path))
+    assert verify_region.call_count == 2
+
+    verify_aws_credentials_regions(regions={"us-east-1", "us-east-2", "eu-west-1"}, cache_dir=str(tmp_path))
+    assert verify_region.call_count == 3
+    verify_region.assert_called_with("eu-west-1")
+
+    verify_aws_credentials_regions(regions={"us-east-1"}, cache_dir=str(tmp_path), bypass_cache=True)
+    assert verify_region.call_count == 4
+
+
+def test_verify_aws_credentials_regions_failure_not_cached(tmp_path, verify_region):
+    verify_region.side_effect = ValueError("invalid credentials")
+    with pytest.raises(ValueError):
+        verify_aws_credentials_regions(regions={"us-east-1"}, cache_dir=str(tmp_path))
+
+    verify_region.side_effect = None
+    verify_aws_credentials_regions(regions={"us-east-1"}, cache_dir=str(tmp_path))
+    assert verify_region.call_count == 2
@@ -0,0 +1,39 @@
+from types import SimpleNamespace
+
+import pytest
+
+from openshift_cli_installer.utils.aws_roles import clear_iam_roles_cache, get_missing_iam_roles
+
+
+class NoSuchEntityException(Exception):
+    pass
+
+
+@pytest.fixture()
+def iam_client(mocker):
+    existing_roles = {"installer-role", "support-role"}
+
+    def _get_role(RoleName):
+        if RoleName not in existing_roles:
+            raise NoSuchEntityException(RoleName)
+
+        return {"Role": {"RoleName": RoleName}}
+
+    clear_iam_roles_cache()
+    yield SimpleNamespace(
+        get_role=mocker.Mock(side_effect=_get_role),
+        exceptions=SimpleNamespace(NoSuchEntityException=NoSuchEntityException),
+    )
+    clear_iam_roles_cache()
+
+
+def test_get_missing_iam_roles_cached_per_account(iam_client):
+    role_names = {"installer-role", "support-role", "worker-role"}
+
+    for _ in range(2):
+        assert get_missing_iam_roles(role_names=role_names, aws_account_id="123", client=iam_client) == {"worker-role"}
+
+    assert iam_client.get_role.call_count == 3
+
+    get_missing_iam_roles(role_names=role_names, aws_account_id="456", client=iam_client)
+    assert iam_client.get_role.call_count == 6
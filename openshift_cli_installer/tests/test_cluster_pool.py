@@ -0,0 +1,261 @@
+import os
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import boto3
+import click
+import pytest
+
+from openshift_cli_installer.cli_entrypoint import reap_dead_pool_clusters
+from openshift_cli_installer.libs.clusters.ocm_cluster import OcmCluster
+from openshift_cli_installer.libs.clusters.ocp_cluster import OCPCluster
+from openshift_cli_installer.utils.cluster_pool import (
+    LocalClusterPoolStore,
+    S3ClusterPoolStore,
+    cluster_pool_refill_clusters,
+    cluster_pool_spec_hash,
+)
+
+ROSA_CLUSTER = {"name": "rosa1", "platform": "rosa", "region": "us-east-2", "version": "4.15", "replicas": 2}
+
+
+def _cluster_dir(tmp_path, name):
+    cluster_dir = tmp_path / "clusters" / name
+    (cluster_dir / "auth").mkdir(parents=True)
+    (cluster_dir / "auth" / "kubeconfig").write_text(name)
+    (cluster_dir / "cluster_data.yaml").write_text(f"cluster:\n  name: {name}\ncluster_info:\n  name: {name}\n")
+    return str(cluster_dir)
+
+
+def _claim_and_check(cluster_pool_store, tmp_path, spec_hash, expected_name):
+    target_dir = str(tmp_path / "claimed" / expected_name)
+    assert cluster_pool_store.claim(spec_hash=spec_hash, cluster_dir=target_dir) == expected_name
+    with open(os.path.join(target_dir, "auth", "kubeconfig")) as fd:
+        assert fd.read() == expected_name
+
+
+def test_cluster_pool_spec_hash():
+    spec_hash = cluster_pool_spec_hash(cluster=ROSA_CLUSTER)
+    assert cluster_pool_spec_hash(cluster={**ROSA_CLUSTER, "name": "rosa2", "timeout": "2h"}) == spec_hash
+    assert cluster_pool_spec_hash(cluster={**ROSA_CLUSTER, "version": "4.16"}) != spec_hash
+    assert cluster_pool_spec_hash(cluster={**ROSA_CLUSTER, "cluster-pool-spec-hash": "abc"}) == "abc"
+
+
+def test_local_cluster_pool_store_claim(tmp_path):
+    cluster_pool_store = LocalClusterPoolStore(pool_dir=str(tmp_path / "pool"))
+    spec_hash = cluster_pool_spec_hash(cluster=ROSA_CLUSTER)
+    for _name in ("pool-a", "pool-b"):
+        cluster_dir = _cluster_dir(tmp_path=tmp_path, name=_name)
+        cluster_pool_store.add(spec_hash=spec_hash, cluster_name=_name, cluster_dir=cluster_dir)
+        assert not os.path.exists(cluster_dir)
+
+    assert cluster_pool_store.available(spec_hash=spec_hash) == ["pool-a", "pool-b"]
+    assert not cluster_pool_store.available(spec_hash="other-spec")
+
+    _claim_and_check(
+        cluster_pool_store=cluster_pool_store, tmp_path=tmp_path, spec_hash=spec_hash, expected_name="pool-a"
+    )
+    _claim_and_check(
+        cluster_pool_store=cluster_pool_store, tmp_path=tmp_path, spec_hash=spec_hash, expected_name="pool-b"
+    )
+    assert cluster_pool_store.claim(spec_hash=spec_hash, cluster_dir=str(tmp_path / "miss")) is None
+
+
+def test_local_cluster_pool_store_claimed_by_another_run(tmp_path, mocker):
+    cluster_pool_store = LocalClusterPoolStore(pool_dir=str(tmp_path / "pool"))
+    cluster_pool_store.add(
+        spec_hash="spec", cluster_name="pool-a", cluster_dir=_cluster_dir(tmp_path=tmp_path, name="pool-a")
+    )
+    # Listed before another run renamed it
+    mocker.patch.object(cluster_pool_store, "available", return_value=["pool-gone", "pool-a"])
+    _claim_and_check(cluster_pool_store=cluster_pool_store, tmp_path=tmp_path, spec_hash="spec", expected_name="pool-a")
+
+
+def test_claim_pooled_cluster_parks_dead_clusters(tmp_path, mocker):
+    cluster_pool_store = LocalClusterPoolStore(pool_dir=str(tmp_path / "pool"))
+    for _name in ("pool-a", "pool-b"):
+        cluster_pool_store.add(
+            spec_hash="spec", cluster_name=_name, cluster_dir=_cluster_dir(tmp_path=tmp_path, name=_name)
+        )
+
+    cluster_dir = str(tmp_path / "rosa1")
+    ocp_cluster = mocker.Mock(log_prefix="", pool_spec_hash="spec", cluster_info={"cluster-dir": cluster_dir})
+    ocp_cluster.is_pooled_cluster_alive.side_effect = lambda pool_cluster_info, kubeconfig_path: (
+        pool_cluster_info["name"] == "pool-b"
+    )
+
+    assert OCPCluster.claim_pooled_cluster(ocp_cluster, cluster_pool_store=cluster_pool_store)
+    assert ocp_cluster.cluster_info["name"] == "pool-b"
+    assert ocp_cluster.cluster_info["kubeconfig-path"] == os.path.join(cluster_dir, "auth", "kubeconfig")
+    with open(ocp_cluster.cluster_info["kubeconfig-path"]) as fd:
+        assert fd.read() == "pool-b"
+
+    assert not cluster_pool_store.available(spec_hash="spec")
+    assert cluster_pool_store.dead(spec_hash="spec") == ["pool-a"]
+    assert not OCPCluster.claim_pooled_cluster(ocp_cluster, cluster_pool_store=cluster_pool_store)
+
+
+def test_reap_dead_pool_clusters(tmp_path, mocker):
+    cluster_pool_store = LocalClusterPoolStore(pool_dir=str(tmp_path / "pool"))
+    for _name in ("pool-a", "pool-b"):
+        cluster_pool_store.park_dead(
+            spec_hash="spec", cluster_name=_name, cluster_dir=_cluster_dir(tmp_path=tmp_path, name=_name)
+        )
+
+    ocp_clusters = mocker.patch("openshift_cli_installer.cli_entrypoint.OCPClusters")
+    ocp_clusters.return_value.clusters_status = {"pool-a": "destroyed", "pool-b": "failed"}
+    ocp_clusters.return_value.run_create_or_destroy_clusters.side_effect = click.Abort()
+    user_input = SimpleNamespace(cluster_pool_store=cluster_pool_store, create=True)
+
+    reap_dead_pool_clusters(user_input=user_input, spec_hashes={"spec", "other-spec"})
+
+    destroy_user_input = ocp_clusters.call_args.kwargs["user_input"]
+    assert destroy_user_input.action == "destroy" and not destroy_user_input.create
+    assert sorted(_cluster["cluster_info"]["name"] for _cluster in destroy_user_input.clusters) == ["pool-a", "pool-b"]
+    # Failed to destroy, kept for the next refill
+    assert cluster_pool_store.dead(spec_hash="spec") == ["pool-b"]
+    assert user_input.create
+
+
+@pytest.mark.parametrize(
+    "expiration_delta, state, alive",
+    [
+        pytest.param(timedelta(hours=1), "ready", True, id="ready"),
+        pytest.param(timedelta(hours=-1), "ready", False, id="expired"),
+        pytest.param(timedelta(hours=1), "hibernating", False, id="not-ready"),
+        pytest.param(timedelta(hours=1), None, False, id="deleted"),
+    ],
+)
+def test_ocm_pooled_cluster_alive(mocker, expiration_delta, state, alive):
+    ocm_cluster = mocker.Mock(log_prefix="")
+    ocm_cluster.ocm_client.api_clusters_mgmt_v1_clusters_get.return_value = SimpleNamespace(
+        items=[SimpleNamespace(name="pool-a", state=state)] if state else []
+    )
+    pool_cluster_info = {"name": "pool-a", "expiration-time": f"{(datetime.now() + expiration_delta).isoformat()}Z"}
+
+    assert (
+        OcmCluster.is_pooled_cluster_alive(ocm_cluster, pool_cluster_info=pool_cluster_info, kubeconfig_path="")
+        is alive
+    )
+
+
+def test_cluster_pool_refill_clusters(tmp_path):
+    cluster_pool_store = LocalClusterPoolStore(pool_dir=str(tmp_path / "pool"))
+    spec_hash = cluster_pool_spec_hash(cluster=ROSA_CLUSTER)
+    cluster_pool_store.add(
+        spec_hash=spec_hash, cluster_name="pool-a", cluster_dir=_cluster_dir(tmp_path=tmp_path, name="pool-a")
+    )
+
+    refill_clusters = cluster_pool_refill_clusters(
+        clusters=[ROSA_CLUSTER], cluster_pool_store=cluster_pool_store, size=3
+    )
+
+    assert len(refill_clusters) == 2
+    for _cluster in refill_clusters:
+        assert "name" not in _cluster
+        assert _cluster["name-prefix"] == "pool"
+        assert cluster_pool_spec_hash(cluster=_cluster) == spec_hash
+
+
+@pytest.fixture()
+def s3_cluster_pool_store(monkeypatch):
+    moto = pytest.importorskip("moto")
+    for _env, _value in (
+        ("AWS_ACCESS_KEY_ID", "testing"),
+        ("AWS_SECRET_ACCESS_KEY", "testing"),
+        ("AWS_DEFAULT_REGION", "us-east-1"),
+    ):
+        monkeypatch.setenv(_env, _value)
+
+    with moto.mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket="pool-bucket")
+        yield S3ClusterPoolStore(s3_bucket_name="pool-bucket", s3_bucket_path="ci", client=client)
+
+
+def test_s3_cluster_pool_store_claim_once(tmp_path, s3_cluster_pool_store):
+    cluster_pool_store = s3_cluster_pool_store
+    cluster_pool_store.add(
+        spec_hash="spec", cluster_name="pool-a", cluster_dir=_cluster_dir(tmp_path=tmp_path, name="pool-a")
+    )
+    assert cluster_pool_store.available(spec_hash="spec") == ["pool-a"]
+
+    # Another run already claimed it
+    other_run_store = S3ClusterPoolStore(
+        s3_bucket_name="pool-bucket", s3_bucket_path="ci", client=cluster_pool_store.client
+    )
+    assert other_run_store._try_claim(spec_hash="spec", cluster_name="pool-a")
+    assert cluster_pool_store.claim(spec_hash="spec", cluster_dir=str(tmp_path / "miss")) is None
+
+    cluster_pool_store.add(
+        spec_hash="spec", cluster_name="pool-b", cluster_dir=_cluster_dir(tmp_path=tmp_path, name="pool-b")
+    )
+    _claim_and_check(cluster_pool_store=cluster_pool_store, tmp_path=tmp_path, spec_hash="spec", expected_name="pool-b")
+    assert "pool-b" not in cluster_pool_store.available(spec_hash="spec")
+
+
+def test_s3_cluster_pool_store_returned_cluster_is_claimed_again(tmp_path, s3_cluster_pool_store):
+    cluster_pool_store = s3_cluster_pool_store
+    cluster_pool_store.add(
+        spec_hash="spec", cluster_name="pool-a", cluster_dir=_cluster_dir(tmp_path=tmp_path, name="pool-a")
+    )
+    _claim_and_check(cluster_pool_store=cluster_pool_store, tmp_path=tmp_path, spec_hash="spec", expected_name="pool-a")
+
+    # Returned to the pool on create rollback
+    cluster_pool_store.add(spec_hash="spec", cluster_name="pool-a", cluster_dir=str(tmp_path / "claimed" / "pool-a"))
+    assert cluster_pool_store.available(spec_hash="spec") == ["pool-a"]
+    _claim_and_check(cluster_pool_store=cluster_pool_store, tmp_path=tmp_path, spec_hash="spec", expected_name="pool-a")
+
+
+def test_s3_cluster_pool_store_dead_clusters(tmp_path, s3_cluster_pool_store):
+    cluster_pool_store = s3_cluster_pool_store
+    cluster_pool_store.add(
+        spec_hash="spec", cluster_name="pool-a", cluster_dir=_cluster_dir(tmp_path=tmp_path, name="pool-a")
+    )
+    _claim_and_check(cluster_pool_store=cluster_pool_store, tmp_path=tmp_path, spec_hash="spec", expected_name="pool-a")
+
+    cluster_pool_store.park_dead(
+        spec_hash="spec", cluster_name="pool-a", cluster_dir=str(tmp_path / "claimed" / "pool-a")
+    )
+    assert cluster_pool_store.dead(spec_hash="spec") == ["pool-a"]
+    assert not cluster_pool_store.available(spec_hash="spec")
+
+    cluster_pool_store.fetch_dead(spec_hash="spec", cluster_name="pool-a", cluster_dir=str(tmp_path / "dead"))
+    with open(os.path.join(tmp_path, "dead", "auth", "kubeconfig")) as fd:
+        assert fd.read() == "pool-a"
+
+    cluster_pool_store.remove_dead(spec_hash="spec", cluster_name="pool-a")
+    assert not cluster_pool_store.dead(spec_hash="spec")
+
+
+def test_s3_cluster_pool_store_stale_claim_is_broken(tmp_path, s3_cluster_pool_store, mocker):
+    cluster_pool_store = s3_cluster_pool_store
+    cluster_pool_store.add(
+        spec_hash="spec", cluster_name="pool-a", cluster_dir=_cluster_dir(tmp_path=tmp_path, name="pool-a")
+    )
+    # Claimant killed before the cluster zip was deleted
+    assert cluster_pool_store._try_claim(spec_hash="spec", cluster_name="pool-a")
+    assert not cluster_pool_store.available(spec_hash="spec")
+    assert cluster_pool_store.claim(spec_hash="spec", cluster_dir=str(tmp_path / "miss")) is None
+
+    mocker.patch("openshift_cli_installer.utils.cluster_pool.CLUSTER_POOL_CLAIM_STALE_TIMEOUT", -1)
+    assert cluster_pool_store.available(spec_hash="spec") == ["pool-a"]
+    _claim_and_check(cluster_pool_store=cluster_pool_store, tmp_path=tmp_path, spec_hash="spec", expected_name="pool-a")
+
+
+def test_s3_cluster_pool_store_claim_released_on_destroy(tmp_path, s3_cluster_pool_store, mocker):
+    cluster_pool_store = s3_cluster_pool_store
+    cluster_pool_store.add(
+        spec_hash="spec", cluster_name="pool-a", cluster_dir=_cluster_dir(tmp_path=tmp_path, name="pool-a")
+    )
+    ocp_cluster = mocker.Mock(log_prefix="", pool_spec_hash="spec", cluster_info={"cluster-dir": str(tmp_path / "c1")})
+    ocp_cluster.is_pooled_cluster_alive.return_value = True
+    assert OCPCluster.claim_pooled_cluster(ocp_cluster, cluster_pool_store=cluster_pool_store)
+    assert ocp_cluster.cluster_info["cluster-pool-claim"] == cluster_pool_store.claim_info(spec_hash="spec")
+    claims_prefix = "ci/cluster-pool/spec/claims/"
+    assert cluster_pool_store.client.list_objects_v2(Bucket="pool-bucket", Prefix=claims_prefix)["KeyCount"] == 1
+
+    mocker.patch("openshift_cli_installer.utils.cluster_pool.s3_client", return_value=cluster_pool_store.client)
+    OCPCluster.delete_cluster_s3_buckets(ocp_cluster)
+
+    assert cluster_pool_store.client.list_objects_v2(Bucket="pool-bucket", Prefix=claims_prefix)["KeyCount"] == 0
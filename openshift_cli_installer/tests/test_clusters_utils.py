@@ -0,0 +1,39 @@
+import os
+from types import SimpleNamespace
+
+import yaml
+
+from openshift_cli_installer.utils.clusters import (
+    get_existing_ocm_clusters_names,
+    power_state_clusters_from_s3_bucket_or_local_directory,
+)
+from openshift_cli_installer.utils.const import CLUSTER_DATA_YAML_FILENAME
+
+
+def test_get_existing_ocm_clusters_names(mocker):
+    mocker.patch("openshift_cli_installer.utils.clusters.OCM_SEARCH_PAGE_SIZE", 2)
+    ocm_client = mocker.Mock()
+    ocm_client.api_clusters_mgmt_v1_clusters_get.side_effect = [
+        SimpleNamespace(items=[SimpleNamespace(name="c2")]),
+        SimpleNamespace(items=[]),
+    ]
+
+    assert get_existing_ocm_clusters_names(ocm_client=ocm_client, names=["c1", "c2", "c3"]) == ["c2"]
+    assert ocm_client.api_clusters_mgmt_v1_clusters_get.call_args_list == [
+        mocker.call(search="name in ('c1', 'c2')", size=2),
+        mocker.call(search="name in ('c3')", size=1),
+    ]
+
+
+def test_power_state_clusters_from_local_directory(tmp_path):
+    for _name, _platform in (("rosa-cl", "rosa"), ("hcp-cl", "hypershift"), ("ipi-cl", "aws")):
+        cluster_dir = tmp_path / _platform / _name
+        cluster_dir.mkdir(parents=True)
+        with open(os.path.join(cluster_dir, CLUSTER_DATA_YAML_FILENAME), "w") as fd:
+            yaml.dump({"cluster": {"platform": _platform}, "cluster_info": {"name": _name, "platform": _platform}}, fd)
+
+    user_input = SimpleNamespace(action="hibernate", s3_bucket_name=None, clusters_install_data_directory=str(tmp_path))
+    updated_user_input = power_state_clusters_from_s3_bucket_or_local_directory(user_input=user_input)
+
+    assert updated_user_input.action == "hibernate"
+    assert [_cluster["cluster_info"]["name"] for _cluster in updated_user_input.clusters] == ["rosa-cl"]
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+from timeout_sampler import TimeoutExpiredError
+
+from openshift_cli_installer.utils.host_admission import GIB, HostResourcesAdmission
+
+
+@pytest.fixture
+def admission(mocker):
+    mocker.patch.object(HostResourcesAdmission, "available_memory_bytes", return_value=6 * GIB)
+    mocker.patch.object(HostResourcesAdmission, "load_per_cpu", return_value=0.5)
+    return HostResourcesAdmission(process_memory_gib=4, max_load_per_cpu=1.0, poll_interval=0.01)
+
+
+def test_host_resources_admission_first_process_always_admitted(admission, mocker):
+    mocker.patch.object(HostResourcesAdmission, "available_memory_bytes", return_value=0)
+    with admission.admit(name="test", wait_timeout=1):
+        assert admission.running_processes == 1
+
+    assert admission.running_processes == 0
+
+
+def test_host_resources_admission_reserves_ramping_up_process_memory(admission):
+    with admission.admit(name="first", wait_timeout=1):
+        with pytest.raises(TimeoutExpiredError):
+            with admission.admit(name="second", wait_timeout=0.05):
+                pass
+
+    with admission.admit(name="second", wait_timeout=1):
+        assert admission.running_processes == 1
+
+
+def test_host_resources_admission_high_load(admission, mocker):
+    admission.ramp_up_seconds = 0
+    with admission.admit(name="first", wait_timeout=1):
+        assert admission.try_admit(token="second")
+        admission.release(token="second")
+
+        mocker.patch.object(HostResourcesAdmission, "load_per_cpu", return_value=2.0)
+        assert not admission.try_admit(token="second")
+
+
+def test_host_resources_admission_async(admission):
+    async def _admit():
+        async with admission.admit_async(name="test", wait_timeout=1):
+            return admission.running_processes
+
+    assert asyncio.run(_admit()) == 1
+    assert admission.running_processes == 0
+
+
+@pytest.mark.parametrize(
+    "cgroup_memory_limit_gib, systemd_run, expected",
+    [
+        (None, "/usr/bin/systemd-run", ["openshift-install"]),
+        (8, None, ["openshift-install"]),
+        (
+            8,
+            "/usr/bin/systemd-run",
+            ["systemd-run", "--scope", "--quiet", "--collect", "-p", "MemoryMax=8G", "--", "openshift-install"],
+        ),
+    ],
+)
+def test_host_resources_admission_limit_command(mocker, cgroup_memory_limit_gib, systemd_run, expected):
+    mocker.patch("openshift_cli_installer.utils.host_admission.shutil.which", return_value=systemd_run)
+    mocker.patch("openshift_cli_installer.utils.host_admission.os.geteuid", return_value=0)
+    admission = HostResourcesAdmission(
+        process_memory_gib=4, max_load_per_cpu=1.0, cgroup_memory_limit_gib=cgroup_memory_limit_gib
+    )
+
+    assert admission.limit_command(command=["openshift-install"]) == expected
@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta, timezone
+
+import boto3
+import pytest
+
+from openshift_cli_installer.utils.hypershift_shared_iam import HypershiftSharedIamRegistry
+
+SHARED_IAM = {"oidc_config_id": "oidc1", "operator_roles_prefix": "ocli-us-east-2-abcd"}
+
+
+@pytest.fixture()
+def registry(monkeypatch):
+    moto = pytest.importorskip("moto")
+    for _env, _value in (
+        ("AWS_ACCESS_KEY_ID", "testing"),
+        ("AWS_SECRET_ACCESS_KEY", "testing"),
+        ("AWS_DEFAULT_REGION", "us-east-1"),
+    ):
+        monkeypatch.setenv(_env, _value)
+
+    with moto.mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket="iam-bucket")
+        yield HypershiftSharedIamRegistry(s3_bucket_name="iam-bucket", s3_bucket_path="ci", client=client)
+
+
+def test_shared_iam_created_once_and_reference_counted(registry, mocker):
+    create_func = mocker.Mock(return_value=SHARED_IAM)
+    delete_func = mocker.Mock()
+
+    for _cluster_name in ("hcp1", "hcp2", "hcp2"):
+        assert (
+            registry.acquire(
+                aws_account_id="123", region="us-east-2", cluster_name=_cluster_name, create_func=create_func
+            )
+            == SHARED_IAM
+        )
+
+    create_func.assert_called_once()
+    # Another host sees the same references
+    other_host_registry = HypershiftSharedIamRegistry(
+        s3_bucket_name="iam-bucket", s3_bucket_path="ci", client=registry.client
+    )
+    assert (
+        other_host_registry.release(
+            aws_account_id="123", region="us-east-2", cluster_name="hcp1", delete_func=delete_func
+        )
+        == 1
+    )
+    assert registry.release(aws_account_id="123", region="us-east-2", cluster_name="hcp1", delete_func=delete_func) == 1
+    delete_func.assert_not_called()
+
+    # Deleted with the last cluster using them
+    assert registry.release(aws_account_id="123", region="us-east-2", cluster_name="hcp2", delete_func=delete_func) == 0
+    delete_func.assert_called_once_with(**SHARED_IAM)
+
+    registry.acquire(aws_account_id="123", region="us-east-2", cluster_name="hcp3", create_func=create_func)
+    assert create_func.call_count == 2
+
+
+def test_shared_iam_per_account_and_region(registry, mocker):
+    create_func = mocker.Mock(return_value=SHARED_IAM)
+
+    registry.acquire(aws_account_id="123", region="us-east-2", cluster_name="hcp1", create_func=create_func)
+    registry.acquire(aws_account_id="123", region="us-west-2", cluster_name="hcp2", create_func=create_func)
+    registry.acquire(aws_account_id="456", region="us-east-2", cluster_name="hcp3", create_func=create_func)
+
+    assert create_func.call_count == 3
+
+
+def test_shared_iam_stale_lock_is_broken(registry, mocker):
+    lock_key = "ci/hypershift-shared-iam/123-us-east-2.json.lock"
+    registry.client.put_object(Bucket="iam-bucket", Key=lock_key, Body=b"")
+    assert not registry._try_lock(lock_key=lock_key)
+
+    mocker.patch.object(
+        registry.client,
+        "head_object",
+        return_value={"LastModified": datetime.now(tz=timezone.utc) - timedelta(hours=1)},
+    )
+    assert not registry._try_lock(lock_key=lock_key)
+    assert registry._try_lock(lock_key=lock_key)
@@ -0,0 +1,59 @@
+import boto3
+import pytest
+
+from openshift_cli_installer.utils.hypershift_vpc import HypershiftVpcProvisioner, hypershift_az_ids
+
+moto = pytest.importorskip("moto")
+
+REGION = "us-east-2"
+
+
+@pytest.fixture()
+def aws_env(monkeypatch):
+    for _env, _value in (
+        ("AWS_ACCESS_KEY_ID", "testing"),
+        ("AWS_SECRET_ACCESS_KEY", "testing"),
+        ("AWS_DEFAULT_REGION", REGION),
+    ):
+        monkeypatch.setenv(_env, _value)
+
+    with moto.mock_aws():
+        yield boto3.client("ec2", region_name=REGION)
+
+
+def test_hypershift_az_ids():
+    assert hypershift_az_ids(region="us-east-2") == ["use2-az1", "use2-az2"]
+
+
+def test_hypershift_vpc_create_and_destroy(aws_env):
+    provisioner = HypershiftVpcProvisioner(
+        cluster_name="hcp1", region=REGION, private_subnets="10.0.1.0/24,10.0.2.0/24"
+    )
+    subnets = provisioner.create()
+
+    assert len(subnets["public_subnets"]) == len(subnets["private_subnets"]) == 2
+    # Create is idempotent, existing tagged resources are reused
+    assert provisioner.create() == subnets
+
+    cluster_filter = [{"Name": "tag:openshift-cli-installer/cluster", "Values": ["hcp1"]}]
+    (vpc,) = aws_env.describe_vpcs(Filters=cluster_filter)["Vpcs"]
+    assert (
+        aws_env.describe_vpc_attribute(VpcId=vpc["VpcId"], Attribute="enableDnsHostnames")["EnableDnsHostnames"][
+            "Value"
+        ]
+        is True
+    )
+    public_route_table = aws_env.describe_route_tables(
+        Filters=cluster_filter + [{"Name": "tag:openshift-cli-installer/role", "Values": ["public-rtb"]}]
+    )["RouteTables"][0]
+    assert {_association["SubnetId"] for _association in public_route_table["Associations"]} == set(
+        subnets["public_subnets"]
+    )
+    assert any(_route.get("GatewayId", "").startswith("igw-") for _route in public_route_table["Routes"])
+
+    provisioner.destroy()
+
+    assert not aws_env.describe_vpcs(Filters=cluster_filter)["Vpcs"]
+    assert not aws_env.describe_subnets(Filters=cluster_filter)["Subnets"]
+    assert not aws_env.describe_internet_gateways(Filters=cluster_filter)["InternetGateways"]
+    assert not aws_env.describe_addresses(Filters=cluster_filter)["Addresses"]
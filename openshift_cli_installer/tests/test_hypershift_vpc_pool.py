@@ -0,0 +1,59 @@
+import boto3
+import pytest
+
+from openshift_cli_installer.utils.hypershift_vpc_pool import HypershiftVpcPool
+
+moto = pytest.importorskip("moto")
+
+REGION = "us-east-2"
+
+
+@pytest.fixture()
+def vpc_pool(monkeypatch):
+    for _env, _value in (
+        ("AWS_ACCESS_KEY_ID", "testing"),
+        ("AWS_SECRET_ACCESS_KEY", "testing"),
+        ("AWS_DEFAULT_REGION", REGION),
+    ):
+        monkeypatch.setenv(_env, _value)
+
+    with moto.mock_aws():
+        yield HypershiftVpcPool(region=REGION, client=boto3.client("ec2", region_name=REGION), lease_settle_seconds=0)
+
+
+def test_hypershift_vpc_pool_refill(vpc_pool):
+    assert len(vpc_pool.refill(size=2)) == 2
+    assert vpc_pool.refill(size=2) == []
+    assert len(vpc_pool.available_vpcs()) == 2
+
+
+def test_hypershift_vpc_pool_claim_and_release(vpc_pool):
+    vpc_pool.refill(size=2)
+
+    first_vpc = vpc_pool.claim(claimant="hcp1")
+    second_vpc = vpc_pool.claim(claimant="hcp2")
+    assert first_vpc and second_vpc and first_vpc != second_vpc
+    assert vpc_pool.claim(claimant="hcp3") is None
+    assert vpc_pool.available_vpcs() == []
+
+    assert vpc_pool.release(pool_vpc_name=first_vpc)
+    assert vpc_pool.available_vpcs() == [first_vpc]
+    assert vpc_pool.claim(claimant="hcp3") == first_vpc
+
+
+def test_hypershift_vpc_pool_release_in_use_vpc(vpc_pool):
+    vpc_pool.refill(size=1)
+    pool_vpc_name = vpc_pool.claim(claimant="hcp1")
+    subnet_id = vpc_pool.provisioner(pool_vpc_name=pool_vpc_name).create()["private_subnets"][0]
+    network_interface_id = vpc_pool.client.create_network_interface(SubnetId=subnet_id)["NetworkInterface"][
+        "NetworkInterfaceId"
+    ]
+    instance_id = vpc_pool.client.run_instances(ImageId="ami-12c6146b", MinCount=1, MaxCount=1)["Instances"][0][
+        "InstanceId"
+    ]
+    vpc_pool.client.attach_network_interface(
+        NetworkInterfaceId=network_interface_id, InstanceId=instance_id, DeviceIndex=1
+    )
+
+    assert not vpc_pool.release(pool_vpc_name=pool_vpc_name)
+    assert vpc_pool.available_vpcs() == []
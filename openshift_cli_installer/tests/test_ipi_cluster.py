@@ -0,0 +1,32 @@
+import pytest
+
+from openshift_cli_installer.libs.clusters.ipi_cluster import IpiCluster
+from openshift_cli_installer.utils.const import CLUSTER_REQUESTED_PHASE, OPENSHIFT_INSTALL_STATE_FILENAME
+from openshift_cli_installer.utils.lifecycle_journal import LifecycleJournal
+
+
+@pytest.fixture()
+def ipi_cluster(tmp_path, mocker):
+    ipi_cluster = mocker.Mock(log_prefix="", cluster_info={"cluster-dir": str(tmp_path)})
+    ipi_cluster.journal = LifecycleJournal(cluster_dir=str(tmp_path))
+    return ipi_cluster
+
+
+def _installer_create_action(ipi_cluster):
+    ipi_cluster.install_started = IpiCluster.install_started.fget(ipi_cluster)
+    return IpiCluster.installer_create_action.fget(ipi_cluster)
+
+
+def test_ipi_create_resumed_after_install_started(tmp_path, ipi_cluster):
+    ipi_cluster.journal.record(phase=CLUSTER_REQUESTED_PHASE)
+    (tmp_path / OPENSHIFT_INSTALL_STATE_FILENAME).write_text("{}")
+
+    assert _installer_create_action(ipi_cluster=ipi_cluster) == "wait-for-install"
+
+
+def test_ipi_create_rerun_when_install_did_not_start(ipi_cluster):
+    assert _installer_create_action(ipi_cluster=ipi_cluster) == "create"
+    assert ipi_cluster.journal.is_completed(CLUSTER_REQUESTED_PHASE)
+
+    # Crashed before `openshift-install` wrote its state
+    assert _installer_create_action(ipi_cluster=ipi_cluster) == "create"
@@ -0,0 +1,35 @@
+from openshift_cli_installer.utils.const import (
+    CLUSTER_REQUESTED_PHASE,
+    OIDC_CREATED_PHASE,
+    VERSION_RESOLVED_PHASE,
+)
+from openshift_cli_installer.utils.lifecycle_journal import LifecycleJournal
+
+
+def test_lifecycle_journal_record(tmp_path):
+    journal = LifecycleJournal(cluster_dir=tmp_path)
+    journal.record(phase=VERSION_RESOLVED_PHASE, version="4.15.8", shortuuid="abc")
+    journal.record(phase=OIDC_CREATED_PHASE, oidc_config_id="123")
+
+    resumed_journal = LifecycleJournal(cluster_dir=tmp_path)
+    assert resumed_journal.completed_phases == [VERSION_RESOLVED_PHASE, OIDC_CREATED_PHASE]
+    assert resumed_journal.data == {"version": "4.15.8", "shortuuid": "abc", "oidc_config_id": "123"}
+    assert not resumed_journal.is_completed(phase=CLUSTER_REQUESTED_PHASE)
+
+
+def test_lifecycle_journal_ignores_partial_record(tmp_path):
+    journal = LifecycleJournal(cluster_dir=tmp_path)
+    journal.record(phase=VERSION_RESOLVED_PHASE, version="4.15.8")
+    with open(journal.journal_file, "a") as fd:
+        fd.write('{"phase": "cluster-req')
+
+    assert journal.completed_phases == [VERSION_RESOLVED_PHASE]
+
+
+def test_lifecycle_journal_clear(tmp_path):
+    journal = LifecycleJournal(cluster_dir=tmp_path)
+    journal.record(phase=VERSION_RESOLVED_PHASE, version="4.15.8")
+    journal.clear()
+
+    assert journal.completed_phases == []
+    assert journal.data == {}
@@ -0,0 +1,68 @@
+import itertools
+
+import pytest
+from ocm_python_client.api_client import ApiClient
+from ocm_python_client.exceptions import ApiException, UnauthorizedException
+
+from openshift_cli_installer.utils.ocm_client_pool import clear_shared_ocm_clients, get_shared_ocm_client
+
+
+@pytest.fixture
+def sso_token_exchange(mocker):
+    tokens = itertools.count()
+    post = mocker.patch("ocm_python_wrapper.ocm_client.requests.post")
+    post.return_value.status_code = 200
+    post.return_value.json.side_effect = lambda: {"access_token": f"access-token-{next(tokens)}"}
+    yield post
+    clear_shared_ocm_clients()
+
+
+def test_get_shared_ocm_client(sso_token_exchange):
+    stage_client = get_shared_ocm_client(ocm_token="123", ocm_env="stage")
+
+    assert get_shared_ocm_client(ocm_token="123", ocm_env="stage") is stage_client
+    assert get_shared_ocm_client(ocm_token="123", ocm_env="production") is not stage_client
+    assert get_shared_ocm_client(ocm_token="456", ocm_env="stage") is not stage_client
+    assert sso_token_exchange.call_count == 3
+
+
+def test_shared_ocm_client_refresh_token_once(sso_token_exchange, mocker):
+    ocm_client = get_shared_ocm_client(ocm_token="123", ocm_env="stage")
+    expired_access_token = ocm_client.client_config.access_token
+
+    def _call_api(*args, **kwargs):
+        if ocm_client.client_config.access_token == expired_access_token:
+            raise UnauthorizedException(status=401)
+
+        return "ok"
+
+    mocker.patch.object(ApiClient, "call_api", side_effect=_call_api)
+    assert ocm_client.call_api("/api/clusters_mgmt/v1/clusters", "GET") == "ok"
+
+    # Another thread failed with the expired token after the refresh, token is not refreshed again
+    ocm_client.refresh_access_token(expired_access_token=expired_access_token)
+    assert sso_token_exchange.call_count == 2
+
+
+def test_shared_ocm_client_token_cache(sso_token_exchange, mocker):
+    token_cache = mocker.patch("openshift_cli_installer.utils.ocm_client_pool.OCMAccessTokenCache")
+    token_cache.return_value.get.return_value = "cached-access-token"
+    ocm_client = get_shared_ocm_client(ocm_token="123", ocm_env="stage", token_cache=True)
+
+    assert ocm_client.client_config.access_token == "cached-access-token"
+    assert sso_token_exchange.call_count == 0
+
+    ocm_client.refresh_access_token(expired_access_token="cached-access-token")
+    token_cache.return_value.set.assert_called_once_with(access_token="access-token-0")
+
+
+def test_shared_ocm_client_retry_throttled_call(sso_token_exchange, mocker):
+    rate_limiter = mocker.patch("openshift_cli_installer.utils.ocm_client_pool.get_ocm_rate_limiter").return_value
+    throttled_exception = ApiException(status=429)
+    throttled_exception.headers = {"Retry-After": "3"}
+    mocker.patch.object(ApiClient, "call_api", side_effect=[throttled_exception, "ok"])
+    ocm_client = get_shared_ocm_client(ocm_token="123", ocm_env="stage")
+
+    assert ocm_client.call_api("/api/clusters_mgmt/v1/clusters", "GET") == "ok"
+    rate_limiter.throttled.assert_called_once_with(retry_after=3)
+    assert rate_limiter.acquire.call_count == 2
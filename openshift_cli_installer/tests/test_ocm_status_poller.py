@@ -0,0 +1,72 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+from timeout_sampler import TimeoutExpiredError
+
+from openshift_cli_installer.utils.ocm_status_poller import OCMClustersStatusPoller
+
+
+class FakeOCMClient:
+    def __init__(self, clusters_states):
+        self.clusters_states = clusters_states
+        self.searches = []
+
+    def api_clusters_mgmt_v1_clusters_get(self, search, size):
+        self.searches.append(search)
+        return SimpleNamespace(
+            items=[
+                SimpleNamespace(name=_name, id=f"{_name}-id", state=_state)
+                for _name, _state in self.clusters_states.items()
+                if f"'{_name}'" in search and _state
+            ]
+        )
+
+
+def is_ready(ocm_cluster):
+    return ocm_cluster and ocm_cluster.state == "ready"
+
+
+def test_ocm_clusters_status_poller_wait_for_clusters():
+    ocm_client = FakeOCMClient(clusters_states={"c1": "ready", "c2": "ready", "c3": "installing"})
+    poller = OCMClustersStatusPoller(ocm_client=ocm_client, ocm_env="stage", interval=0.05)
+
+    with ThreadPoolExecutor() as executor:
+        futures = [
+            executor.submit(poller.wait_for_cluster, name=_name, func=is_ready, wait_timeout=5)
+            for _name in ("c1", "c2")
+        ]
+        assert [_future.result().id for _future in futures] == ["c1-id", "c2-id"]
+
+    with pytest.raises(TimeoutExpiredError):
+        poller.wait_for_cluster(name="c3", func=is_ready, wait_timeout=0.2)
+
+    # Every search request covers all the tracked clusters
+    assert len(ocm_client.searches) == poller.api_calls
+    assert poller.api_calls < 10
+
+
+def test_ocm_clusters_status_poller_wait_for_cluster_deletion_async():
+    ocm_client = FakeOCMClient(clusters_states={"c1": "uninstalling"})
+    poller = OCMClustersStatusPoller(ocm_client=ocm_client, ocm_env="stage", interval=0.05)
+
+    async def _wait_for_deletion():
+        ocm_client.clusters_states["c1"] = None
+        return await poller.wait_for_cluster_async(
+            name="c1", func=lambda ocm_cluster: ocm_cluster is None, wait_timeout=5
+        )
+
+    assert asyncio.run(_wait_for_deletion()) is None
+
+
+def test_ocm_clusters_status_poller_func_raises():
+    ocm_client = FakeOCMClient(clusters_states={"c1": "error"})
+    poller = OCMClustersStatusPoller(ocm_client=ocm_client, ocm_env="stage", interval=0.05)
+
+    def _raise_on_error(ocm_cluster):
+        if ocm_cluster.state == "error":
+            raise ValueError("Cluster is in error state")
+
+    with pytest.raises(ValueError):
+        poller.wait_for_cluster(name="c1", func=_raise_on_error, wait_timeout=5)
@@ -0,0 +1,45 @@
+import base64
+import json
+import os
+import time
+
+import pytest
+
+from openshift_cli_installer.utils.ocm_token_cache import OCMAccessTokenCache
+
+
+def access_token(expiry):
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": expiry}).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+@pytest.fixture
+def token_cache(tmp_path):
+    return OCMAccessTokenCache(ocm_token="123", ocm_env="stage", cache_dir=str(tmp_path / "ocm-tokens"))
+
+
+def test_ocm_access_token_cache(token_cache):
+    _access_token = access_token(expiry=int(time.time()) + 3600)
+    token_cache.set(access_token=_access_token)
+
+    assert oct(os.stat(token_cache.cache_file).st_mode & 0o777) == "0o600"
+    assert token_cache.get() == _access_token
+
+
+def test_ocm_access_token_cache_expired(token_cache):
+    token_cache.set(access_token=access_token(expiry=int(time.time()) + 60))
+
+    assert token_cache.get() is None
+
+
+def test_ocm_access_token_cache_not_owner_only(token_cache):
+    token_cache.set(access_token=access_token(expiry=int(time.time()) + 3600))
+    os.chmod(token_cache.cache_file, 0o644)
+
+    assert token_cache.get() is None
+
+
+def test_ocm_access_token_cache_invalid_token(token_cache):
+    token_cache.set(access_token="not-a-jwt")
+
+    assert not os.path.exists(token_cache.cache_file)
@@ -0,0 +1,72 @@
+import functools
+
+import pytest
+
+from openshift_cli_installer.libs.clusters.ocp_clusters import OCPClusters
+
+
+@pytest.fixture
+def ocp_clusters(mocker):
+    ocp_clusters = mocker.Mock(clusters_status={})
+    ocp_clusters.speculative_cluster_done = functools.partial(OCPClusters.speculative_cluster_done, ocp_clusters)
+    return ocp_clusters
+
+
+def _clusters(mocker, names):
+    return [mocker.Mock(pool_spec_hash="spec", cluster_info={"name": _name}) for _name in names]
+
+
+def test_speculative_clusters_first_ready_kept(ocp_clusters, mocker):
+    first, cancelled, surplus = _clusters(mocker=mocker, names=("first", "cancelled", "surplus"))
+    ocp_clusters.speculative_groups = {"spec": {"needed": 1, "clusters": [first, cancelled, surplus], "ready": []}}
+
+    ocp_clusters.speculative_cluster_done(cluster=first, failed=False)
+    cancelled.cancel_create.assert_called_once()
+    surplus.cancel_create.assert_called_once()
+    first.cancel_create.assert_not_called()
+
+    # Finished before noticing the cancellation
+    ocp_clusters.speculative_cluster_done(cluster=surplus, failed=False)
+    ocp_clusters.speculative_cluster_done(cluster=cancelled, failed=True)
+    failed_clusters = OCPClusters.settle_speculative_clusters(ocp_clusters, failed_clusters=[cancelled])
+
+    assert failed_clusters == []
+    assert ocp_clusters.speculative_groups == {}
+    surplus.destroy_cluster.assert_called_once()
+    cancelled.destroy_cluster.assert_not_called()
+    first.destroy_cluster.assert_not_called()
+    assert {_call.kwargs["cluster"] for _call in ocp_clusters.remove_cluster.call_args_list} == {cancelled, surplus}
+
+
+def test_speculative_clusters_not_enough_ready(ocp_clusters, mocker):
+    first, second, extra = _clusters(mocker=mocker, names=("first", "second", "extra"))
+    ocp_clusters.speculative_groups = {"spec": {"needed": 2, "clusters": [first, second, extra], "ready": []}}
+
+    ocp_clusters.speculative_cluster_done(cluster=first, failed=False)
+    ocp_clusters.speculative_cluster_done(cluster=second, failed=True)
+    ocp_clusters.speculative_cluster_done(cluster=extra, failed=True)
+    failed_clusters = OCPClusters.settle_speculative_clusters(ocp_clusters, failed_clusters=[second, extra])
+
+    # One more cluster is needed, the other failed cluster is dropped
+    assert failed_clusters == [second]
+    for _cluster in (first, second, extra):
+        _cluster.cancel_create.assert_not_called()
+
+    ocp_clusters.remove_cluster.assert_called_once_with(cluster=extra)
+
+
+def test_claimed_clusters_returned_to_pool(ocp_clusters, mocker):
+    (claimed,) = _clusters(mocker=mocker, names=("pool-a",))
+    claimed.cluster_info["cluster-dir"] = "/tmp/pool-a"
+    ocp_clusters.claimed_clusters = [claimed]
+    ocp_clusters.clusters_status = {"pool-a": "created"}
+
+    OCPClusters.return_claimed_clusters_to_pool(ocp_clusters)
+
+    # The run backup of the claimed cluster is removed with the claim
+    claimed.delete_cluster_s3_buckets.assert_called_once()
+    ocp_clusters.user_input.cluster_pool_store.add.assert_called_once_with(
+        spec_hash="spec", cluster_name="pool-a", cluster_dir="/tmp/pool-a"
+    )
+    assert ocp_clusters.clusters_status == {}
+    assert ocp_clusters.claimed_clusters == []
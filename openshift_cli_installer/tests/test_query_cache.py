@@ -0,0 +1,66 @@
+import time
+
+from openshift_cli_installer.utils.query_cache import QueryResultsCache
+from openshift_cli_installer.utils.rosa_backends import RosaCliBackend
+
+
+def test_query_cache_get_or_fetch(tmp_path, mocker):
+    query_cache = QueryResultsCache(cache_dir=str(tmp_path), ttl=60)
+    func = mocker.Mock(return_value=["4.15.1"])
+
+    for _ in range(2):
+        assert query_cache.get_or_fetch("list versions", func=func, ocm_env="stage", flags={"hosted_cp": True}) == [
+            "4.15.1"
+        ]
+
+    func.assert_called_once()
+    # Different flags are cached separately
+    query_cache.get_or_fetch("list versions", func=func, ocm_env="stage", flags={"hosted_cp": False})
+    assert func.call_count == 2
+
+
+def test_query_cache_expired(tmp_path, mocker):
+    query_cache = QueryResultsCache(cache_dir=str(tmp_path), ttl=60)
+    query_cache.get_or_fetch("list regions", func=lambda: ["us-east-1"], ocm_env="stage")
+    mocker.patch("openshift_cli_installer.utils.query_cache.time.time", return_value=time.time() + 61)
+
+    assert query_cache.get_or_fetch("list regions", func=lambda: ["us-east-2"], ocm_env="stage") == ["us-east-2"]
+
+
+def test_query_cache_not_usable(tmp_path, mocker):
+    # Cache directory path is a file, the cache directory can not be created
+    cache_dir = tmp_path / "cache"
+    cache_dir.write_text("")
+    query_cache = QueryResultsCache(cache_dir=str(cache_dir), ttl=60)
+    func = mocker.Mock(return_value=["4.15.1"])
+
+    assert query_cache.get_or_fetch("list versions", func=func, ocm_env="stage") == ["4.15.1"]
+    query_cache.set(key="key", result=["4.15.1"])
+    func.assert_called_once()
+
+
+def test_query_cache_bypass(tmp_path):
+    QueryResultsCache(cache_dir=str(tmp_path)).get_or_fetch("list regions", func=lambda: ["us-east-1"])
+    bypass_cache = QueryResultsCache(cache_dir=str(tmp_path), bypass=True)
+
+    assert bypass_cache.get_or_fetch("list regions", func=lambda: ["us-east-2"]) == ["us-east-2"]
+    # Bypass refreshes the cached result
+    assert QueryResultsCache(cache_dir=str(tmp_path)).get_or_fetch("list regions", func=lambda: []) == ["us-east-2"]
+
+
+def test_rosa_backend_cached_query(tmp_path, mocker):
+    execute = mocker.patch(
+        "openshift_cli_installer.utils.rosa_backends.execute_rosa_command",
+        return_value={"out": [{"raw_id": "4.15.1"}]},
+    )
+    backend = RosaCliBackend(
+        ocm_client=None,
+        aws_region="us-east-2",
+        ocm_env="stage",
+        query_cache=QueryResultsCache(cache_dir=str(tmp_path)),
+    )
+
+    for _ in range(2):
+        assert backend.list_versions(channel_group="stable", hosted_cp=False) == ["4.15.1"]
+
+    execute.assert_called_once()
@@ -0,0 +1,76 @@
+import pytest
+from rosa.cli import CommandExecuteError
+
+from openshift_cli_installer.utils.rate_limiter import TokenBucketRateLimiter, parse_retry_after
+from openshift_cli_installer.utils.rosa_commands import execute_rosa_command
+
+
+def test_token_bucket_rate_limiter_reserve():
+    rate_limiter = TokenBucketRateLimiter(rate=10, burst=2)
+
+    assert rate_limiter.reserve() == 0
+    assert rate_limiter.reserve() == 0
+    assert rate_limiter.reserve() == pytest.approx(0.1, abs=0.01)
+    assert rate_limiter.counters["delayed_calls"] == 1
+
+
+def test_token_bucket_rate_limiter_adaptive_rate():
+    rate_limiter = TokenBucketRateLimiter(rate=10)
+    rate_limiter.throttled(retry_after=5)
+
+    assert rate_limiter.rate == 5
+    assert rate_limiter.reserve() == pytest.approx(5, abs=0.1)
+    assert rate_limiter.counters["throttled_calls"] == 1
+
+    for _ in range(20):
+        rate_limiter.succeeded()
+
+    assert rate_limiter.rate == 10
+
+
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        (None, None),
+        ({"Retry-After": "7"}, 7),
+        ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 0),
+        ({"Retry-After": "soon"}, None),
+    ],
+)
+def test_parse_retry_after(headers, expected):
+    assert parse_retry_after(headers=headers) == expected
+
+
+def test_execute_rosa_command_retry_throttled(mocker):
+    rate_limiter = TokenBucketRateLimiter(rate=1000)
+    mocker.patch("openshift_cli_installer.utils.rosa_commands.get_ocm_rate_limiter", return_value=rate_limiter)
+    mocker.patch.object(rate_limiter, "throttled")
+    rosa_execute = mocker.patch(
+        "openshift_cli_installer.utils.rosa_commands.rosa.cli.execute",
+        side_effect=[CommandExecuteError("Failed: status is 429, Too Many Requests"), {"out": "ok", "err": ""}],
+    )
+
+    assert execute_rosa_command(command="list regions", aws_region="us-east-2", ocm_client=None)["out"] == "ok"
+    assert rosa_execute.call_count == 2
+    rate_limiter.throttled.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "command, error",
+    [
+        pytest.param("describe cluster", "Failed: cluster not found", id="not-throttled"),
+        pytest.param("list regions", "Failed: rate limit of the AWS account reached", id="not-ocm-throttling"),
+        pytest.param("create cluster --cluster-name=c1", "Failed: status is 429, Too Many Requests", id="mutating"),
+    ],
+)
+def test_execute_rosa_command_failure_not_retried(mocker, command, error):
+    mocker.patch("openshift_cli_installer.utils.rosa_commands.get_ocm_rate_limiter")
+    rosa_execute = mocker.patch(
+        "openshift_cli_installer.utils.rosa_commands.rosa.cli.execute",
+        side_effect=CommandExecuteError(error),
+    )
+
+    with pytest.raises(CommandExecuteError):
+        execute_rosa_command(command=command, aws_region="us-east-2", ocm_client=None)
+
+    rosa_execute.assert_called_once()
@@ -0,0 +1,88 @@
+import pytest
+from timeout_sampler import TimeoutExpiredError
+
+from openshift_cli_installer.utils.resource_waits import (
+    ResourceWaitStopError,
+    adaptive_sampler,
+    condition_is,
+    status_phase_is,
+    wait_for_resource,
+)
+
+
+def _resource_dict(phase, resource_version="1"):
+    return {
+        "kind": "MultiClusterHub",
+        "metadata": {"name": "multiclusterhub", "resourceVersion": resource_version},
+        "status": {"phase": phase},
+    }
+
+
+@pytest.fixture
+def resource(mocker):
+    resource = mocker.Mock(kind="MultiClusterHub")
+    resource.name = "multiclusterhub"
+    resource.exists.to_dict.return_value = _resource_dict(phase="Installing")
+    return resource
+
+
+def test_adaptive_sampler_backoff_resets_on_change(mocker):
+    sleep_mock = mocker.patch("openshift_cli_installer.utils.resource_waits.time.sleep")
+    mocker.patch("openshift_cli_installer.utils.resource_waits.random.uniform", side_effect=lambda low, high: high)
+    values = iter([1, 1, 1, 2, 2])
+    sampler = adaptive_sampler(func=lambda: next(values), wait_timeout=60, initial_sleep=1, max_sleep=3)
+    assert [next(sampler) for _ in range(5)] == [1, 1, 1, 2, 2]
+    assert [_call.args[0] for _call in sleep_mock.call_args_list] == [1, 2, 3, 1]
+
+
+def test_adaptive_sampler_timeout():
+    with pytest.raises(TimeoutExpiredError):
+        for _ in adaptive_sampler(func=lambda: None, wait_timeout=0.05, initial_sleep=0.01):
+            pass
+
+
+def test_wait_for_resource_already_matching(resource):
+    resource.exists.to_dict.return_value = _resource_dict(phase="Running")
+    assert wait_for_resource(resource=resource, predicate=status_phase_is(status="Running"), timeout=10)
+    resource.watcher.assert_not_called()
+
+
+def test_wait_for_resource_watch(resource):
+    resource.watcher.return_value = iter([
+        {"type": "MODIFIED", "raw_object": _resource_dict(phase="Installing", resource_version="2")},
+        {"type": "MODIFIED", "raw_object": _resource_dict(phase="Running", resource_version="3")},
+    ])
+    resource_dict = wait_for_resource(resource=resource, predicate=status_phase_is(status="Running"), timeout=10)
+
+    assert resource_dict["metadata"]["resourceVersion"] == "3"
+    assert resource.watcher.call_args.kwargs["resource_version"] == "1"
+
+
+def test_wait_for_resource_watch_stop_predicate(resource):
+    resource.watcher.return_value = iter([{"type": "MODIFIED", "raw_object": _resource_dict(phase="Failed")}])
+    with pytest.raises(ResourceWaitStopError):
+        wait_for_resource(
+            resource=resource,
+            predicate=status_phase_is(status="Running"),
+            stop_predicate=status_phase_is(status="Failed"),
+            timeout=10,
+        )
+
+
+def test_wait_for_resource_falls_back_to_polling(resource, mocker):
+    mocker.patch("openshift_cli_installer.utils.resource_waits.time.sleep")
+    resource.watcher.side_effect = ValueError("watch is forbidden")
+    resource.exists.to_dict.side_effect = [
+        _resource_dict(phase="Installing"),
+        _resource_dict(phase="Installing"),
+        _resource_dict(phase="Running"),
+    ]
+    assert wait_for_resource(resource=resource, predicate=status_phase_is(status="Running"), timeout=10)
+    assert resource.exists.to_dict.call_count == 3
+
+
+def test_condition_is():
+    resource_dict = {"status": {"conditions": [{"type": "Ready", "status": "True"}]}}
+    assert condition_is(condition="Ready", status="True")(resource_dict)
+    assert not condition_is(condition="Ready", status="False")(resource_dict)
+    assert not condition_is(condition="Ready", status="True")({})
@@ -0,0 +1,79 @@
+from types import SimpleNamespace
+
+from ocm_python_client.exceptions import ApiException
+
+from openshift_cli_installer.utils.rosa_backends import OcmApiRosaBackend, RosaCliBackend, get_rosa_backend
+
+ROSA_DELETE_CLUSTER_OUT = """
+INFO: Cluster 'c1' will start uninstalling now
+INFO: Once the cluster is uninstalled use the following commands to remove the above aws resources.
+
+	rosa delete operator-roles -c 123abc
+	rosa delete oidc-provider -c 123abc
+INFO: To watch your cluster uninstallation logs, run 'rosa logs uninstall -c c1 --watch'
+"""
+
+
+def test_get_rosa_backend():
+    assert type(get_rosa_backend(backend_name="cli", ocm_client=None, aws_region="us-east-2")) is RosaCliBackend
+    assert type(get_rosa_backend(backend_name="ocm-api", ocm_client=None, aws_region="us-east-2")) is OcmApiRosaBackend
+
+
+def test_cli_backend_delete_cluster_leftovers(mocker):
+    mocker.patch(
+        "openshift_cli_installer.utils.rosa_backends.execute_rosa_command",
+        return_value={"out": ROSA_DELETE_CLUSTER_OUT, "err": ""},
+    )
+
+    assert RosaCliBackend(ocm_client=None, aws_region="us-east-2").delete_cluster(
+        cluster_name="c1", cluster_id="123abc", hypershift=False
+    ) == ["delete operator-roles --cluster=123abc", "delete oidc-provider --cluster=123abc"]
+
+
+def test_ocm_api_backend_list_versions_pages(mocker):
+    mocker.patch("openshift_cli_installer.utils.rosa_backends.OCM_SEARCH_PAGE_SIZE", 2)
+    ocm_client = mocker.Mock()
+    ocm_client.api_clusters_mgmt_v1_versions_get.side_effect = [
+        SimpleNamespace(items=[SimpleNamespace(raw_id="4.15.1"), SimpleNamespace(raw_id="4.15.2")]),
+        SimpleNamespace(items=[SimpleNamespace(raw_id="4.16.0")]),
+    ]
+
+    backend = OcmApiRosaBackend(ocm_client=ocm_client, aws_region="us-east-2")
+    assert backend.list_versions(channel_group="stable", hosted_cp=True) == ["4.15.1", "4.15.2", "4.16.0"]
+    assert ocm_client.api_clusters_mgmt_v1_versions_get.call_count == 2
+    assert (
+        "hosted_control_plane_enabled = 'true'"
+        in ocm_client.api_clusters_mgmt_v1_versions_get.call_args.kwargs["search"]
+    )
+
+
+def test_ocm_api_backend_delete_cluster(mocker):
+    ocm_client = mocker.Mock()
+    backend = OcmApiRosaBackend(ocm_client=ocm_client, aws_region="us-east-2")
+
+    assert backend.delete_cluster(cluster_name="c1", cluster_id="123abc", hypershift=False) == [
+        "delete operator-roles --cluster=123abc",
+        "delete oidc-provider --cluster=123abc",
+    ]
+    assert backend.delete_cluster(cluster_name="c1", cluster_id="123abc", hypershift=True, oidc_config_id="oidc1") == [
+        "delete oidc-provider --oidc-config-id=oidc1"
+    ]
+    ocm_client.api_clusters_mgmt_v1_clusters_cluster_id_delete.assert_called_with(cluster_id="123abc", deprovision=True)
+
+
+def test_ocm_api_backend_falls_back_to_cli(mocker):
+    execute = mocker.patch(
+        "openshift_cli_installer.utils.rosa_backends.execute_rosa_command",
+        return_value={
+            "out": [
+                {"id": "us-east-1", "supports_hypershift": True},
+                {"id": "eu-north-1", "supports_hypershift": False},
+            ]
+        },
+    )
+    ocm_client = mocker.Mock()
+    ocm_client.api_clusters_mgmt_v1_cloud_providers_cloud_provider_id_regions_get.side_effect = ApiException(status=500)
+
+    backend = OcmApiRosaBackend(ocm_client=ocm_client, aws_region="us-west-2")
+    assert backend.list_hypershift_regions() == ["us-east-1"]
+    execute.assert_called_once_with(command="list regions", aws_region="us-west-2", ocm_client=ocm_client)
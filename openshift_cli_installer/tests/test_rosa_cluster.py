@@ -0,0 +1,178 @@
+import functools
+import threading
+from types import SimpleNamespace
+
+import click
+import pytest
+
+from openshift_cli_installer.libs.clusters.ocm_cluster import OcmCluster
+from openshift_cli_installer.libs.clusters.rosa_cluster import RosaCluster
+from openshift_cli_installer.utils.lifecycle_journal import LifecycleJournal
+from openshift_cli_installer.utils.task_graph import TaskGraphError
+
+
+@pytest.fixture()
+def hypershift_cluster(mocker):
+    rosa_cluster = mocker.Mock(log_prefix="", cluster_info={"name": "hcp1", "platform": "hypershift"})
+    for _method in ("rollback_hypershift_pre_create", "remove_cluster_aws_resources"):
+        setattr(rosa_cluster, _method, functools.partial(getattr(RosaCluster, _method), rosa_cluster))
+
+    return rosa_cluster
+
+
+def test_hypershift_pre_create_rolls_back_started_steps(hypershift_cluster):
+    rosa_cluster = hypershift_cluster
+    rosa_cluster.create_hypershift_oidc_step.side_effect = click.Abort()
+
+    with pytest.raises(click.Abort):
+        RosaCluster.prepare_hypershift_cluster_create(rosa_cluster)
+
+    rosa_cluster.prepare_hypershift_vpc_step.assert_called_once()
+    rosa_cluster.create_hypershift_operator_roles_step.assert_not_called()
+    rosa_cluster.destroy_hypershift_vpc.assert_called_once()
+    rosa_cluster.delete_oidc.assert_called_once()
+    rosa_cluster.delete_operator_role.assert_not_called()
+    rosa_cluster.journal.clear.assert_called_once()
+
+
+def test_hypershift_teardown_runs_independent_steps(hypershift_cluster):
+    rosa_cluster = hypershift_cluster
+    oidc_provider_removed = threading.Event()
+    rosa_cluster.rosa_backend.execute.side_effect = lambda command: oidc_provider_removed.set()
+    rosa_cluster.delete_oidc.side_effect = lambda: (
+        oidc_provider_removed.is_set() or pytest.fail("OIDC config deleted before the OIDC provider")
+    )
+    rosa_cluster.destroy_hypershift_vpc.side_effect = click.Abort()
+
+    with pytest.raises(TaskGraphError) as exc_info:
+        rosa_cluster.remove_cluster_aws_resources(leftover_commands=["delete oidc-provider --oidc-config-id=oidc1"])
+
+    assert set(exc_info.value.errors) == {"destroy-vpc"}
+    rosa_cluster.rosa_backend.execute.assert_called_once_with(command="delete oidc-provider --oidc-config-id=oidc1")
+    rosa_cluster.delete_oidc.assert_called_once()
+    rosa_cluster.delete_operator_role.assert_called_once()
+
+
+def test_hypershift_teardown_operator_roles_leftover_is_not_repeated(hypershift_cluster):
+    rosa_cluster = hypershift_cluster
+    leftover_commands = [
+        "delete oidc-provider --oidc-config-id=oidc1",
+        "delete operator-roles --prefix=hcp1",
+    ]
+
+    rosa_cluster.remove_cluster_aws_resources(leftover_commands=leftover_commands)
+
+    assert rosa_cluster.rosa_backend.execute.call_count == 2
+    rosa_cluster.delete_operator_role.assert_not_called()
+    rosa_cluster.delete_oidc.assert_called_once()
+
+
+def test_shared_oidc_config_leftovers_are_kept(hypershift_cluster):
+    rosa_cluster = hypershift_cluster
+    rosa_cluster.cluster_info.update({"oidc-config-id": "oidc1", "shared-oidc-config": True})
+    rosa_cluster.rosa_backend.delete_cluster.return_value = [
+        "delete oidc-provider --oidc-config-id=oidc1",
+        "delete operator-roles --prefix=ocli-us-east-2-abcd",
+    ]
+
+    assert RosaCluster.request_cluster_delete(rosa_cluster) == []
+    assert rosa_cluster.rosa_backend.delete_cluster.call_args.kwargs["oidc_config_id"] is None
+
+
+def test_hypershift_idp_requests_are_not_repeated(hypershift_cluster):
+    rosa_cluster = hypershift_cluster
+    rosa_cluster.hypershift_idp = {"user": "rosa-admin", "password": "pass", "created": False, "granted": False}
+    rosa_cluster.rosa_backend.grant_cluster_admin.side_effect = [click.Abort(), None]
+
+    with pytest.raises(click.Abort):
+        RosaCluster.request_hypershift_idp(rosa_cluster, cluster_id="123abc")
+
+    RosaCluster.request_hypershift_idp(rosa_cluster, cluster_id="123abc")
+
+    rosa_cluster.rosa_backend.create_htpasswd_idp.assert_called_once_with(
+        cluster_id="123abc", idp_name="rosa-htpasswd", username="rosa-admin", password="pass"
+    )
+    assert rosa_cluster.rosa_backend.grant_cluster_admin.call_count == 2
+    assert rosa_cluster.hypershift_idp["created"] and rosa_cluster.hypershift_idp["granted"]
+
+
+def test_hypershift_idp_state_is_resumed_from_journal(hypershift_cluster, tmp_path):
+    rosa_cluster = hypershift_cluster
+    rosa_cluster.journal = LifecycleJournal(cluster_dir=str(tmp_path))
+    rosa_cluster.new_hypershift_idp = functools.partial(RosaCluster.new_hypershift_idp, rosa_cluster)
+    rosa_cluster.generate_hypershift_password.side_effect = ["pass1", "pass2"]
+    rosa_cluster.hypershift_idp = RosaCluster.init_hypershift_idp(rosa_cluster)
+    rosa_cluster.rosa_backend.grant_cluster_admin.side_effect = click.Abort()
+
+    with pytest.raises(click.Abort):
+        RosaCluster.request_hypershift_idp(rosa_cluster, cluster_id="123abc")
+
+    # Resumed run keeps the password of the created IDP
+    assert RosaCluster.init_hypershift_idp(rosa_cluster) == {
+        "user": "rosa-admin",
+        "password": "pass1",
+        "created": True,
+        "granted": False,
+    }
+
+
+def test_hypershift_idp_reset_on_create_retry(mocker):
+    ocm_prepare_create_retry = mocker.patch.object(OcmCluster, "prepare_create_retry")
+    rosa_cluster = mocker.Mock(spec=RosaCluster)
+    rosa_cluster.new_hypershift_idp = functools.partial(RosaCluster.new_hypershift_idp, rosa_cluster)
+    rosa_cluster.generate_hypershift_password.return_value = "pass2"
+    rosa_cluster.hypershift_idp = {"user": "rosa-admin", "password": "pass1", "created": True, "granted": True}
+
+    RosaCluster.prepare_create_retry(rosa_cluster)
+
+    # Retry creates a new cluster, its IDP is requested again
+    ocm_prepare_create_retry.assert_called_once()
+    assert rosa_cluster.hypershift_idp == {
+        "user": "rosa-admin",
+        "password": "pass2",
+        "created": False,
+        "granted": False,
+    }
+
+
+def test_hypershift_idp_early_request_failure_is_deferred(hypershift_cluster):
+    rosa_cluster = hypershift_cluster
+    rosa_cluster.hypershift_idp_early_request_needed.return_value = True
+    rosa_cluster.clusters_status_poller.wait_for_cluster.return_value = SimpleNamespace(id="123abc")
+    rosa_cluster.request_hypershift_idp.side_effect = click.Abort()
+    rosa_cluster._request_hypershift_idp_early = functools.partial(
+        RosaCluster._request_hypershift_idp_early, rosa_cluster
+    )
+
+    RosaCluster.request_hypershift_idp_early(rosa_cluster)
+
+    rosa_cluster.request_hypershift_idp.assert_called_once_with(cluster_id="123abc")
+
+
+def test_failed_create_clears_journal(hypershift_cluster):
+    rosa_cluster = hypershift_cluster
+    rosa_cluster.create_cancelled = threading.Event()
+    rosa_cluster.user_input.must_gather_output_dir = None
+
+    RosaCluster.collect_failed_create_data(rosa_cluster, ex=click.Abort())
+
+    rosa_cluster.journal.clear.assert_called_once()
+    rosa_cluster.set_cluster_auth.assert_called_once()
+
+
+def test_shared_oidc_config_deleted_with_last_cluster(hypershift_cluster):
+    rosa_cluster = hypershift_cluster
+    rosa_cluster.cluster_info.update({"aws-account-id": "123", "region": "us-east-2", "shared-oidc-config": True})
+
+    RosaCluster.delete_oidc(rosa_cluster)
+    release_kwargs = rosa_cluster.shared_iam_registry.release.call_args.kwargs
+    assert release_kwargs["cluster_name"] == "hcp1"
+
+    RosaCluster.delete_shared_oidc_and_operator_roles(
+        rosa_cluster, oidc_config_id="oidc1", operator_roles_prefix="ocli-us-east-2-abcd"
+    )
+    assert [_call.kwargs["command"] for _call in rosa_cluster.rosa_backend.execute.call_args_list] == [
+        "delete operator-roles --prefix=ocli-us-east-2-abcd",
+        "delete oidc-provider --oidc-config-id=oidc1",
+        "delete oidc-config --oidc-config-id=oidc1",
+    ]
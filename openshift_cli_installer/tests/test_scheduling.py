@@ -0,0 +1,28 @@
+from openshift_cli_installer.utils.scheduling import schedule_longest_job_first
+
+
+def test_schedule_longest_job_first():
+    scheduled_jobs, skipped_jobs = schedule_longest_job_first(
+        jobs=[("hypershift", 900, False), ("ipi", 2700, False), ("rosa", 2400, False)],
+        slots=2,
+        deadline=3600,
+    )
+
+    assert scheduled_jobs == ["ipi", "rosa", "hypershift"]
+    assert skipped_jobs == []
+
+
+def test_schedule_longest_job_first_skip_low_priority():
+    scheduled_jobs, skipped_jobs = schedule_longest_job_first(
+        jobs=[
+            ("low-hypershift", 900, True),
+            ("low-osd", 2400, True),
+            ("ipi", 2700, False),
+            ("rosa", 2400, False),
+        ],
+        slots=1,
+        deadline=6000,
+    )
+
+    assert scheduled_jobs == ["ipi", "rosa", "low-hypershift"]
+    assert skipped_jobs == ["low-osd"]
@@ -0,0 +1,50 @@
+import functools
+import threading
+
+import pytest
+
+from openshift_cli_installer.utils.task_graph import TaskGraphError, run_task_graph
+
+
+def test_run_task_graph_runs_independent_tasks_concurrently():
+    barrier = threading.Barrier(parties=2, timeout=5)
+    order = []
+
+    def _task(name, wait=False):
+        if wait:
+            # Both independent tasks must be running at the same time to pass the barrier
+            barrier.wait()
+
+        order.append(name)
+        return name
+
+    results = run_task_graph(
+        tasks={
+            "a": (functools.partial(_task, "a", wait=True), ()),
+            "b": (functools.partial(_task, "b"), ("a",)),
+            "c": (functools.partial(_task, "c", wait=True), ()),
+        }
+    )
+
+    assert results == {"a": "a", "b": "b", "c": "c"}
+    assert order.index("b") > order.index("a")
+
+
+def test_run_task_graph_failure_skips_dependents():
+    def _fail():
+        raise ValueError("boom")
+
+    with pytest.raises(TaskGraphError) as exc_info:
+        run_task_graph(
+            tasks={
+                "a": (_fail, ()),
+                "b": (lambda: "b", ("a",)),
+                "c": (lambda: "c", ("b",)),
+                "d": (lambda: "d", ()),
+            }
+        )
+
+    assert set(exc_info.value.errors) == {"a"}
+    assert exc_info.value.results == {"d": "d"}
+    assert exc_info.value.skipped == {"b", "c"}
+    assert exc_info.value.started == {"a", "d"}
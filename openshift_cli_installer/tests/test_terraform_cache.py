@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+from openshift_cli_installer.utils.terraform_cache import TerraformInitError, prepare_terraform_working_dir
+
+
+@pytest.fixture()
+def manifest_path(tmp_path):
+    _manifest_path = tmp_path / "setup-vpc.tf"
+    _manifest_path.write_text('module "vpc" {}\n')
+    return str(_manifest_path)
+
+
+@pytest.fixture()
+def terraform(mocker):
+    # Restored after the test, the plugin cache is configured with `os.environ`
+    mocker.patch.dict(os.environ)
+    os.environ.pop("TF_PLUGIN_CACHE_DIR", None)
+    os.environ.pop("TF_PLUGIN_CACHE_MAY_BREAK_DEPENDENCY_LOCK_FILE", None)
+
+    def _terraform(working_dir):
+        def _init():
+            os.makedirs(os.path.join(working_dir, ".terraform", "modules", "vpc"))
+            with open(os.path.join(working_dir, ".terraform.lock.hcl"), "w") as fd:
+                fd.write("lock")
+
+            return 0, "", ""
+
+        return mocker.Mock(init=mocker.Mock(side_effect=_init))
+
+    return mocker.patch("openshift_cli_installer.utils.terraform_cache.Terraform", side_effect=_terraform)
+
+
+def test_prepare_terraform_working_dir_init_template_once(tmp_path, manifest_path, terraform):
+    cache_dir = str(tmp_path / "cache")
+    for _cluster in ("cl1", "cl2"):
+        working_dir = tmp_path / _cluster
+        working_dir.mkdir()
+        prepare_terraform_working_dir(manifest_path=manifest_path, working_dir=str(working_dir), cache_dir=cache_dir)
+
+        assert (working_dir / "setup-vpc.tf").exists()
+        assert (working_dir / ".terraform" / "modules" / "vpc").is_dir()
+        assert (working_dir / ".terraform.lock.hcl").read_text() == "lock"
+
+    terraform.assert_called_once()
+    assert os.environ["TF_PLUGIN_CACHE_DIR"] == os.path.join(cache_dir, "plugin-cache")
+
+
+def test_prepare_terraform_working_dir_init_failure(tmp_path, manifest_path, mocker):
+    mocker.patch.dict(os.environ)
+    mocker.patch(
+        "openshift_cli_installer.utils.terraform_cache.Terraform",
+        return_value=mocker.Mock(init=mocker.Mock(return_value=(1, "", "registry unreachable"))),
+    )
+
+    with pytest.raises(TerraformInitError):
+        prepare_terraform_working_dir(
+            manifest_path=manifest_path, working_dir=str(tmp_path), cache_dir=str(tmp_path / "cache")
+        )
@@ -12,7 +12,7 @@ CLUSTER_DATA_DIR = "/tmp/cinstall"
     [
         (
             {"clusters_install_data_directory": CLUSTER_DATA_DIR, "ocm_token": "123"},
-            "'action' must be provided, supported actions: `('destroy', 'create')`",
+            "'action' must be provided, supported actions: `('destroy', 'create', 'hibernate', 'resume', 'pool-refill', 'cluster-pool-refill')`",
         ),
         (
             {
@@ -289,6 +289,172 @@ CLUSTER_DATA_DIR = "/tmp/cinstall"
             },
             "rosa platform does not support channel-group bad-stream, supported channels are ('stable', 'candidate', 'nightly')",
         ),
+        (
+            {
+                "clusters_install_data_directory": CLUSTER_DATA_DIR,
+                "action": "create",
+                "ocm_token": "123",
+                "create_failure_policy": "bad-policy",
+                "clusters": [{"name": "test-cl", "platform": "rosa", "region": "reg1"}],
+            },
+            "Create failure policy bad-policy is not supported, supported policies are ('destroy-all', 'keep-successful')",
+        ),
+        (
+            {
+                "clusters_install_data_directory": CLUSTER_DATA_DIR,
+                "action": "create",
+                "ocm_token": "123",
+                "create_retries": -1,
+                "clusters": [{"name": "test-cl", "platform": "rosa", "region": "reg1"}],
+            },
+            "Create retries must be a non-negative integer, got -1",
+        ),
+        (
+            {
+                "clusters_install_data_directory": CLUSTER_DATA_DIR,
+                "action": "create",
+                "ocm_token": "123",
+                "async_engine": True,
+                "async_engine_workers": -1,
+                "clusters": [{"name": "test-cl", "platform": "rosa", "region": "reg1"}],
+            },
+            "Async engine workers must be a positive integer, got -1",
+        ),
+        (
+            {
+                "clusters_install_data_directory": CLUSTER_DATA_DIR,
+                "action": "destroy",
+                "ocm_token": "123",
+                "resume": True,
+                "clusters": [{"name": "test-cl", "platform": "rosa", "region": "reg1"}],
+            },
+            "`--resume` is supported only with `create` action",
+        ),
+        (
+            {
+                "clusters_install_data_directory": CLUSTER_DATA_DIR,
+                "action": "create",
+                "ocm_token": "123",
+                "resume": True,
+                "clusters": [{"name-prefix": "test", "platform": "rosa", "region": "reg1"}],
+            },
+            "`--resume` requires cluster `name`, the following clusters use `name-prefix`: ['test']",
+        ),
+        (
+            {
+                "clusters_install_data_directory": CLUSTER_DATA_DIR,
+                "action": "create",
+                "ocm_token": "123",
+                "max_parallel_clusters": 0,
+                "clusters": [{"name": "test-cl", "platform": "rosa", "region": "reg1"}],
+            },
+            "Max parallel clusters must be a positive integer, got 0",
+        ),
+        (
+            {
+                "clusters_install_data_directory": CLUSTER_DATA_DIR,
+                "action": "create",
+                "ocm_token": "123",
+                "clusters": [{"name": "test-cl", "platform": "rosa", "region": "reg1", "priority": "urgent"}],
+            },
+            "Cluster priority urgent is not supported, supported priorities are ('high', 'low')",
+        ),
+        (
+            {
+                "clusters_install_data_directory": CLUSTER_DATA_DIR,
+                "action": "create",
+                "ocm_token": "123",
+                "admission_control": True,
+                "admission_control_max_load": -1,
+                "clusters": [{"name": "test-cl", "platform": "rosa", "region": "reg1"}],
+            },
+            "Admission control max load must be a positive number, got -1",
+        ),
+        (
+            {
+                "clusters_install_data_directory": CLUSTER_DATA_DIR,
+                "action": "create",
+                "ocm_token": "123",
+                "query_cache_ttl": -1,
+                "clusters": [{"name": "test-cl", "platform": "rosa", "region": "reg1"}],
+            },
+            "Query cache TTL must be a non-negative integer, got -1",
+        ),
+        (
+            {
+                "clusters_install_data_directory": CLUSTER_DATA_DIR,
+                "action": "create",
+                "ocm_token": "123",
+                "hypershift_vpc_provisioner": "pulumi",
+                "clusters": [{"name": "test-cl", "platform": "rosa", "region": "reg1"}],
+            },
+            "Hypershift VPC provisioner pulumi is not supported, supported provisioners are ('terraform', 'aws-api')",
+        ),
+        (
+            {
+                "clusters_install_data_directory": CLUSTER_DATA_DIR,
+                "action": "create",
+                "ocm_token": "123",
+                "hypershift_shared_oidc_config": True,
+                "clusters": [{"name": "test-cl", "platform": "rosa", "region": "reg1"}],
+            },
+            "`--hypershift-shared-oidc-config` requires `--s3-bucket-name`",
+        ),
+        (
+            {
+                "clusters_install_data_directory": CLUSTER_DATA_DIR,
+                "action": "cluster-pool-refill",
+                "ocm_token": "123",
+                "cluster_pool_size": -1,
+                "clusters": [{"name": "test-cl", "platform": "rosa", "region": "reg1"}],
+            },
+            "Cluster pool size must be a non-negative integer, got -1",
+        ),
+        (
+            {
+                "clusters_install_data_directory": CLUSTER_DATA_DIR,
+                "action": "create",
+                "ocm_token": "123",
+                "speculative_clusters": 1,
+                "clusters": [{"name-prefix": "test", "platform": "rosa", "region": "reg1"}],
+            },
+            "`--speculative-clusters` requires `--parallel`",
+        ),
+        (
+            {
+                "clusters_install_data_directory": CLUSTER_DATA_DIR,
+                "action": "pool-refill",
+                "hypershift_vpc_pool_size": 2,
+            },
+            "`--hypershift-vpc-pool-regions` is required with `--action pool-refill`",
+        ),
+        (
+            {
+                "clusters_install_data_directory": CLUSTER_DATA_DIR,
+                "action": "pool-refill",
+                "hypershift_vpc_pool_regions": "us-east-2",
+                "hypershift_vpc_pool_size": -1,
+            },
+            "Hypershift VPC pool size must be a non-negative integer, got -1",
+        ),
+        (
+            {
+                "clusters_install_data_directory": CLUSTER_DATA_DIR,
+                "action": "hibernate",
+                "ocm_token": "123",
+                "destroy_clusters_from_install_data_directory": True,
+            },
+            "Destroy clusters options are not supported with `--action hibernate`",
+        ),
+        (
+            {
+                "clusters_install_data_directory": CLUSTER_DATA_DIR,
+                "action": "resume",
+                "ocm_token": "123",
+                "clusters": [{"name": "test-cl", "platform": "rosa", "region": "reg1"}],
+            },
+            "`--cluster` is not supported with `--action resume`",
+        ),
     ],
 )
 def test_user_input(command, expected):
@@ -0,0 +1,132 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutExpiredError, TimeoutWatch
+
+LOGGER = get_logger(name=__name__)
+
+
+async def run_blocking(executor, func, **kwargs):
+    """
+    Run a blocking function in the executor without blocking the event loop.
+
+    Args:
+        executor (ThreadPoolExecutor): Executor to run the function in.
+        func (callable): Function to run.
+
+    Returns:
+        Any: The function return value.
+    """
+    return await asyncio.get_running_loop().run_in_executor(executor, functools.partial(func, **kwargs))
+
+
+async def run_command_async(command, capture_output=True):
+    """
+    Run command as asyncio subprocess, no thread is held while waiting for the command to finish.
+
+    Args:
+        command (list): Command to run.
+        capture_output (bool, default True): Capture command output.
+
+    Returns:
+        tuple: True, out, err if command succeeded, False, out, err otherwise.
+    """
+    LOGGER.info(f"Running {command[0]} command")
+    pipe = asyncio.subprocess.PIPE if capture_output else None
+    process = await asyncio.create_subprocess_exec(*command, stdout=pipe, stderr=pipe)
+    out, err = await process.communicate()
+    out_decoded = out.decode() if out else ""
+    err_decoded = err.decode() if err else ""
+
+    return process.returncode == 0, out_decoded, err_decoded
+
+
+async def wait_for_async(func, wait_timeout, sleep, executor, **kwargs):
+    """
+    Async version of `TimeoutSampler`, sample `func` in the executor until it returns a truthy value.
+
+    Args:
+        func (callable): Function to sample.
+        wait_timeout (int): Timeout in seconds.
+        sleep (int): Time in seconds between samples.
+        executor (ThreadPoolExecutor): Executor to run `func` in.
+
+    Returns:
+        Any: The first truthy value returned by `func`.
+
+    Raises:
+        TimeoutExpiredError: If `func` did not return a truthy value before the timeout.
+    """
+    timeout_watch = TimeoutWatch(timeout=wait_timeout)
+    while True:
+        if sample := await run_blocking(executor=executor, func=func, **kwargs):
+            return sample
+
+        remaining_time = timeout_watch.remaining_time()
+        if not remaining_time:
+            raise TimeoutExpiredError(value=getattr(func, "__name__", str(func)))
+
+        await asyncio.sleep(min(sleep, remaining_time))
+
+
+def run_clusters_action_async(
+    clusters, action, max_workers, max_parallel_clusters=None, before_action=None, on_done=None
+):
+    """
+    Run clusters action (create, destroy, hibernate or resume) concurrently from a single event loop.
+
+    Long waits are awaited on the event loop and only short blocking calls are offloaded to a thread pool
+    with `max_workers` threads.
+
+    Args:
+        clusters (list): Clusters objects.
+        action (str): Clusters action, `<action>_cluster_async` of each cluster is awaited.
+        max_workers (int): Number of threads used for blocking calls.
+        max_parallel_clusters (int, optional): Maximum number of clusters actions running concurrently,
+            clusters actions are started in `clusters` order.
+        before_action (callable, optional): Called with the cluster when its action starts, may raise to skip it.
+        on_done (callable, optional): Called with the cluster and the action exception (or None) as soon as
+            the cluster action is done.
+
+    Returns:
+        dict: cluster object as key, exception raised by the cluster action or None as value.
+    """
+
+    async def _run_cluster_action(cluster, executor, semaphore):
+        async with semaphore:
+            try:
+                if before_action:
+                    before_action(cluster)
+
+                result = await getattr(cluster, f"{action}_cluster_async")(executor=executor)
+
+            except Exception as ex:
+                if on_done:
+                    on_done(cluster, ex)
+
+                raise
+
+            if on_done:
+                on_done(cluster, None)
+
+            return result
+
+    async def _run_clusters_action():
+        semaphore = asyncio.Semaphore(value=max_parallel_clusters or len(clusters) or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = await asyncio.gather(
+                *[
+                    _run_cluster_action(cluster=_cluster, executor=executor, semaphore=semaphore)
+                    for _cluster in clusters
+                ],
+                return_exceptions=True,
+            )
+
+        return {
+            _cluster: _result if isinstance(_result, BaseException) else None
+            for _cluster, _result in zip(clusters, results)
+        }
+
+    return asyncio.run(_run_clusters_action())
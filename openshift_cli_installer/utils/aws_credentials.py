@@ -0,0 +1,59 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+from clouds.aws.aws_utils import AWS_CREDENTIALS_FILE, set_and_verify_existing_config_in_env_vars_or_file
+from simple_logger.logger import get_logger
+
+from openshift_cli_installer.utils.const import AWS_VERIFICATION_CACHE_DIRECTORY, AWS_VERIFICATION_CACHE_TTL
+from openshift_cli_installer.utils.query_cache import QueryResultsCache
+
+LOGGER = get_logger(name=__name__)
+
+
+def verify_aws_region_credentials(region_name):
+    # boto3 default session is not thread-safe, use a session per call
+    boto3.session.Session(region_name=region_name).client(service_name="ec2").describe_regions()
+
+
+def verify_aws_credentials_regions(regions, bypass_cache=False, cache_dir=AWS_VERIFICATION_CACHE_DIRECTORY):
+    """
+    Verify AWS credentials are valid in each region.
+
+    Successful verifications are cached on disk per (AWS access key ID, region) for a short TTL;
+    regions which are not cached are verified concurrently.
+
+    Args:
+        regions (iterable): AWS regions.
+        bypass_cache (bool, default False): Ignore cached verifications.
+        cache_dir (str): Verifications cache directory.
+
+    Raises:
+        AWSConfigurationError: If AWS credentials are not configured.
+        botocore.exceptions.ClientError: If AWS credentials are not valid in a region.
+    """
+    set_and_verify_existing_config_in_env_vars_or_file(
+        vars_list=["AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY"],
+        file_path=AWS_CREDENTIALS_FILE,
+    )
+    verification_cache = QueryResultsCache(cache_dir=cache_dir, ttl=AWS_VERIFICATION_CACHE_TTL, bypass=bypass_cache)
+    access_key_id = os.environ["AWS_ACCESS_KEY_ID"]
+    regions_keys = {
+        _region: verification_cache.cache_key("verify aws credentials", access_key_id=access_key_id, region=_region)
+        for _region in regions
+    }
+    if not (
+        regions_to_verify := [
+            _region for _region, _key in regions_keys.items() if not verification_cache.get(key=_key)[0]
+        ]
+    ):
+        LOGGER.info("Using cached AWS credentials verification")
+        return
+
+    LOGGER.info(f"Verifying AWS credentials in regions {regions_to_verify}")
+    with ThreadPoolExecutor(max_workers=len(regions_to_verify)) as executor:
+        # `list` raises the first verification error
+        list(executor.map(verify_aws_region_credentials, regions_to_verify))
+
+    for _region in regions_to_verify:
+        verification_cache.set(key=regions_keys[_region], result=True)
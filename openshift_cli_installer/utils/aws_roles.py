@@ -0,0 +1,53 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from clouds.aws.roles.roles import iam_client
+from simple_logger.logger import get_logger
+
+LOGGER = get_logger(name=__name__)
+
+# (AWS account ID, role name) as key, True if the role exists as value
+_IAM_ROLES_EXIST = {}
+_IAM_ROLES_EXIST_LOCK = threading.Lock()
+
+
+def iam_role_exists(client, role_name):
+    try:
+        client.get_role(RoleName=role_name)
+        return True
+
+    except client.exceptions.NoSuchEntityException:
+        return False
+
+
+def get_missing_iam_roles(role_names, aws_account_id, client=None):
+    """
+    Check which IAM roles are missing with concurrent `GetRole` calls instead of listing all the account roles.
+
+    Results are cached per AWS account for the whole run.
+
+    Args:
+        role_names (iterable): IAM roles names.
+        aws_account_id (str): AWS account ID, used as cache key.
+        client (botocore.client.IAM, optional): IAM client.
+
+    Returns:
+        set: Missing IAM roles names.
+    """
+    with _IAM_ROLES_EXIST_LOCK:
+        if roles_to_check := [_name for _name in role_names if (aws_account_id, _name) not in _IAM_ROLES_EXIST]:
+            LOGGER.info(f"Checking IAM roles {roles_to_check} in AWS account {aws_account_id}")
+            client = client or iam_client()
+            with ThreadPoolExecutor(max_workers=len(roles_to_check)) as executor:
+                roles_exist = executor.map(
+                    lambda _name: iam_role_exists(client=client, role_name=_name), roles_to_check
+                )
+                for _name, _exists in zip(roles_to_check, roles_exist):
+                    _IAM_ROLES_EXIST[(aws_account_id, _name)] = _exists
+
+        return {_name for _name in role_names if not _IAM_ROLES_EXIST[(aws_account_id, _name)]}
+
+
+def clear_iam_roles_cache():
+    with _IAM_ROLES_EXIST_LOCK:
+        _IAM_ROLES_EXIST.clear()
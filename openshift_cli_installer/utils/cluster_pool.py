@@ -0,0 +1,353 @@
+import copy
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from botocore.exceptions import ClientError
+from clouds.aws.session_clients import s3_client
+from simple_logger.logger import get_logger
+
+from openshift_cli_installer.utils.const import (
+    CLUSTER_POOL_CLAIM_STALE_TIMEOUT,
+    CLUSTER_POOL_DIRECTORY_NAME,
+    CLUSTER_POOL_NAME_PREFIX,
+    CLUSTER_POOL_SPEC_HASH_KEY,
+    CLUSTER_POOL_SPEC_IGNORED_KEYS,
+)
+
+LOGGER = get_logger(name=__name__)
+
+
+def cluster_pool_spec_hash(cluster):
+    """
+    Hash of the cluster user input which defines the created cluster (platform, version, region, flavor, ...).
+
+    Names, timeouts, scheduling and credentials keys do not change the cluster and are ignored.
+
+    Args:
+        cluster (dict): Cluster user input.
+
+    Returns:
+        str: Spec hash.
+    """
+    if spec_hash := cluster.get(CLUSTER_POOL_SPEC_HASH_KEY):
+        return spec_hash
+
+    spec = {_key: _value for _key, _value in cluster.items() if _key not in CLUSTER_POOL_SPEC_IGNORED_KEYS}
+    return hashlib.sha256(json.dumps(spec, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def cluster_pool_refill_clusters(clusters, cluster_pool_store, size):
+    """
+    Build the clusters user input to create to have `size` available clusters per spec in the pool.
+
+    Args:
+        clusters (list): Clusters user input, one per spec.
+        cluster_pool_store (LocalClusterPoolStore or S3ClusterPoolStore): Pool store.
+        size (int): Number of available clusters to keep per spec.
+
+    Returns:
+        list: Clusters user input to create.
+    """
+    refill_clusters = []
+    for _cluster in clusters:
+        spec_hash = cluster_pool_spec_hash(cluster=_cluster)
+        missing = size - len(cluster_pool_store.available(spec_hash=spec_hash))
+        LOGGER.info(f"Cluster pool spec {spec_hash} ({_cluster['platform']}): {max(missing, 0)} clusters missing")
+        for _ in range(missing):
+            pool_cluster = copy.deepcopy(_cluster)
+            pool_cluster.pop("name", None)
+            pool_cluster["name-prefix"] = _cluster.get("name-prefix") or CLUSTER_POOL_NAME_PREFIX
+            pool_cluster[CLUSTER_POOL_SPEC_HASH_KEY] = spec_hash
+            refill_clusters.append(pool_cluster)
+
+    return refill_clusters
+
+
+class LocalClusterPoolStore:
+    """
+    Pool of ready clusters data directories (`cluster_data.yaml` and auth), one directory per spec hash:
+    `<pool dir>/<spec hash>/available/<cluster name>`.
+
+    A claim renames the cluster directory to `<spec hash>/claimed`; rename is atomic, concurrent claimants
+    of the same cluster can not both succeed.
+    Claimed clusters which are not alive are parked in `<spec hash>/dead` until `--action cluster-pool-refill`
+    destroys them.
+    """
+
+    def __init__(self, pool_dir):
+        self.pool_dir = pool_dir
+
+    def _state_dir(self, spec_hash, state):
+        state_dir = os.path.join(self.pool_dir, spec_hash, state)
+        Path(state_dir).mkdir(parents=True, exist_ok=True)
+        return state_dir
+
+    def available(self, spec_hash):
+        """
+        Returns:
+            list: Names of the available clusters of the spec.
+        """
+        return sorted(os.listdir(self._state_dir(spec_hash=spec_hash, state="available")))
+
+    def dead(self, spec_hash):
+        """
+        Returns:
+            list: Names of the dead clusters of the spec.
+        """
+        return sorted(os.listdir(self._state_dir(spec_hash=spec_hash, state="dead")))
+
+    def _move_in(self, spec_hash, state, cluster_name, cluster_dir):
+        staging_dir = tempfile.mkdtemp(dir=self._state_dir(spec_hash=spec_hash, state="staging"))
+        shutil.copytree(cluster_dir, staging_dir, dirs_exist_ok=True)
+        # The cluster is visible to claimants only once fully copied
+        os.rename(staging_dir, os.path.join(self._state_dir(spec_hash=spec_hash, state=state), cluster_name))
+        shutil.rmtree(cluster_dir, ignore_errors=True)
+
+    def add(self, spec_hash, cluster_name, cluster_dir):
+        """
+        Move a created cluster data directory to the pool.
+        """
+        self._move_in(spec_hash=spec_hash, state="available", cluster_name=cluster_name, cluster_dir=cluster_dir)
+        LOGGER.info(f"Added cluster {cluster_name} to pool spec {spec_hash}")
+
+    def park_dead(self, spec_hash, cluster_name, cluster_dir):
+        """
+        Move a claimed cluster data directory which is not alive to the pool dead clusters, to be destroyed.
+        """
+        self._move_in(spec_hash=spec_hash, state="dead", cluster_name=cluster_name, cluster_dir=cluster_dir)
+        LOGGER.info(f"Parked dead cluster {cluster_name} of pool spec {spec_hash}")
+
+    def fetch_dead(self, spec_hash, cluster_name, cluster_dir):
+        shutil.copytree(
+            os.path.join(self._state_dir(spec_hash=spec_hash, state="dead"), cluster_name),
+            cluster_dir,
+            dirs_exist_ok=True,
+        )
+
+    def remove_dead(self, spec_hash, cluster_name):
+        shutil.rmtree(os.path.join(self._state_dir(spec_hash=spec_hash, state="dead"), cluster_name))
+
+    def claim(self, spec_hash, cluster_dir):
+        """
+        Claim an available cluster of the spec and copy its data to `cluster_dir`.
+
+        Returns:
+            str or None: Claimed cluster name, None if no cluster could be claimed.
+        """
+        claimed_dir = self._state_dir(spec_hash=spec_hash, state="claimed")
+        for _cluster_name in self.available(spec_hash=spec_hash):
+            pool_cluster_dir = os.path.join(claimed_dir, _cluster_name)
+            try:
+                os.rename(os.path.join(self.pool_dir, spec_hash, "available", _cluster_name), pool_cluster_dir)
+            except FileNotFoundError:
+                # Claimed by another run
+                continue
+
+            shutil.copytree(pool_cluster_dir, cluster_dir, dirs_exist_ok=True)
+            shutil.rmtree(pool_cluster_dir, ignore_errors=True)
+            return _cluster_name
+
+        return None
+
+    def claim_info(self, spec_hash):
+        """
+        Local claims leave nothing to release on destroy.
+        """
+
+
+class S3ClusterPoolStore:
+    """
+    Pool of ready clusters data directories zipped in S3, `<path>/cluster-pool/<spec hash>/available/<name>.zip`.
+
+    A claim creates `<spec hash>/claims/<name>` with a conditional write (`If-None-Match: *`), only one claimant
+    of a cluster succeeds; the claim marker is kept while the cluster is claimed and deleted when the cluster is
+    added back to the pool or destroyed. A marker older than `CLUSTER_POOL_CLAIM_STALE_TIMEOUT` whose cluster zip
+    still exists was left by a killed claimant and is broken.
+    Claimed clusters which are not alive are parked in `<spec hash>/dead/<name>.zip` until
+    `--action cluster-pool-refill` destroys them.
+    """
+
+    def __init__(self, s3_bucket_name, s3_bucket_path=None, client=None):
+        self.s3_bucket_name = s3_bucket_name
+        self.s3_bucket_path = s3_bucket_path
+        self.prefix = "/".join(filter(None, [s3_bucket_path, CLUSTER_POOL_DIRECTORY_NAME]))
+        self._client = client
+
+    @property
+    def client(self):
+        if not self._client:
+            self._client = s3_client()
+
+        return self._client
+
+    def _key(self, spec_hash, state, name):
+        return f"{self.prefix}/{spec_hash}/{state}/{name}"
+
+    def _objects(self, spec_hash, state):
+        """
+        Returns:
+            dict: Object name (without the state prefix) as key, object last modified time as value.
+        """
+        prefix = self._key(spec_hash=spec_hash, state=state, name="")
+        return {
+            _object["Key"][len(prefix) :]: _object["LastModified"]
+            for _page in self.client.get_paginator("list_objects_v2").paginate(
+                Bucket=self.s3_bucket_name, Prefix=prefix
+            )
+            for _object in _page.get("Contents", [])
+        }
+
+    def _zipped_clusters(self, spec_hash, state):
+        return sorted(
+            _name[: -len(".zip")] for _name in self._objects(spec_hash=spec_hash, state=state) if _name.endswith(".zip")
+        )
+
+    @staticmethod
+    def _is_stale_claim(claim_time):
+        return datetime.now(tz=timezone.utc) - claim_time > timedelta(seconds=CLUSTER_POOL_CLAIM_STALE_TIMEOUT)
+
+    def available(self, spec_hash):
+        """
+        Returns:
+            list: Names of the available clusters of the spec, clusters being claimed are excluded.
+        """
+        claims = self._objects(spec_hash=spec_hash, state="claims")
+        return [
+            _cluster_name
+            for _cluster_name in self._zipped_clusters(spec_hash=spec_hash, state="available")
+            if _cluster_name not in claims or self._is_stale_claim(claim_time=claims[_cluster_name])
+        ]
+
+    def dead(self, spec_hash):
+        return self._zipped_clusters(spec_hash=spec_hash, state="dead")
+
+    def _move_in(self, spec_hash, state, cluster_name, cluster_dir):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            zip_file = shutil.make_archive(
+                base_name=os.path.join(tmp_dir, cluster_name), format="zip", root_dir=cluster_dir
+            )
+            self.client.upload_file(
+                Filename=zip_file,
+                Bucket=self.s3_bucket_name,
+                Key=self._key(spec_hash=spec_hash, state=state, name=f"{cluster_name}.zip"),
+            )
+
+        # The cluster is no longer claimed
+        self.client.delete_object(
+            Bucket=self.s3_bucket_name, Key=self._key(spec_hash=spec_hash, state="claims", name=cluster_name)
+        )
+        shutil.rmtree(cluster_dir, ignore_errors=True)
+
+    def _download(self, zip_key, cluster_dir):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            zip_file = os.path.join(tmp_dir, os.path.basename(zip_key))
+            self.client.download_file(Bucket=self.s3_bucket_name, Key=zip_key, Filename=zip_file)
+            shutil.unpack_archive(filename=zip_file, extract_dir=cluster_dir, format="zip")
+
+    def add(self, spec_hash, cluster_name, cluster_dir):
+        self._move_in(spec_hash=spec_hash, state="available", cluster_name=cluster_name, cluster_dir=cluster_dir)
+        LOGGER.info(f"Added cluster {cluster_name} to pool spec {spec_hash} in S3 bucket {self.s3_bucket_name}")
+
+    def park_dead(self, spec_hash, cluster_name, cluster_dir):
+        self._move_in(spec_hash=spec_hash, state="dead", cluster_name=cluster_name, cluster_dir=cluster_dir)
+        LOGGER.info(f"Parked dead cluster {cluster_name} of pool spec {spec_hash} in S3 bucket {self.s3_bucket_name}")
+
+    def fetch_dead(self, spec_hash, cluster_name, cluster_dir):
+        self._download(
+            zip_key=self._key(spec_hash=spec_hash, state="dead", name=f"{cluster_name}.zip"), cluster_dir=cluster_dir
+        )
+
+    def remove_dead(self, spec_hash, cluster_name):
+        self.client.delete_object(
+            Bucket=self.s3_bucket_name, Key=self._key(spec_hash=spec_hash, state="dead", name=f"{cluster_name}.zip")
+        )
+
+    def _break_stale_claim(self, claim_key):
+        """
+        Returns:
+            bool: True if the claim marker is gone (stale marker deleted or released meanwhile).
+        """
+        try:
+            claim_time = self.client.head_object(Bucket=self.s3_bucket_name, Key=claim_key)["LastModified"]
+        except ClientError:
+            return True
+
+        if not self._is_stale_claim(claim_time=claim_time):
+            return False
+
+        LOGGER.warning(f"Breaking stale cluster pool claim {claim_key} from {claim_time}")
+        self.client.delete_object(Bucket=self.s3_bucket_name, Key=claim_key)
+        return True
+
+    def _try_claim(self, spec_hash, cluster_name):
+        claim_key = self._key(spec_hash=spec_hash, state="claims", name=cluster_name)
+        # Second attempt once a stale claim marker is broken
+        for _ in range(2):
+            try:
+                self.client.put_object(Bucket=self.s3_bucket_name, Key=claim_key, Body=b"", IfNoneMatch="*")
+                return True
+
+            except ClientError as ex:
+                if ex.response["Error"]["Code"] not in ("PreconditionFailed", "ConditionalRequestConflict"):
+                    raise
+
+            if not self._break_stale_claim(claim_key=claim_key):
+                return False
+
+        return False
+
+    def claim(self, spec_hash, cluster_dir):
+        for _cluster_name in self.available(spec_hash=spec_hash):
+            if not self._try_claim(spec_hash=spec_hash, cluster_name=_cluster_name):
+                continue
+
+            zip_key = self._key(spec_hash=spec_hash, state="available", name=f"{_cluster_name}.zip")
+            self._download(zip_key=zip_key, cluster_dir=cluster_dir)
+            self.client.delete_object(Bucket=self.s3_bucket_name, Key=zip_key)
+            return _cluster_name
+
+        return None
+
+    def claim_info(self, spec_hash):
+        """
+        Returns:
+            dict: Data to release the claim marker once the claimed cluster is destroyed.
+        """
+        return {"spec-hash": spec_hash, "s3-bucket-name": self.s3_bucket_name, "s3-bucket-path": self.s3_bucket_path}
+
+    def release(self, spec_hash, cluster_name):
+        """
+        Delete the claim marker of a destroyed claimed cluster.
+        """
+        self.client.delete_object(
+            Bucket=self.s3_bucket_name, Key=self._key(spec_hash=spec_hash, state="claims", name=cluster_name)
+        )
+
+
+def release_cluster_pool_claim(claim_info, cluster_name):
+    """
+    Release the S3 clusters pool claim of a destroyed cluster.
+
+    Args:
+        claim_info (dict): Claim data from `S3ClusterPoolStore.claim_info`.
+        cluster_name (str): Claimed cluster name.
+    """
+    S3ClusterPoolStore(
+        s3_bucket_name=claim_info["s3-bucket-name"], s3_bucket_path=claim_info["s3-bucket-path"]
+    ).release(spec_hash=claim_info["spec-hash"], cluster_name=cluster_name)
+
+
+def get_cluster_pool_store(clusters_install_data_directory, s3_bucket_name=None, s3_bucket_path=None):
+    """
+    Returns:
+        S3ClusterPoolStore if `s3_bucket_name`, else LocalClusterPoolStore in the clusters install data directory.
+    """
+    if s3_bucket_name:
+        return S3ClusterPoolStore(s3_bucket_name=s3_bucket_name, s3_bucket_path=s3_bucket_path)
+
+    return LocalClusterPoolStore(pool_dir=os.path.join(clusters_install_data_directory, CLUSTER_POOL_DIRECTORY_NAME))
@@ -6,25 +6,46 @@ from pathlib import Path
 import click
 import yaml
 from clouds.aws.session_clients import s3_client
-from ocm_python_wrapper.ocm_client import OCMPythonClient
 from simple_logger.logger import get_logger
 
 from openshift_cli_installer.utils.const import (
     CLUSTER_DATA_YAML_FILENAME,
     DESTROY_CLUSTERS_FROM_S3_BASE_DATA_DIRECTORY,
     DESTROY_STR,
+    OCM_SEARCH_PAGE_SIZE,
+    POWER_STATE_PLATFORMS,
 )
+from openshift_cli_installer.utils.ocm_client_pool import get_shared_ocm_client
 
 LOGGER = get_logger(name=__name__)
 
 
-def get_ocm_client(ocm_token, ocm_env):
-    return OCMPythonClient(
-        token=ocm_token,
-        endpoint="https://sso.redhat.com/auth/realms/redhat-external/protocol/openid-connect/token",
-        api_host=ocm_env,
-        discard_unknown_keys=True,
-    ).client
+def get_ocm_client(ocm_token, ocm_env, token_cache=False):
+    return get_shared_ocm_client(ocm_token=ocm_token, ocm_env=ocm_env, token_cache=token_cache).client
+
+
+def search_ocm_clusters_by_names(ocm_client, names):
+    """
+    Search OCM for clusters by names, one search request per `OCM_SEARCH_PAGE_SIZE` names.
+
+    Args:
+        ocm_client (DefaultApi): OCM client.
+        names (list): Clusters names.
+
+    Returns:
+        list: OCM clusters which exist.
+    """
+    ocm_clusters = []
+    for idx in range(0, len(names), OCM_SEARCH_PAGE_SIZE):
+        _names = names[idx : idx + OCM_SEARCH_PAGE_SIZE]
+        search = f"name in ({', '.join(f'{_name!r}' for _name in _names)})"
+        ocm_clusters.extend(ocm_client.api_clusters_mgmt_v1_clusters_get(search=search, size=len(_names)).items)
+
+    return ocm_clusters
+
+
+def get_existing_ocm_clusters_names(ocm_client, names):
+    return [_cluster.name for _cluster in search_ocm_clusters_by_names(ocm_client=ocm_client, names=names)]
 
 
 def clusters_from_directories(directories):
@@ -45,8 +66,8 @@ def clusters_from_directories(directories):
     return clusters_data_list
 
 
-def get_destroy_clusters_kwargs(clusters_data_list, user_input):
-    user_input.action = DESTROY_STR
+def get_destroy_clusters_kwargs(clusters_data_list, user_input, action=DESTROY_STR):
+    user_input.action = action
     clusters = []
 
     for cluster_data_from_yaml in clusters_data_list:
@@ -165,3 +186,46 @@ def destroy_clusters_from_s3_bucket_or_local_directory(user_input):
         raise click.Abort()
 
     return updated_user_input
+
+
+def power_state_clusters_from_s3_bucket_or_local_directory(user_input):
+    """
+    Get OSD and ROSA classic clusters to hibernate or resume from S3 bucket backups (if `--s3-bucket-name` is
+    passed) or from `--clusters-install-data-directory`, hypershift clusters can not be hibernated.
+
+    Args:
+        user_input (UserInput): User input.
+
+    Returns:
+        UserInput: User input with the clusters to hibernate or resume.
+    """
+    if user_input.s3_bucket_name:
+        prepare_clusters_directory_from_s3_bucket(
+            s3_bucket_name=user_input.s3_bucket_name,
+            s3_bucket_path=user_input.s3_bucket_path,
+            query=user_input.s3_bucket_object_name,
+        )
+        clusters_data_list = clusters_from_directories(directories=[DESTROY_CLUSTERS_FROM_S3_BASE_DATA_DIRECTORY])
+    else:
+        clusters_data_list = clusters_from_directories(directories=[user_input.clusters_install_data_directory])
+
+    power_state_clusters_data_list = []
+    for _cluster_data in clusters_data_list:
+        if _cluster_data["cluster_info"]["platform"] in POWER_STATE_PLATFORMS:
+            power_state_clusters_data_list.append(_cluster_data)
+        else:
+            LOGGER.warning(
+                f"Skipping cluster {_cluster_data['cluster_info']['name']}, "
+                f"{user_input.action} is supported only for OSD and ROSA classic clusters"
+            )
+
+    updated_user_input = get_destroy_clusters_kwargs(
+        clusters_data_list=power_state_clusters_data_list,
+        user_input=user_input,
+        action=user_input.action,
+    )
+    if not updated_user_input.clusters:
+        LOGGER.error(f"No clusters to {user_input.action}")
+        raise click.Abort()
+
+    return updated_user_input
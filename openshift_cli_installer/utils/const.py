@@ -2,6 +2,9 @@
 import os
 
 CLUSTER_DATA_YAML_FILENAME = "cluster_data.yaml"
+# Written by `openshift-install` once the install started
+OPENSHIFT_INSTALL_STATE_FILENAME = ".openshift_install_state.json"
+LIFECYCLE_JOURNAL_FILENAME = "lifecycle-journal.jsonl"
 USER_INPUT_CLUSTER_BOOLEAN_KEYS = ("acm", "acm-observability", "auto-region")
 DESTROY_CLUSTERS_FROM_S3_BASE_DATA_DIRECTORY = os.path.join("/", "tmp", "openshift-cli-installer", "s3-extracted")
 
@@ -22,11 +25,147 @@ IPI_BASED_PLATFORMS = (AWS_STR, GCP_STR)
 # Cluster actions
 DESTROY_STR = "destroy"
 CREATE_STR = "create"
-SUPPORTED_ACTIONS = (DESTROY_STR, CREATE_STR)
+WAIT_FOR_INSTALL_STR = "wait-for-install"
+HIBERNATE_STR = "hibernate"
+RESUME_STR = "resume"
+POOL_REFILL_STR = "pool-refill"
+CLUSTER_POOL_REFILL_STR = "cluster-pool-refill"
+SUPPORTED_ACTIONS = (DESTROY_STR, CREATE_STR, HIBERNATE_STR, RESUME_STR, POOL_REFILL_STR, CLUSTER_POOL_REFILL_STR)
+# Actions on existing clusters, loaded from the clusters install data directory or S3 bucket
+POWER_STATE_ACTIONS = (HIBERNATE_STR, RESUME_STR)
+# Hypershift clusters can not be hibernated
+POWER_STATE_PLATFORMS = (ROSA_STR, AWS_OSD_STR, GCP_OSD_STR)
+# OCM cluster state once the action is done
+POWER_STATE_ACTIONS_OCM_STATES = {HIBERNATE_STR: "hibernating", RESUME_STR: "ready"}
+
+# Create failure policies
+DESTROY_ALL_STR = "destroy-all"
+KEEP_SUCCESSFUL_STR = "keep-successful"
+SUPPORTED_CREATE_FAILURE_POLICIES = (DESTROY_ALL_STR, KEEP_SUCCESSFUL_STR)
+
+# Cluster statuses
+CREATED_STR = "created"
+DESTROYED_STR = "destroyed"
+HIBERNATED_STR = "hibernated"
+RESUMED_STR = "resumed"
+FAILED_STR = "failed"
+SKIPPED_STR = "skipped"
+ACTIONS_SUCCESS_STATUSES = {
+    CREATE_STR: CREATED_STR,
+    DESTROY_STR: DESTROYED_STR,
+    HIBERNATE_STR: HIBERNATED_STR,
+    RESUME_STR: RESUMED_STR,
+}
+
+# Cluster priorities
+HIGH_PRIORITY_STR = "high"
+LOW_PRIORITY_STR = "low"
+SUPPORTED_CLUSTER_PRIORITIES = (HIGH_PRIORITY_STR, LOW_PRIORITY_STR)
 
 # OCM environments
 PRODUCTION_STR = "production"
 STAGE_STR = "stage"
+OCM_SSO_ENDPOINT = "https://sso.redhat.com/auth/realms/redhat-external/protocol/openid-connect/token"
+OCM_TOKEN_CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "openshift-cli-installer", "ocm-tokens")
+OCM_TOKEN_CACHE_EXPIRY_MARGIN = 120
+QUERY_CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "openshift-cli-installer", "queries")
+QUERY_CACHE_DEFAULT_TTL = 3600
+AWS_VERIFICATION_CACHE_DIRECTORY = os.path.join(
+    os.path.expanduser("~"), ".cache", "openshift-cli-installer", "aws-verifications"
+)
+AWS_VERIFICATION_CACHE_TTL = 900
+TERRAFORM_CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "openshift-cli-installer", "terraform")
+HYPERSHIFT_TERRAFORM_PLAN_FILENAME = "hypershift.plan"
+HYPERSHIFT_SHARED_IAM_DIRECTORY_NAME = "hypershift-shared-iam"
+# Seconds, a shared IAM registry lock older than this was left by a killed run
+HYPERSHIFT_SHARED_IAM_LOCK_STALE_TIMEOUT = 1800
+
+# Hypershift VPC provisioners
+TERRAFORM_VPC_PROVISIONER_STR = "terraform"
+AWS_API_VPC_PROVISIONER_STR = "aws-api"
+SUPPORTED_VPC_PROVISIONERS = (TERRAFORM_VPC_PROVISIONER_STR, AWS_API_VPC_PROVISIONER_STR)
+# Same defaults as `setup-vpc.tf`
+HYPERSHIFT_VPC_DEFAULT_CIDR = "10.0.0.0/16"
+HYPERSHIFT_VPC_DEFAULT_PRIVATE_SUBNETS = ("10.0.1.0/24", "10.0.2.0/24")
+HYPERSHIFT_VPC_DEFAULT_PUBLIC_SUBNETS = ("10.0.101.0/24", "10.0.102.0/24")
+HYPERSHIFT_VPC_CLUSTER_TAG = "openshift-cli-installer/cluster"
+HYPERSHIFT_VPC_ROLE_TAG = "openshift-cli-installer/role"
+# Hypershift VPCs pool
+HYPERSHIFT_VPC_POOL_TAG = "openshift-cli-installer/vpc-pool"
+HYPERSHIFT_VPC_POOL_CLAIMED_BY_TAG = "openshift-cli-installer/vpc-pool-claimed-by"
+HYPERSHIFT_VPC_POOL_LEASE_TAG_PREFIX = "openshift-cli-installer/vpc-pool-lease/"
+HYPERSHIFT_VPC_POOL_AVAILABLE_STR = "available"
+HYPERSHIFT_VPC_POOL_CLAIMED_STR = "claimed"
+HYPERSHIFT_VPC_POOL_LEASE_SETTLE_SECONDS = 5
+HYPERSHIFT_VPC_POOL_LEASE_TTL = 300
+HYPERSHIFT_VPC_POOL_DEFAULT_SIZE = 2
+OCM_SEARCH_PAGE_SIZE = 100
+OCM_STATUS_POLL_INTERVAL = 10
+OCM_RATE_LIMIT_DEFAULT = 10
+OCM_THROTTLING_RETRIES = 5
+# Only commands without side effects are safe to re-run after a throttled request
+ROSA_READ_ONLY_COMMANDS = ("describe", "list", "logs", "verify", "version", "whoami")
+# `rosa` logs in, runs the command and logs out
+ROSA_COMMAND_OCM_CALLS = 3
+
+# ROSA operations backends
+CLI_ROSA_BACKEND_STR = "cli"
+OCM_API_ROSA_BACKEND_STR = "ocm-api"
+SUPPORTED_ROSA_BACKENDS = (CLI_ROSA_BACKEND_STR, OCM_API_ROSA_BACKEND_STR)
 
 # Timeouts
 TIMEOUT_60MIN = "60m"
+
+# Expected clusters create duration, used to schedule the longest clusters first
+EXPECTED_CREATE_DURATIONS = {
+    AWS_STR: "45m",
+    GCP_STR: "45m",
+    AWS_OSD_STR: "40m",
+    GCP_OSD_STR: "40m",
+    ROSA_STR: "40m",
+    HYPERSHIFT_STR: "15m",
+}
+
+# Async engine
+ASYNC_ENGINE_DEFAULT_WORKERS = 10
+ASYNC_ENGINE_POLL_INTERVAL = 10
+
+# Host resources admission control
+ADMISSION_CONTROL_DEFAULT_PROCESS_MEMORY_GIB = 4
+ADMISSION_CONTROL_DEFAULT_MAX_LOAD_PER_CPU = 1.0
+
+# Cluster lifecycle phases
+VERSION_RESOLVED_PHASE = "version-resolved"
+OIDC_CREATED_PHASE = "oidc-created"
+OPERATOR_ROLES_CREATED_PHASE = "operator-roles-created"
+VPC_APPLIED_PHASE = "vpc-applied"
+CLUSTER_REQUESTED_PHASE = "cluster-requested"
+CLUSTER_READY_PHASE = "cluster-ready"
+HYPERSHIFT_IDP_CREATED_PHASE = "hypershift-idp-created"
+HYPERSHIFT_IDP_GRANTED_PHASE = "hypershift-idp-granted"
+AUTH_WRITTEN_PHASE = "auth-written"
+BACKED_UP_PHASE = "backed-up"
+
+# Resource waits, adaptive polling when watch is not available
+RESOURCE_WAIT_INITIAL_SLEEP = 0.5
+RESOURCE_WAIT_MAX_SLEEP = 30
+
+# Ready clusters pool
+CLUSTER_POOL_DIRECTORY_NAME = "cluster-pool"
+CLUSTER_POOL_DEFAULT_SIZE = 1
+CLUSTER_POOL_NAME_PREFIX = "pool"
+CLUSTER_POOL_SPEC_HASH_KEY = "cluster-pool-spec-hash"
+# A claim downloads the cluster data and checks the cluster is alive, older claim markers were left by a killed run
+CLUSTER_POOL_CLAIM_STALE_TIMEOUT = 1800
+CLUSTER_POOL_SPEC_IGNORED_KEYS = (
+    "name",
+    "name-prefix",
+    "timeout",
+    "expected-duration",
+    "priority",
+    "cluster_dir",
+    "aws-access-key-id",
+    "aws-secret-access-key",
+    "gcp-service-account-file",
+    CLUSTER_POOL_SPEC_HASH_KEY,
+)
@@ -0,0 +1,175 @@
+import asyncio
+import os
+import shutil
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+
+from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutExpiredError, TimeoutWatch
+
+LOGGER = get_logger(name=__name__)
+
+GIB = 1024**3
+
+
+class HostResourcesAdmission:
+    """
+    Admission control for heavy child processes (`openshift-install`, `terraform`) started on the runner host.
+
+    A process is started only when the host available memory is enough for one more process and the CPU load
+    (1 minute load average per CPU) is below the limit.
+    Processes started in the last `ramp_up_seconds` did not allocate their memory yet, their memory is reserved.
+    A process is always admitted when no other process is running, to guarantee progress on small hosts.
+    """
+
+    def __init__(
+        self,
+        process_memory_gib,
+        max_load_per_cpu,
+        cgroup_memory_limit_gib=None,
+        ramp_up_seconds=120,
+        poll_interval=10,
+    ):
+        self.process_memory_bytes = process_memory_gib * GIB
+        self.max_load_per_cpu = max_load_per_cpu
+        self.cgroup_memory_limit_gib = cgroup_memory_limit_gib
+        self.ramp_up_seconds = ramp_up_seconds
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        # admission token as key, admission time as value
+        self._admitted_processes = {}
+
+    @staticmethod
+    def available_memory_bytes():
+        """
+        Returns:
+            int or None: `MemAvailable` from /proc/meminfo in bytes, None if not available.
+        """
+        try:
+            with open("/proc/meminfo") as fd:
+                for line in fd:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1]) * 1024
+
+        except OSError:
+            return None
+
+    @staticmethod
+    def load_per_cpu():
+        try:
+            return os.getloadavg()[0] / (os.cpu_count() or 1)
+
+        except OSError:
+            return None
+
+    @property
+    def running_processes(self):
+        return len(self._admitted_processes)
+
+    def reserved_memory_bytes(self):
+        now = time.monotonic()
+        return self.process_memory_bytes * len([
+            _admit_time for _admit_time in self._admitted_processes.values() if now - _admit_time < self.ramp_up_seconds
+        ])
+
+    def host_has_resources(self):
+        available_memory = self.available_memory_bytes()
+        if available_memory is not None and available_memory - self.reserved_memory_bytes() < self.process_memory_bytes:
+            LOGGER.info(
+                f"Not enough available memory: {available_memory / GIB:.1f}GiB available, "
+                f"{self.reserved_memory_bytes() / GIB:.1f}GiB reserved, {self.process_memory_bytes / GIB:.1f}GiB needed"
+            )
+            return False
+
+        load_per_cpu = self.load_per_cpu()
+        if load_per_cpu is not None and load_per_cpu > self.max_load_per_cpu:
+            LOGGER.info(f"CPU load per CPU {load_per_cpu:.2f} is above {self.max_load_per_cpu}")
+            return False
+
+        return True
+
+    def try_admit(self, token):
+        with self._lock:
+            if self._admitted_processes and not self.host_has_resources():
+                return False
+
+            self._admitted_processes[token] = time.monotonic()
+            return True
+
+    def release(self, token):
+        with self._lock:
+            self._admitted_processes.pop(token, None)
+
+    def _log_waiting(self, name):
+        LOGGER.info(f"{name}: Waiting for host resources, running processes: {self.running_processes}")
+
+    @contextmanager
+    def admit(self, name, wait_timeout):
+        """
+        Wait until the host has resources to start the process, hold the admission until the block exits.
+
+        Args:
+            name (str): Process name, used for logging.
+            wait_timeout (int): Timeout in seconds to wait for admission.
+
+        Raises:
+            TimeoutExpiredError: If the process was not admitted before the timeout.
+        """
+        token = object()
+        timeout_watch = TimeoutWatch(timeout=wait_timeout)
+        while not self.try_admit(token=token):
+            if not timeout_watch.remaining_time():
+                raise TimeoutExpiredError(value=f"{name}: host resources admission")
+
+            self._log_waiting(name=name)
+            time.sleep(min(self.poll_interval, timeout_watch.remaining_time()))
+
+        try:
+            yield
+
+        finally:
+            self.release(token=token)
+
+    @asynccontextmanager
+    async def admit_async(self, name, wait_timeout):
+        """
+        Async version of `admit`, waiting for admission does not block the event loop.
+        """
+        token = object()
+        timeout_watch = TimeoutWatch(timeout=wait_timeout)
+        while not self.try_admit(token=token):
+            if not timeout_watch.remaining_time():
+                raise TimeoutExpiredError(value=f"{name}: host resources admission")
+
+            self._log_waiting(name=name)
+            await asyncio.sleep(min(self.poll_interval, timeout_watch.remaining_time()))
+
+        try:
+            yield
+
+        finally:
+            self.release(token=token)
+
+    def limit_command(self, command):
+        """
+        Run the command in its own cgroup with a memory limit, using `systemd-run --scope`.
+
+        Args:
+            command (list): Command to run.
+
+        Returns:
+            list: The command wrapped with `systemd-run` if a cgroup memory limit is set, else the command.
+        """
+        if not self.cgroup_memory_limit_gib:
+            return command
+
+        if not shutil.which("systemd-run"):
+            LOGGER.warning("`systemd-run` not found, running command without cgroup memory limit")
+            return command
+
+        systemd_run = ["systemd-run", "--scope", "--quiet", "--collect"]
+        if os.geteuid() != 0:
+            systemd_run.append("--user")
+
+        return systemd_run + ["-p", f"MemoryMax={self.cgroup_memory_limit_gib}G", "--"] + command
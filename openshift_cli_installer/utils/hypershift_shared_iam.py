@@ -0,0 +1,155 @@
+import json
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+from botocore.exceptions import ClientError
+from clouds.aws.session_clients import s3_client
+from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutSampler
+
+from openshift_cli_installer.utils.const import (
+    HYPERSHIFT_SHARED_IAM_DIRECTORY_NAME,
+    HYPERSHIFT_SHARED_IAM_LOCK_STALE_TIMEOUT,
+)
+
+LOGGER = get_logger(name=__name__)
+
+
+class HypershiftSharedIamRegistry:
+    """
+    Registry of the OIDC config and operator roles shared by hypershift clusters, one per AWS account and region.
+
+    The registry is kept in S3 next to the clusters data, `<path>/hypershift-shared-iam/<account>-<region>.json`,
+    and lists the clusters using the shared resources (reference count). Updates are serialized with a lock object
+    created with a conditional write (`If-None-Match: *`); a lock older than `HYPERSHIFT_SHARED_IAM_LOCK_STALE_TIMEOUT`
+    was left by a killed run and is broken.
+    The shared resources are deleted when the last cluster using them releases its reference.
+    """
+
+    def __init__(self, s3_bucket_name, s3_bucket_path=None, client=None):
+        self.s3_bucket_name = s3_bucket_name
+        self.prefix = "/".join(filter(None, [s3_bucket_path, HYPERSHIFT_SHARED_IAM_DIRECTORY_NAME]))
+        self._client = client
+
+    @property
+    def client(self):
+        if not self._client:
+            self._client = s3_client()
+
+        return self._client
+
+    def _try_lock(self, lock_key):
+        try:
+            self.client.put_object(Bucket=self.s3_bucket_name, Key=lock_key, Body=b"", IfNoneMatch="*")
+            return True
+
+        except ClientError as ex:
+            if ex.response["Error"]["Code"] not in ("PreconditionFailed", "ConditionalRequestConflict"):
+                raise
+
+        try:
+            lock_time = self.client.head_object(Bucket=self.s3_bucket_name, Key=lock_key)["LastModified"]
+        except ClientError:
+            # Released meanwhile
+            return False
+
+        if datetime.now(tz=timezone.utc) - lock_time > timedelta(seconds=HYPERSHIFT_SHARED_IAM_LOCK_STALE_TIMEOUT):
+            LOGGER.warning(f"Breaking stale hypershift shared IAM registry lock {lock_key} from {lock_time}")
+            self.client.delete_object(Bucket=self.s3_bucket_name, Key=lock_key)
+
+        return False
+
+    @contextmanager
+    def _locked_registry_file(self, aws_account_id, region):
+        registry_file = f"{self.prefix}/{aws_account_id}-{region}.json"
+        lock_key = f"{registry_file}.lock"
+        for _locked in TimeoutSampler(
+            wait_timeout=HYPERSHIFT_SHARED_IAM_LOCK_STALE_TIMEOUT * 2,
+            sleep=5,
+            func=self._try_lock,
+            lock_key=lock_key,
+        ):
+            if _locked:
+                break
+
+        try:
+            yield registry_file
+
+        finally:
+            self.client.delete_object(Bucket=self.s3_bucket_name, Key=lock_key)
+
+    def _load(self, registry_file):
+        try:
+            return json.loads(self.client.get_object(Bucket=self.s3_bucket_name, Key=registry_file)["Body"].read())
+
+        except ClientError as ex:
+            if ex.response["Error"]["Code"] == "NoSuchKey":
+                return {}
+
+            raise
+
+    def _save(self, registry_file, data):
+        self.client.put_object(Bucket=self.s3_bucket_name, Key=registry_file, Body=json.dumps(data, indent=2).encode())
+
+    def acquire(self, aws_account_id, region, cluster_name, create_func):
+        """
+        Add a reference to the shared resources of the account and region, create them if missing.
+
+        Args:
+            aws_account_id (str): AWS account ID.
+            region (str): AWS region.
+            cluster_name (str): Cluster name, the reference owner.
+            create_func (callable): Create the shared resources, returns a dict with `oidc_config_id` and
+                `operator_roles_prefix`; called while the registry is locked.
+
+        Returns:
+            dict: `oidc_config_id` and `operator_roles_prefix`.
+        """
+        with self._locked_registry_file(aws_account_id=aws_account_id, region=region) as registry_file:
+            data = self._load(registry_file=registry_file)
+            if not data.get("oidc_config_id"):
+                LOGGER.info(f"Creating shared hypershift OIDC config and operator roles for {aws_account_id}/{region}")
+                data = {**create_func(), "clusters": []}
+
+            if cluster_name not in data["clusters"]:
+                data["clusters"].append(cluster_name)
+
+            self._save(registry_file=registry_file, data=data)
+            LOGGER.info(
+                f"{cluster_name} uses shared OIDC config {data['oidc_config_id']}, references: {len(data['clusters'])}"
+            )
+            return {"oidc_config_id": data["oidc_config_id"], "operator_roles_prefix": data["operator_roles_prefix"]}
+
+    def release(self, aws_account_id, region, cluster_name, delete_func):
+        """
+        Remove the cluster reference to the shared resources of the account and region, delete them once no cluster
+        uses them.
+
+        Args:
+            aws_account_id (str): AWS account ID.
+            region (str): AWS region.
+            cluster_name (str): Cluster name, the reference owner.
+            delete_func (callable): Delete the shared resources, called with `oidc_config_id` and
+                `operator_roles_prefix` while the registry is locked.
+
+        Returns:
+            int: Remaining references.
+        """
+        with self._locked_registry_file(aws_account_id=aws_account_id, region=region) as registry_file:
+            data = self._load(registry_file=registry_file)
+            clusters = data.get("clusters", [])
+            if cluster_name not in clusters:
+                LOGGER.warning(f"{cluster_name} has no shared OIDC config reference for {aws_account_id}/{region}")
+                return len(clusters)
+
+            clusters.remove(cluster_name)
+            LOGGER.info(
+                f"{cluster_name} released shared OIDC config {data['oidc_config_id']}, references: {len(clusters)}"
+            )
+            if not clusters:
+                LOGGER.info(f"Deleting shared hypershift OIDC config and operator roles for {aws_account_id}/{region}")
+                delete_func(oidc_config_id=data["oidc_config_id"], operator_roles_prefix=data["operator_roles_prefix"])
+                data = {}
+
+            self._save(registry_file=registry_file, data=data)
+            return len(clusters)
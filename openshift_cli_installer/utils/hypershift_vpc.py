@@ -0,0 +1,277 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutSampler
+
+from openshift_cli_installer.utils.const import (
+    HYPERSHIFT_VPC_CLUSTER_TAG,
+    HYPERSHIFT_VPC_DEFAULT_CIDR,
+    HYPERSHIFT_VPC_DEFAULT_PRIVATE_SUBNETS,
+    HYPERSHIFT_VPC_DEFAULT_PUBLIC_SUBNETS,
+    HYPERSHIFT_VPC_ROLE_TAG,
+)
+
+LOGGER = get_logger(name=__name__)
+
+
+def hypershift_az_ids(region):
+    """
+    Returns:
+        list: First two AZ IDs of the region, for example us-east-2 -> ["use2-az1", "use2-az2"]
+    """
+    az_id_prefix = "".join(re.match(r"(.*)-(\w).*-(\d)", region).groups())
+    return [f"{az_id_prefix}-az1", f"{az_id_prefix}-az2"]
+
+
+def _subnets_list(subnets, default):
+    if not subnets:
+        return list(default)
+
+    return subnets.split(",") if isinstance(subnets, str) else list(subnets)
+
+
+class HypershiftVpcProvisioner:
+    """
+    Create and delete the hypershift cluster network with the AWS API, same topology as `setup-vpc.tf`:
+    one VPC, two public and two private subnets, an internet gateway, a single NAT gateway and route tables.
+
+    Every resource is tagged with the cluster name and its role; tags are the provisioner state,
+    existing resources are reused on create and found on delete.
+    """
+
+    def __init__(self, cluster_name, region, cidr=None, private_subnets=None, public_subnets=None, client=None):
+        self.cluster_name = cluster_name
+        self.region = region
+        self.cidr = cidr or HYPERSHIFT_VPC_DEFAULT_CIDR
+        self.private_subnets = _subnets_list(subnets=private_subnets, default=HYPERSHIFT_VPC_DEFAULT_PRIVATE_SUBNETS)
+        self.public_subnets = _subnets_list(subnets=public_subnets, default=HYPERSHIFT_VPC_DEFAULT_PUBLIC_SUBNETS)
+        self.az_ids = hypershift_az_ids(region=region)
+        self.log_prefix = f"[C:{cluster_name}|R:{region}]"
+        # boto3 clients are thread-safe, sessions are not
+        self.client = client or boto3.session.Session(region_name=region).client(service_name="ec2")
+
+    def _tags(self, resource_type, role):
+        return [
+            {
+                "ResourceType": resource_type,
+                "Tags": [
+                    {"Key": "Name", "Value": f"{self.cluster_name}-{role}"},
+                    {"Key": HYPERSHIFT_VPC_CLUSTER_TAG, "Value": self.cluster_name},
+                    {"Key": HYPERSHIFT_VPC_ROLE_TAG, "Value": role},
+                ],
+            }
+        ]
+
+    def _filters(self, role=None):
+        filters = [{"Name": f"tag:{HYPERSHIFT_VPC_CLUSTER_TAG}", "Values": [self.cluster_name]}]
+        if role:
+            filters.append({"Name": f"tag:{HYPERSHIFT_VPC_ROLE_TAG}", "Values": [role]})
+
+        return filters
+
+    def _find(self, describe_func, key, role=None, extra_filters=None):
+        return getattr(self.client, describe_func)(Filters=self._filters(role=role) + (extra_filters or []))[key]
+
+    def get_vpc_id(self):
+        """
+        Returns:
+            str or None: VPC ID, None if the VPC does not exist.
+        """
+        vpcs = self._find(describe_func="describe_vpcs", key="Vpcs", role="vpc")
+        return vpcs[0]["VpcId"] if vpcs else None
+
+    def _get_or_create_vpc(self):
+        if vpc_id := self.get_vpc_id():
+            return vpc_id
+
+        vpc_id = self.client.create_vpc(
+            CidrBlock=self.cidr, TagSpecifications=self._tags(resource_type="vpc", role="vpc")
+        )["Vpc"]["VpcId"]
+        self.client.get_waiter("vpc_available").wait(VpcIds=[vpc_id])
+        for _attribute in ("EnableDnsSupport", "EnableDnsHostnames"):
+            self.client.modify_vpc_attribute(VpcId=vpc_id, **{_attribute: {"Value": True}})
+
+        return vpc_id
+
+    def _get_or_create_subnet(self, vpc_id, role, cidr, az_id):
+        if subnets := self._find(describe_func="describe_subnets", key="Subnets", role=role):
+            return subnets[0]["SubnetId"]
+
+        return self.client.create_subnet(
+            VpcId=vpc_id,
+            CidrBlock=cidr,
+            AvailabilityZoneId=az_id,
+            TagSpecifications=self._tags(resource_type="subnet", role=role),
+        )["Subnet"]["SubnetId"]
+
+    def _get_or_create_internet_gateway(self, vpc_id):
+        if internet_gateways := self._find(
+            describe_func="describe_internet_gateways", key="InternetGateways", role="igw"
+        ):
+            internet_gateway = internet_gateways[0]
+            if not internet_gateway.get("Attachments"):
+                self.client.attach_internet_gateway(
+                    InternetGatewayId=internet_gateway["InternetGatewayId"], VpcId=vpc_id
+                )
+
+            return internet_gateway["InternetGatewayId"]
+
+        internet_gateway_id = self.client.create_internet_gateway(
+            TagSpecifications=self._tags(resource_type="internet-gateway", role="igw")
+        )["InternetGateway"]["InternetGatewayId"]
+        self.client.attach_internet_gateway(InternetGatewayId=internet_gateway_id, VpcId=vpc_id)
+        return internet_gateway_id
+
+    def _get_or_allocate_eip(self):
+        if addresses := self._find(describe_func="describe_addresses", key="Addresses", role="nat-eip"):
+            return addresses[0]["AllocationId"]
+
+        return self.client.allocate_address(
+            Domain="vpc", TagSpecifications=self._tags(resource_type="elastic-ip", role="nat-eip")
+        )["AllocationId"]
+
+    def _get_or_create_nat_gateway(self, subnet_id, allocation_id):
+        if nat_gateways := self._find(
+            describe_func="describe_nat_gateways",
+            key="NatGateways",
+            role="nat",
+            extra_filters=[{"Name": "state", "Values": ["pending", "available"]}],
+        ):
+            nat_gateway_id = nat_gateways[0]["NatGatewayId"]
+        else:
+            nat_gateway_id = self.client.create_nat_gateway(
+                SubnetId=subnet_id,
+                AllocationId=allocation_id,
+                TagSpecifications=self._tags(resource_type="natgateway", role="nat"),
+            )["NatGateway"]["NatGatewayId"]
+
+        self.client.get_waiter("nat_gateway_available").wait(NatGatewayIds=[nat_gateway_id])
+        return nat_gateway_id
+
+    def _get_or_create_route_table(self, vpc_id, role, subnet_ids, gateway_kwargs):
+        if route_tables := self._find(describe_func="describe_route_tables", key="RouteTables", role=role):
+            return route_tables[0]["RouteTableId"]
+
+        route_table_id = self.client.create_route_table(
+            VpcId=vpc_id, TagSpecifications=self._tags(resource_type="route-table", role=role)
+        )["RouteTable"]["RouteTableId"]
+        self.client.create_route(RouteTableId=route_table_id, DestinationCidrBlock="0.0.0.0/0", **gateway_kwargs)
+        for _subnet_id in subnet_ids:
+            self.client.associate_route_table(RouteTableId=route_table_id, SubnetId=_subnet_id)
+
+        return route_table_id
+
+    def create(self):
+        """
+        Create the network, resources which already exist (by tags) are reused.
+
+        Returns:
+            dict: `public_subnets` and `private_subnets` subnets IDs lists, in AZ order.
+        """
+        LOGGER.info(f"{self.log_prefix}: Creating hypershift VPC")
+        vpc_id = self._get_or_create_vpc()
+        with ThreadPoolExecutor() as executor:
+            internet_gateway_future = executor.submit(self._get_or_create_internet_gateway, vpc_id)
+            eip_future = executor.submit(self._get_or_allocate_eip)
+            subnets_futures = {
+                _subnet_type: [
+                    executor.submit(self._get_or_create_subnet, vpc_id, f"{_subnet_type}-{idx}", _cidr, _az_id)
+                    for idx, (_cidr, _az_id) in enumerate(zip(_cidrs, self.az_ids))
+                ]
+                for _subnet_type, _cidrs in (("public", self.public_subnets), ("private", self.private_subnets))
+            }
+            subnets = {
+                _subnet_type: [_future.result() for _future in _futures]
+                for _subnet_type, _futures in subnets_futures.items()
+            }
+
+            public_route_table_future = executor.submit(
+                self._get_or_create_route_table,
+                vpc_id,
+                "public-rtb",
+                subnets["public"],
+                {"GatewayId": internet_gateway_future.result()},
+            )
+            nat_gateway_id = self._get_or_create_nat_gateway(
+                subnet_id=subnets["public"][0], allocation_id=eip_future.result()
+            )
+            self._get_or_create_route_table(
+                vpc_id=vpc_id,
+                role="private-rtb",
+                subnet_ids=subnets["private"],
+                gateway_kwargs={"NatGatewayId": nat_gateway_id},
+            )
+            public_route_table_future.result()
+
+        LOGGER.info(f"{self.log_prefix}: Hypershift VPC {vpc_id} created")
+        return {"public_subnets": subnets["public"], "private_subnets": subnets["private"]}
+
+    def _delete_nat_gateways(self):
+        nat_gateways_ids = [
+            _nat_gateway["NatGatewayId"]
+            for _nat_gateway in self._find(
+                describe_func="describe_nat_gateways",
+                key="NatGateways",
+                extra_filters=[{"Name": "state", "Values": ["pending", "available", "deleting"]}],
+            )
+        ]
+        for _nat_gateway_id in nat_gateways_ids:
+            self.client.delete_nat_gateway(NatGatewayId=_nat_gateway_id)
+
+        if nat_gateways_ids:
+            for sample in TimeoutSampler(
+                wait_timeout=600,
+                sleep=10,
+                func=self.client.describe_nat_gateways,
+                NatGatewayIds=nat_gateways_ids,
+            ):
+                if all(_nat_gateway["State"] == "deleted" for _nat_gateway in sample["NatGateways"]):
+                    break
+
+    def _delete_internet_gateways(self):
+        for _internet_gateway in self._find(describe_func="describe_internet_gateways", key="InternetGateways"):
+            for _attachment in _internet_gateway.get("Attachments", []):
+                self.client.detach_internet_gateway(
+                    InternetGatewayId=_internet_gateway["InternetGatewayId"], VpcId=_attachment["VpcId"]
+                )
+
+            self.client.delete_internet_gateway(InternetGatewayId=_internet_gateway["InternetGatewayId"])
+
+    def _release_addresses(self):
+        for _address in self._find(describe_func="describe_addresses", key="Addresses"):
+            self.client.release_address(AllocationId=_address["AllocationId"])
+
+    def _delete_route_tables(self):
+        for _route_table in self._find(describe_func="describe_route_tables", key="RouteTables"):
+            for _association in _route_table.get("Associations", []):
+                if not _association.get("Main"):
+                    self.client.disassociate_route_table(AssociationId=_association["RouteTableAssociationId"])
+
+            self.client.delete_route_table(RouteTableId=_route_table["RouteTableId"])
+
+    def destroy(self):
+        """
+        Delete all the network resources tagged with the cluster name, independent resources are deleted concurrently.
+        """
+        LOGGER.info(f"{self.log_prefix}: Deleting hypershift VPC")
+        # NAT gateway holds network interfaces in the public subnet and the elastic IP
+        self._delete_nat_gateways()
+        subnets_ids = [_subnet["SubnetId"] for _subnet in self._find(describe_func="describe_subnets", key="Subnets")]
+        with ThreadPoolExecutor() as executor:
+            futures = [
+                executor.submit(self._delete_internet_gateways),
+                executor.submit(self._release_addresses),
+                executor.submit(self._delete_route_tables),
+            ]
+            futures.extend(
+                executor.submit(self.client.delete_subnet, SubnetId=_subnet_id) for _subnet_id in subnets_ids
+            )
+            for _future in futures:
+                _future.result()
+
+        for _vpc in self._find(describe_func="describe_vpcs", key="Vpcs"):
+            self.client.delete_vpc(VpcId=_vpc["VpcId"])
+
+        LOGGER.info(f"{self.log_prefix}: Hypershift VPC deleted")
@@ -0,0 +1,233 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import boto3
+import shortuuid
+from botocore.exceptions import BotoCoreError, ClientError
+from simple_logger.logger import get_logger
+
+from openshift_cli_installer.utils.const import (
+    HYPERSHIFT_VPC_CLUSTER_TAG,
+    HYPERSHIFT_VPC_POOL_AVAILABLE_STR,
+    HYPERSHIFT_VPC_POOL_CLAIMED_BY_TAG,
+    HYPERSHIFT_VPC_POOL_CLAIMED_STR,
+    HYPERSHIFT_VPC_POOL_LEASE_SETTLE_SECONDS,
+    HYPERSHIFT_VPC_POOL_LEASE_TAG_PREFIX,
+    HYPERSHIFT_VPC_POOL_LEASE_TTL,
+    HYPERSHIFT_VPC_POOL_TAG,
+)
+from openshift_cli_installer.utils.hypershift_vpc import HypershiftVpcProvisioner
+
+LOGGER = get_logger(name=__name__)
+
+# Network interfaces owned by the pool VPC itself, any other in-use interface means the VPC is still used
+POOL_VPC_NETWORK_INTERFACE_TYPES = ("nat_gateway",)
+
+
+class HypershiftVpcPool:
+    """
+    Pool of pre-provisioned hypershift VPCs in a region, created by `HypershiftVpcProvisioner` with the default
+    CIDRs and tagged with `HYPERSHIFT_VPC_POOL_TAG` = available / claimed.
+
+    EC2 tags have no conditional update; a claim adds a lease tag with a key unique to the claimant, waits for
+    concurrent claimants leases to be visible and the earliest live lease wins the VPC.
+    """
+
+    def __init__(self, region, client=None, lease_settle_seconds=HYPERSHIFT_VPC_POOL_LEASE_SETTLE_SECONDS):
+        self.region = region
+        self.lease_settle_seconds = lease_settle_seconds
+        self.log_prefix = f"[VPC pool|R:{region}]"
+        self.client = client or boto3.session.Session(region_name=region).client(service_name="ec2")
+
+    def provisioner(self, pool_vpc_name):
+        return HypershiftVpcProvisioner(cluster_name=pool_vpc_name, region=self.region, client=self.client)
+
+    def _pool_vpcs(self, state):
+        return self.client.describe_vpcs(Filters=[{"Name": f"tag:{HYPERSHIFT_VPC_POOL_TAG}", "Values": [state]}])[
+            "Vpcs"
+        ]
+
+    @staticmethod
+    def _tags(vpc):
+        return {_tag["Key"]: _tag["Value"] for _tag in vpc.get("Tags", [])}
+
+    def available_vpcs(self):
+        """
+        Returns:
+            list: Pool names of the available VPCs.
+        """
+        return [
+            self._tags(vpc=_vpc)[HYPERSHIFT_VPC_CLUSTER_TAG]
+            for _vpc in self._pool_vpcs(state=HYPERSHIFT_VPC_POOL_AVAILABLE_STR)
+        ]
+
+    def _add_vpc(self):
+        pool_vpc_name = f"vpc-pool-{shortuuid.uuid()[:10].lower()}"
+        provisioner = self.provisioner(pool_vpc_name=pool_vpc_name)
+        try:
+            provisioner.create()
+        except (BotoCoreError, ClientError) as ex:
+            LOGGER.error(f"{self.log_prefix}: Failed to create pool VPC {pool_vpc_name}: {ex}, deleting it")
+            provisioner.destroy()
+            raise
+
+        vpc_id = provisioner.get_vpc_id()
+        # Only fully created VPCs join the pool
+        self.client.create_tags(
+            Resources=[vpc_id], Tags=[{"Key": HYPERSHIFT_VPC_POOL_TAG, "Value": HYPERSHIFT_VPC_POOL_AVAILABLE_STR}]
+        )
+        LOGGER.info(f"{self.log_prefix}: Added {pool_vpc_name} to the pool")
+        return pool_vpc_name
+
+    def refill(self, size):
+        """
+        Create VPCs until the pool has `size` available VPCs.
+
+        Returns:
+            list: Pool names of the created VPCs.
+        """
+        missing = size - len(self.available_vpcs())
+        if missing <= 0:
+            LOGGER.info(f"{self.log_prefix}: Pool is full")
+            return []
+
+        LOGGER.info(f"{self.log_prefix}: Adding {missing} VPCs to the pool")
+        with ThreadPoolExecutor(max_workers=missing) as executor:
+            futures = [executor.submit(self._add_vpc) for _ in range(missing)]
+
+        return [_future.result() for _future in futures]
+
+    def _live_leases(self, vpc_id):
+        vpc = self.client.describe_vpcs(VpcIds=[vpc_id])["Vpcs"][0]
+        now = time.time()
+        leases = []
+        for _key, _value in self._tags(vpc=vpc).items():
+            if _key.startswith(HYPERSHIFT_VPC_POOL_LEASE_TAG_PREFIX):
+                lease_time = float(_value)
+                # Leases of crashed claimants must not block the VPC forever
+                if now - lease_time < HYPERSHIFT_VPC_POOL_LEASE_TTL:
+                    leases.append((lease_time, _key))
+
+        return vpc, sorted(leases)
+
+    def _try_claim(self, vpc, claimant):
+        vpc_id = vpc["VpcId"]
+        lease_key = f"{HYPERSHIFT_VPC_POOL_LEASE_TAG_PREFIX}{shortuuid.uuid()}"
+        self.client.create_tags(Resources=[vpc_id], Tags=[{"Key": lease_key, "Value": f"{time.time():.6f}"}])
+        time.sleep(self.lease_settle_seconds)
+        vpc, leases = self._live_leases(vpc_id=vpc_id)
+        won = (
+            self._tags(vpc=vpc).get(HYPERSHIFT_VPC_POOL_TAG) == HYPERSHIFT_VPC_POOL_AVAILABLE_STR
+            and leases
+            and leases[0][1] == lease_key
+        )
+        if won:
+            self.client.create_tags(
+                Resources=[vpc_id],
+                Tags=[
+                    {"Key": HYPERSHIFT_VPC_POOL_TAG, "Value": HYPERSHIFT_VPC_POOL_CLAIMED_STR},
+                    {"Key": HYPERSHIFT_VPC_POOL_CLAIMED_BY_TAG, "Value": claimant},
+                ],
+            )
+
+        self.client.delete_tags(Resources=[vpc_id], Tags=[{"Key": lease_key}])
+        return won
+
+    def claim(self, claimant):
+        """
+        Claim an available VPC.
+
+        Args:
+            claimant (str): Cluster name, saved in the VPC tags.
+
+        Returns:
+            str or None: Claimed VPC pool name, None if no VPC could be claimed.
+        """
+        for _vpc in self._pool_vpcs(state=HYPERSHIFT_VPC_POOL_AVAILABLE_STR):
+            try:
+                if self._try_claim(vpc=_vpc, claimant=claimant):
+                    pool_vpc_name = self._tags(vpc=_vpc)[HYPERSHIFT_VPC_CLUSTER_TAG]
+                    LOGGER.info(f"{self.log_prefix}: {claimant} claimed {pool_vpc_name}")
+                    return pool_vpc_name
+
+            except (BotoCoreError, ClientError) as ex:
+                LOGGER.warning(f"{self.log_prefix}: Failed to claim {_vpc['VpcId']}: {ex}")
+
+        LOGGER.info(f"{self.log_prefix}: No available VPC in the pool for {claimant}")
+        return None
+
+    def _clean(self, vpc_id):
+        for _network_interface in self.client.describe_network_interfaces(
+            Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
+        )["NetworkInterfaces"]:
+            if _network_interface.get("InterfaceType") in POOL_VPC_NETWORK_INTERFACE_TYPES:
+                continue
+
+            if _network_interface["Status"] != "available":
+                LOGGER.warning(
+                    f"{self.log_prefix}: {vpc_id} network interface {_network_interface['NetworkInterfaceId']} "
+                    "is still in use"
+                )
+                return False
+
+            self.client.delete_network_interface(NetworkInterfaceId=_network_interface["NetworkInterfaceId"])
+
+        for _security_group in self.client.describe_security_groups(Filters=[{"Name": "vpc-id", "Values": [vpc_id]}])[
+            "SecurityGroups"
+        ]:
+            if _security_group["GroupName"] != "default":
+                self.client.delete_security_group(GroupId=_security_group["GroupId"])
+
+        # Subnets are tagged by the cluster (kubernetes.io/cluster/<id>, kubernetes.io/role/elb)
+        for _subnet in self.client.describe_subnets(Filters=[{"Name": "vpc-id", "Values": [vpc_id]}])["Subnets"]:
+            cluster_tags = [
+                {"Key": _tag["Key"]} for _tag in _subnet.get("Tags", []) if _tag["Key"].startswith("kubernetes.io/")
+            ]
+            if cluster_tags:
+                self.client.delete_tags(Resources=[_subnet["SubnetId"]], Tags=cluster_tags)
+
+        return True
+
+    def release(self, pool_vpc_name):
+        """
+        Clean a claimed VPC and return it to the pool.
+
+        Returns:
+            bool: True if the VPC is back in the pool, False if it could not be cleaned and should be deleted.
+        """
+        try:
+            vpc_id = self.provisioner(pool_vpc_name=pool_vpc_name).get_vpc_id()
+            if not vpc_id:
+                LOGGER.warning(f"{self.log_prefix}: Pool VPC {pool_vpc_name} not found")
+                return False
+
+            if not self._clean(vpc_id=vpc_id):
+                return False
+
+            self.client.delete_tags(Resources=[vpc_id], Tags=[{"Key": HYPERSHIFT_VPC_POOL_CLAIMED_BY_TAG}])
+            self.client.create_tags(
+                Resources=[vpc_id], Tags=[{"Key": HYPERSHIFT_VPC_POOL_TAG, "Value": HYPERSHIFT_VPC_POOL_AVAILABLE_STR}]
+            )
+
+        except (BotoCoreError, ClientError) as ex:
+            LOGGER.warning(f"{self.log_prefix}: Failed to clean {pool_vpc_name}: {ex}")
+            return False
+
+        LOGGER.info(f"{self.log_prefix}: Returned {pool_vpc_name} to the pool")
+        return True
+
+    def destroy(self, pool_vpc_name):
+        self.provisioner(pool_vpc_name=pool_vpc_name).destroy()
+
+
+def refill_hypershift_vpc_pools(regions, size):
+    """
+    Refill the VPC pool of every region concurrently.
+
+    Returns:
+        dict: Region to created VPCs pool names.
+    """
+    with ThreadPoolExecutor(max_workers=len(regions)) as executor:
+        futures = {_region: executor.submit(HypershiftVpcPool(region=_region).refill, size=size) for _region in regions}
+
+    return {_region: _future.result() for _region, _future in futures.items()}
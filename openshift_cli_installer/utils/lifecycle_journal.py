@@ -0,0 +1,69 @@
+import json
+import os
+import threading
+from datetime import datetime
+
+from simple_logger.logger import get_logger
+
+from openshift_cli_installer.utils.const import LIFECYCLE_JOURNAL_FILENAME
+
+LOGGER = get_logger(name=__name__)
+
+
+class LifecycleJournal:
+    """
+    Append-only journal of cluster lifecycle phases.
+
+    Every completed phase is appended as a JSON line to `<cluster-dir>/lifecycle-journal.jsonl` and synced to disk,
+    so a create can be resumed from the last completed phase after the runner dies.
+    A partially written last line (crash during write) is ignored.
+    """
+
+    def __init__(self, cluster_dir):
+        self.journal_file = os.path.join(cluster_dir, LIFECYCLE_JOURNAL_FILENAME)
+        # Independent phases may complete concurrently
+        self._lock = threading.Lock()
+
+    @property
+    def records(self):
+        if not os.path.exists(self.journal_file):
+            return []
+
+        _records = []
+        with open(self.journal_file) as fd:
+            for line in fd:
+                try:
+                    _records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    LOGGER.warning(f"Ignoring corrupted journal record in {self.journal_file}: {line}")
+
+        return _records
+
+    @property
+    def completed_phases(self):
+        return [_record["phase"] for _record in self.records]
+
+    @property
+    def data(self):
+        """
+        Returns:
+            dict: All phases data merged, later phases override earlier ones.
+        """
+        _data = {}
+        for _record in self.records:
+            _data.update(_record.get("data", {}))
+
+        return _data
+
+    def is_completed(self, phase):
+        return phase in self.completed_phases
+
+    def record(self, phase, **data):
+        with self._lock, open(self.journal_file, "a") as fd:
+            fd.write(json.dumps({"phase": phase, "time": datetime.now().isoformat(), "data": data}) + "\n")
+            fd.flush()
+            os.fsync(fd.fileno())
+
+    def clear(self):
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
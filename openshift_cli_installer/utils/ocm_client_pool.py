@@ -0,0 +1,109 @@
+import hashlib
+import threading
+
+from ocm_python_client.exceptions import ApiException, UnauthorizedException
+from ocm_python_wrapper.ocm_client import OCMPythonClient
+from simple_logger.logger import get_logger
+
+from openshift_cli_installer.utils.const import OCM_SSO_ENDPOINT, OCM_THROTTLING_RETRIES
+from openshift_cli_installer.utils.ocm_token_cache import OCMAccessTokenCache
+from openshift_cli_installer.utils.rate_limiter import get_ocm_rate_limiter, parse_retry_after
+
+LOGGER = get_logger(name=__name__)
+
+_OCM_CLIENTS = {}
+_OCM_CLIENTS_LOCK = threading.Lock()
+
+
+class SharedOCMPythonClient(OCMPythonClient):
+    """
+    OCM client shared between threads.
+
+    When the access token expires, only one thread exchanges the offline token for a new access token;
+    threads which failed with the expired access token retry with the refreshed one.
+    With `token_cache`, the access token is taken from (and saved to) the on-disk cache instead of
+    exchanging the offline token on every run.
+    All API calls go through the process-wide OCM rate limiter; throttled (429) calls are retried after `Retry-After`.
+    """
+
+    def __init__(self, token, api_host, token_cache=None):
+        self.refresh_lock = threading.Lock()
+        self.token_cache = token_cache
+        super().__init__(token=token, endpoint=OCM_SSO_ENDPOINT, api_host=api_host, discard_unknown_keys=True)
+
+    def _OCMPythonClient__confirm_auth(self):
+        # Overrides the private `OCMPythonClient` token exchange called when the client is created
+        if self.token_cache and (access_token := self.token_cache.get()):
+            return access_token
+
+        return self.exchange_access_token()
+
+    def exchange_access_token(self):
+        access_token = super()._OCMPythonClient__confirm_auth()
+        if self.token_cache:
+            self.token_cache.set(access_token=access_token)
+
+        return access_token
+
+    def refresh_access_token(self, expired_access_token):
+        with self.refresh_lock:
+            if self.client_config.access_token == expired_access_token:
+                LOGGER.warning("Refreshing shared OCM client token.")
+                self.client_config.access_token = self.exchange_access_token()
+
+    def _call_api(self, *args, **kwargs):
+        access_token = self.client_config.access_token
+        try:
+            # Skip `OCMPythonClient.call_api` token refresh, refresh is done once for all threads
+            return super(OCMPythonClient, self).call_api(*args, **kwargs)
+
+        except UnauthorizedException:
+            self.refresh_access_token(expired_access_token=access_token)
+            return super(OCMPythonClient, self).call_api(*args, **kwargs)
+
+    def call_api(self, *args, **kwargs):
+        rate_limiter = get_ocm_rate_limiter()
+        for attempt in range(OCM_THROTTLING_RETRIES + 1):
+            rate_limiter.acquire()
+            try:
+                result = self._call_api(*args, **kwargs)
+
+            except ApiException as ex:
+                if ex.status != 429 or attempt == OCM_THROTTLING_RETRIES:
+                    raise
+
+                rate_limiter.throttled(retry_after=parse_retry_after(headers=ex.headers))
+                continue
+
+            rate_limiter.succeeded()
+            return result
+
+
+def get_shared_ocm_client(ocm_token, ocm_env, token_cache=False):
+    """
+    Get an authenticated OCM client, one client (and HTTP connections pool) is shared per (token, OCM env).
+
+    Args:
+        ocm_token (str): OCM offline token.
+        ocm_env (str): OCM environment (production or stage).
+        token_cache (bool, default False): Reuse the access token cached on disk by previous runs.
+
+    Returns:
+        SharedOCMPythonClient: OCM client.
+    """
+    key = (hashlib.sha256(ocm_token.encode()).hexdigest(), ocm_env)
+    with _OCM_CLIENTS_LOCK:
+        if key not in _OCM_CLIENTS:
+            LOGGER.info(f"Creating shared OCM client for {ocm_env}")
+            _OCM_CLIENTS[key] = SharedOCMPythonClient(
+                token=ocm_token,
+                api_host=ocm_env,
+                token_cache=OCMAccessTokenCache(ocm_token=ocm_token, ocm_env=ocm_env) if token_cache else None,
+            )
+
+        return _OCM_CLIENTS[key]
+
+
+def clear_shared_ocm_clients():
+    with _OCM_CLIENTS_LOCK:
+        _OCM_CLIENTS.clear()
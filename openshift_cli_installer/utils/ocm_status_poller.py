@@ -0,0 +1,174 @@
+import asyncio
+import threading
+import time
+
+from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutExpiredError, TimeoutWatch
+
+from openshift_cli_installer.utils.clusters import search_ocm_clusters_by_names
+from openshift_cli_installer.utils.const import OCM_STATUS_POLL_INTERVAL
+
+LOGGER = get_logger(name=__name__)
+
+_OCM_STATUS_POLLERS = {}
+_OCM_STATUS_POLLERS_LOCK = threading.Lock()
+
+
+class OCMClustersStatusPoller:
+    """
+    Poll the state of all tracked clusters of an OCM environment with one search request per interval.
+
+    Waiters track a cluster and are notified after every poll, the number of OCM requests does not depend
+    on the number of waiting clusters.
+    The poller thread runs only while clusters are tracked.
+    """
+
+    def __init__(self, ocm_client, ocm_env, interval=OCM_STATUS_POLL_INTERVAL):
+        self.ocm_client = ocm_client
+        self.ocm_env = ocm_env
+        self.interval = interval
+        self.api_calls = 0
+        self._condition = threading.Condition()
+        # cluster name as key, number of waiters as value
+        self._tracked_clusters = {}
+        # cluster name as key, OCM cluster (None if the cluster does not exist) as value
+        self._ocm_clusters = {}
+        self._generation = 0
+        self._poller_thread = None
+
+    def track(self, name):
+        with self._condition:
+            self._tracked_clusters[name] = self._tracked_clusters.get(name, 0) + 1
+            if not self._poller_thread:
+                self._poller_thread = threading.Thread(
+                    target=self._poll, name=f"ocm-status-poller-{self.ocm_env}", daemon=True
+                )
+                self._poller_thread.start()
+
+    def untrack(self, name):
+        with self._condition:
+            self._tracked_clusters[name] -= 1
+            if not self._tracked_clusters[name]:
+                self._tracked_clusters.pop(name)
+                self._ocm_clusters.pop(name, None)
+
+    def poll_once(self):
+        with self._condition:
+            names = list(self._tracked_clusters)
+
+        if not names:
+            return
+
+        ocm_clusters = {
+            _cluster.name: _cluster
+            for _cluster in search_ocm_clusters_by_names(ocm_client=self.ocm_client, names=names)
+        }
+        self.api_calls += 1
+        with self._condition:
+            for _name in names:
+                ocm_cluster = ocm_clusters.get(_name)
+                previous_ocm_cluster = self._ocm_clusters.get(_name)
+                state = str(ocm_cluster.state) if ocm_cluster else None
+                if not previous_ocm_cluster or state != str(previous_ocm_cluster.state):
+                    LOGGER.info(f"Cluster {_name} state: {state or 'does not exist'}")
+
+                self._ocm_clusters[_name] = ocm_cluster
+
+            self._generation += 1
+            self._condition.notify_all()
+
+    def _poll(self):
+        while True:
+            with self._condition:
+                if not self._tracked_clusters:
+                    self._poller_thread = None
+                    return
+
+            try:
+                self.poll_once()
+
+            except Exception as ex:
+                LOGGER.warning(f"Failed to poll {self.ocm_env} OCM clusters status: {ex}")
+
+            time.sleep(self.interval)
+
+    def _polled_ocm_cluster(self, name, func):
+        """
+        Returns:
+            tuple: True and the OCM cluster if `func` returned True for the last polled OCM cluster, else False, None.
+        """
+        if name not in self._ocm_clusters:
+            return False, None
+
+        ocm_cluster = self._ocm_clusters[name]
+        return bool(func(ocm_cluster)), ocm_cluster
+
+    def wait_for_cluster(self, name, func, wait_timeout):
+        """
+        Wait until `func` returns True for the polled OCM cluster.
+
+        Args:
+            name (str): Cluster name.
+            func (callable): Called with the OCM cluster (None if the cluster does not exist), may raise to stop waiting.
+            wait_timeout (int): Timeout in seconds.
+
+        Returns:
+            OCM cluster or None: The OCM cluster `func` returned True for.
+
+        Raises:
+            TimeoutExpiredError: If `func` did not return True before the timeout.
+        """
+        timeout_watch = TimeoutWatch(timeout=wait_timeout)
+        self.track(name=name)
+        try:
+            with self._condition:
+                generation = self._generation
+                while True:
+                    if self._generation != generation:
+                        generation = self._generation
+                        done, ocm_cluster = self._polled_ocm_cluster(name=name, func=func)
+                        if done:
+                            return ocm_cluster
+
+                    remaining_time = timeout_watch.remaining_time()
+                    if not remaining_time:
+                        raise TimeoutExpiredError(value=f"Cluster {name} OCM state")
+
+                    self._condition.wait(timeout=remaining_time)
+
+        finally:
+            self.untrack(name=name)
+
+    async def wait_for_cluster_async(self, name, func, wait_timeout):
+        """
+        Async version of `wait_for_cluster`, waits on the event loop without holding a thread.
+        """
+        timeout_watch = TimeoutWatch(timeout=wait_timeout)
+        self.track(name=name)
+        try:
+            generation = self._generation
+            while True:
+                if self._generation != generation:
+                    with self._condition:
+                        generation = self._generation
+                        done, ocm_cluster = self._polled_ocm_cluster(name=name, func=func)
+
+                    if done:
+                        return ocm_cluster
+
+                remaining_time = timeout_watch.remaining_time()
+                if not remaining_time:
+                    raise TimeoutExpiredError(value=f"Cluster {name} OCM state")
+
+                await asyncio.sleep(min(1, remaining_time))
+
+        finally:
+            self.untrack(name=name)
+
+
+def get_ocm_clusters_status_poller(ocm_client, ocm_env):
+    with _OCM_STATUS_POLLERS_LOCK:
+        if ocm_env not in _OCM_STATUS_POLLERS:
+            _OCM_STATUS_POLLERS[ocm_env] = OCMClustersStatusPoller(ocm_client=ocm_client, ocm_env=ocm_env)
+
+        return _OCM_STATUS_POLLERS[ocm_env]
@@ -0,0 +1,84 @@
+import base64
+import hashlib
+import json
+import os
+import stat
+import time
+from pathlib import Path
+
+from simple_logger.logger import get_logger
+
+from openshift_cli_installer.utils.const import OCM_TOKEN_CACHE_DIRECTORY, OCM_TOKEN_CACHE_EXPIRY_MARGIN
+
+LOGGER = get_logger(name=__name__)
+
+
+class OCMAccessTokenCache:
+    """
+    On-disk cache of exchanged OCM access tokens, shared between processes.
+
+    One file per (offline token hash, OCM env), readable only by the owner.
+    Cached access token is used until `expiry_margin` seconds before it expires.
+    """
+
+    def __init__(
+        self,
+        ocm_token,
+        ocm_env,
+        cache_dir=OCM_TOKEN_CACHE_DIRECTORY,
+        expiry_margin=OCM_TOKEN_CACHE_EXPIRY_MARGIN,
+    ):
+        self.cache_dir = cache_dir
+        self.cache_file = os.path.join(cache_dir, f"{hashlib.sha256(ocm_token.encode()).hexdigest()}-{ocm_env}.json")
+        self.expiry_margin = expiry_margin
+
+    @staticmethod
+    def access_token_expiry(access_token):
+        """
+        Returns:
+            int or None: access token (JWT) `exp` claim, None if the token cannot be decoded.
+        """
+        try:
+            payload = access_token.split(".")[1]
+            return json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))["exp"]
+
+        except (IndexError, KeyError, ValueError):
+            return None
+
+    def is_owner_only(self):
+        file_stat = os.stat(self.cache_file)
+        return file_stat.st_uid == os.getuid() and not file_stat.st_mode & (stat.S_IRWXG | stat.S_IRWXO)
+
+    def get(self):
+        """
+        Returns:
+            str or None: cached access token, None if missing, expired or the cache file is not owner-only.
+        """
+        try:
+            if not self.is_owner_only():
+                LOGGER.warning(f"Ignoring OCM token cache {self.cache_file}, file is accessible by other users")
+                return None
+
+            with open(self.cache_file) as fd:
+                cached_token = json.load(fd)
+
+        except (OSError, ValueError):
+            return None
+
+        if cached_token.get("expiry", 0) - self.expiry_margin <= time.time():
+            return None
+
+        LOGGER.info("Using cached OCM access token")
+        return cached_token.get("access_token")
+
+    def set(self, access_token):
+        expiry = self.access_token_expiry(access_token=access_token)
+        if not expiry:
+            return
+
+        Path(self.cache_dir).mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_cache_file = f"{self.cache_file}.{os.getpid()}.tmp"
+        with os.fdopen(os.open(tmp_cache_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "w") as fd:
+            json.dump({"access_token": access_token, "expiry": expiry}, fd)
+
+        os.replace(tmp_cache_file, self.cache_file)
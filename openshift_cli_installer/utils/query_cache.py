@@ -0,0 +1,142 @@
+import fcntl
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from simple_logger.logger import get_logger
+
+from openshift_cli_installer.utils.const import QUERY_CACHE_DEFAULT_TTL, QUERY_CACHE_DIRECTORY
+
+LOGGER = get_logger(name=__name__)
+
+
+class QueryResultsCache:
+    """
+    On-disk TTL cache of read-only ROSA and OCM query results (versions, regions), shared between processes.
+
+    One JSON file per query key; a per-key file lock makes concurrent processes run a missing query only once.
+    With `bypass`, cached results are ignored and replaced with fresh results.
+    The cache is best effort: when the cache directory is not usable (read-only or full), queries run uncached.
+    """
+
+    def __init__(self, cache_dir=QUERY_CACHE_DIRECTORY, ttl=QUERY_CACHE_DEFAULT_TTL, bypass=False):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.bypass = bypass
+
+    @staticmethod
+    def cache_key(query, **key_parts):
+        """
+        Args:
+            query (str): Query name, for example `list versions`.
+            **key_parts: Values the query result depends on (OCM env, region, flags).
+
+        Returns:
+            str: Cache key.
+        """
+        return hashlib.sha256(json.dumps({"query": query, **key_parts}, sort_keys=True).encode()).hexdigest()
+
+    def _cache_file(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key):
+        """
+        Returns:
+            tuple: True and the cached result if a cached result exists and is not expired, else False, None.
+        """
+        if self.bypass:
+            return False, None
+
+        try:
+            with open(self._cache_file(key=key)) as fd:
+                cached_result = json.load(fd)
+
+        except (OSError, ValueError):
+            return False, None
+
+        if cached_result.get("created", 0) + self.ttl <= time.time():
+            return False, None
+
+        return True, cached_result.get("result")
+
+    def set(self, key, result):
+        cache_file = self._cache_file(key=key)
+        tmp_cache_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            Path(self.cache_dir).mkdir(parents=True, exist_ok=True)
+            with open(tmp_cache_file, "w") as fd:
+                json.dump({"created": time.time(), "result": result}, fd)
+
+            os.replace(tmp_cache_file, cache_file)
+
+        except OSError as ex:
+            LOGGER.warning(f"Failed to cache query result in {self.cache_dir}: {ex}")
+
+    @contextmanager
+    def _locked_key(self, key):
+        """
+        Lock the query key for concurrent processes.
+
+        Yields:
+            bool: True if the key is locked, False if the cache directory is not usable.
+        """
+        lock_fd = None
+        try:
+            Path(self.cache_dir).mkdir(parents=True, exist_ok=True)
+            lock_fd = open(os.path.join(self.cache_dir, f"{key}.lock"), "w")
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)
+
+        except OSError as ex:
+            LOGGER.warning(f"Query cache {self.cache_dir} is not usable, running the query without cache: {ex}")
+            if lock_fd:
+                lock_fd.close()
+
+            lock_fd = None
+
+        if not lock_fd:
+            yield False
+            return
+
+        try:
+            yield True
+
+        finally:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+            lock_fd.close()
+
+    def get_or_fetch(self, query, func, **key_parts):
+        """
+        Get query result from the cache, run `func` to fetch and cache it if missing or expired.
+
+        Args:
+            query (str): Query name.
+            func (callable): Fetch the query result, result must be JSON serializable.
+            **key_parts: Values the query result depends on (OCM env, region, flags).
+
+        Returns:
+            Query result.
+        """
+        if not self.ttl:
+            return func()
+
+        key = self.cache_key(query, **key_parts)
+        found, result = self.get(key=key)
+        if found:
+            LOGGER.info(f"Using cached `{query}` result ({key_parts})")
+            return result
+
+        with self._locked_key(key=key) as locked:
+            if not locked:
+                return func()
+
+            # Another process may have fetched the result while we waited for the lock
+            found, result = self.get(key=key)
+            if found:
+                return result
+
+            result = func()
+            self.set(key=key, result=result)
+            return result
@@ -0,0 +1,126 @@
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from simple_logger.logger import get_logger
+
+from openshift_cli_installer.utils.const import OCM_RATE_LIMIT_DEFAULT
+
+LOGGER = get_logger(name=__name__)
+
+_OCM_RATE_LIMITER = None
+_OCM_RATE_LIMITER_LOCK = threading.Lock()
+
+
+class TokenBucketRateLimiter:
+    """
+    Thread-safe token bucket rate limiter with adaptive rate.
+
+    Callers reserve tokens in order and sleep until their tokens are available.
+    When the server throttles a call, the rate is halved and all callers wait for `Retry-After`;
+    every successful call increases the rate back towards the configured rate.
+    """
+
+    def __init__(self, rate, burst=None, min_rate=None):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate or rate / 10
+        self.burst = burst or rate
+        self.calls = 0
+        self.delayed_calls = 0
+        self.throttled_calls = 0
+        self.total_delay = 0.0
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._blocked_until = 0
+        self._lock = threading.Lock()
+
+    def reserve(self, weight=1):
+        """
+        Reserve `weight` tokens.
+
+        Returns:
+            float: Time in seconds to wait before the call.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= weight
+            delay = max(0, -self._tokens / self.rate, self._blocked_until - now)
+            self.calls += 1
+            if delay:
+                self.delayed_calls += 1
+                self.total_delay += delay
+
+            return delay
+
+    def acquire(self, weight=1):
+        if delay := self.reserve(weight=weight):
+            time.sleep(delay)
+
+    def throttled(self, retry_after=None):
+        with self._lock:
+            self.throttled_calls += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+            backoff = retry_after if retry_after is not None else 1 / self.rate
+            self._blocked_until = max(self._blocked_until, time.monotonic() + backoff)
+            LOGGER.warning(f"Call throttled, backing off {backoff:.1f} seconds, rate: {self.rate:.2f} calls/second")
+
+    def succeeded(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+    @property
+    def counters(self):
+        return {
+            "calls": self.calls,
+            "delayed_calls": self.delayed_calls,
+            "throttled_calls": self.throttled_calls,
+            "total_delay_seconds": round(self.total_delay, 2),
+        }
+
+
+def parse_retry_after(headers):
+    """
+    Args:
+        headers (dict or None): HTTP response headers.
+
+    Returns:
+        float or None: `Retry-After` header value in seconds, None if missing or invalid.
+    """
+    retry_after = (headers or {}).get("Retry-After")
+    if not retry_after:
+        return None
+
+    try:
+        return max(0.0, float(retry_after))
+
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, (parsedate_to_datetime(retry_after) - datetime.now(tz=timezone.utc)).total_seconds())
+
+    except (TypeError, ValueError):
+        return None
+
+
+def configure_ocm_rate_limiter(rate):
+    global _OCM_RATE_LIMITER
+    with _OCM_RATE_LIMITER_LOCK:
+        _OCM_RATE_LIMITER = TokenBucketRateLimiter(rate=rate)
+
+
+def get_ocm_rate_limiter():
+    """
+    Returns:
+        TokenBucketRateLimiter: Process-wide rate limiter for OCM API calls and ROSA commands.
+    """
+    global _OCM_RATE_LIMITER
+    with _OCM_RATE_LIMITER_LOCK:
+        if not _OCM_RATE_LIMITER:
+            _OCM_RATE_LIMITER = TokenBucketRateLimiter(rate=OCM_RATE_LIMIT_DEFAULT)
+
+        return _OCM_RATE_LIMITER
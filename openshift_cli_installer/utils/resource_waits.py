@@ -0,0 +1,159 @@
+import random
+import time
+
+from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutExpiredError, TimeoutWatch
+
+from openshift_cli_installer.utils.const import RESOURCE_WAIT_INITIAL_SLEEP, RESOURCE_WAIT_MAX_SLEEP
+
+LOGGER = get_logger(name=__name__)
+
+
+class ResourceWaitStopError(Exception):
+    """
+    Raised when the waited resource reached a state which can not lead to the expected one.
+    """
+
+
+def adaptive_sampler(
+    func,
+    wait_timeout,
+    initial_sleep=RESOURCE_WAIT_INITIAL_SLEEP,
+    max_sleep=RESOURCE_WAIT_MAX_SLEEP,
+    exceptions=(Exception,),
+):
+    """
+    Yield `func` results with exponential backoff and jitter between calls.
+
+    The backoff is reset whenever the sampled value changes, a resource which progresses is sampled often
+    and a stale one rarely.
+
+    Args:
+        func (callable): Called without arguments.
+        wait_timeout (float): Time to sample, in seconds.
+        initial_sleep (float): First interval between calls.
+        max_sleep (float): Maximum interval between calls.
+        exceptions (tuple): Exceptions of `func` to log and retry on, None is yielded instead.
+
+    Raises:
+        TimeoutExpiredError: When `wait_timeout` expires.
+    """
+    timeout_watch = TimeoutWatch(timeout=wait_timeout)
+    sleep = initial_sleep
+    last_value = None
+    while True:
+        try:
+            value = func()
+        except exceptions as ex:
+            LOGGER.debug(f"Sample failed: {ex}")
+            value = None
+
+        yield value
+
+        sleep = initial_sleep if value != last_value else min(sleep * 2, max_sleep)
+        last_value = value
+        remaining_time = timeout_watch.remaining_time()
+        if remaining_time <= 0:
+            raise TimeoutExpiredError(f"Timed out after {wait_timeout} seconds, last value: {value}")
+
+        # Jitter spreads the requests of concurrent waiters
+        time.sleep(min(random.uniform(sleep / 2, sleep), remaining_time))
+
+
+def _resource_dict(resource):
+    instance = resource.exists
+    return instance.to_dict() if instance else None
+
+
+def _check(resource_dict, predicate, stop_predicate):
+    if resource_dict is None:
+        return False
+
+    if stop_predicate and stop_predicate(resource_dict):
+        raise ResourceWaitStopError(f"{resource_dict.get('kind')} {resource_dict['metadata']['name']} failed")
+
+    return predicate(resource_dict)
+
+
+def _watch(resource, predicate, stop_predicate, timeout_watch, resource_version):
+    while (remaining_time := int(timeout_watch.remaining_time())) > 0:
+        # The server closes the watch after `timeout`, watch again from the last seen version
+        for _event in resource.watcher(timeout=remaining_time, resource_version=resource_version):
+            if _event["type"] == "ERROR":
+                raise ValueError(f"Watch error: {_event['raw_object']}")
+
+            raw_object = _event["raw_object"]
+            resource_version = raw_object["metadata"]["resourceVersion"]
+            if _event["type"] != "DELETED" and _check(
+                resource_dict=raw_object, predicate=predicate, stop_predicate=stop_predicate
+            ):
+                return raw_object
+
+    return None
+
+
+def wait_for_resource(resource, predicate, timeout, stop_predicate=None, description=""):
+    """
+    Wait for a resource dict to match `predicate`.
+
+    The resource is watched (by name) and every change is checked as soon as it happens; if the watch
+    is not available, the resource is polled by `adaptive_sampler` for the remaining time.
+
+    Args:
+        resource (Resource): ocp_resources resource, may not exist yet.
+        predicate (callable): Called with the resource dict, returns True when the wait is over.
+        timeout (float): Time to wait, in seconds.
+        stop_predicate (callable): Called with the resource dict, returns True if the wait should fail.
+        description (str): Expected state, for logs.
+
+    Returns:
+        dict: The resource dict which matched `predicate`.
+
+    Raises:
+        TimeoutExpiredError: When `timeout` expires.
+        ResourceWaitStopError: When `stop_predicate` matched.
+    """
+    log_prefix = f"{resource.kind} {resource.name}"
+    LOGGER.info(f"Wait for {log_prefix} {description}".rstrip())
+    timeout_watch = TimeoutWatch(timeout=timeout)
+    resource_dict = None
+    try:
+        resource_dict = _resource_dict(resource=resource)
+        if _check(resource_dict=resource_dict, predicate=predicate, stop_predicate=stop_predicate):
+            return resource_dict
+
+        if matched := _watch(
+            resource=resource,
+            predicate=predicate,
+            stop_predicate=stop_predicate,
+            timeout_watch=timeout_watch,
+            resource_version=resource_dict["metadata"]["resourceVersion"] if resource_dict else "",
+        ):
+            return matched
+
+    except ResourceWaitStopError:
+        raise
+
+    except Exception as ex:
+        LOGGER.warning(f"{log_prefix}: watch failed, polling instead: {ex}")
+
+    for _sample in adaptive_sampler(
+        func=lambda: _resource_dict(resource=resource),
+        wait_timeout=max(timeout_watch.remaining_time(), 0),
+    ):
+        if _check(resource_dict=_sample, predicate=predicate, stop_predicate=stop_predicate):
+            return _sample
+
+
+def status_phase_is(status):
+    return lambda resource_dict: resource_dict.get("status", {}).get("phase") == status
+
+
+def condition_is(condition, status):
+    def _condition_is(resource_dict):
+        return any(
+            _condition.get("type") == condition and _condition.get("status") == status
+            for _condition in resource_dict.get("status", {}).get("conditions", [])
+        )
+
+    return _condition_is
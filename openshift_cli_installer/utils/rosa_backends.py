@@ -0,0 +1,198 @@
+import re
+
+from ocm_python_client.exceptions import ApiException
+from ocm_python_client.model.ht_passwd_identity_provider import HTPasswdIdentityProvider
+from ocm_python_client.model.identity_provider import IdentityProvider
+from ocm_python_client.model.identity_provider_mapping_method import IdentityProviderMappingMethod
+from ocm_python_client.model.identity_provider_type import IdentityProviderType
+from ocm_python_client.model.user import User
+from simple_logger.logger import get_logger
+
+from openshift_cli_installer.utils.const import OCM_API_ROSA_BACKEND_STR, OCM_SEARCH_PAGE_SIZE
+from openshift_cli_installer.utils.rosa_commands import execute_rosa_command
+
+LOGGER = get_logger(name=__name__)
+
+
+class RosaCliBackend:
+    """
+    ROSA operations with the `rosa` cli, every operation runs a `rosa` process which logs in to OCM.
+
+    Read-only queries results are cached in `query_cache` (if given).
+    """
+
+    def __init__(self, ocm_client, aws_region, ocm_env=None, query_cache=None):
+        self.ocm_client = ocm_client
+        self.aws_region = aws_region
+        self.ocm_env = ocm_env
+        self.query_cache = query_cache
+
+    def execute(self, command):
+        return execute_rosa_command(command=command, aws_region=self.aws_region, ocm_client=self.ocm_client)
+
+    def cached_query(self, query, func, **flags):
+        if not self.query_cache:
+            return func(**flags)
+
+        return self.query_cache.get_or_fetch(
+            query,
+            func=lambda: func(**flags),
+            ocm_env=self.ocm_env,
+            region=self.aws_region,
+            flags=flags,
+        )
+
+    def list_versions(self, channel_group, hosted_cp):
+        """
+        Returns:
+            list: Versions raw IDs.
+        """
+        return self.cached_query(
+            "list versions", func=self._list_versions, channel_group=channel_group, hosted_cp=hosted_cp
+        )
+
+    def list_hypershift_regions(self):
+        return self.cached_query("list hypershift regions", func=self._list_hypershift_regions)
+
+    def _list_versions(self, channel_group, hosted_cp):
+        versions = self.execute(
+            command=f"list versions --channel-group={channel_group} {'--hosted-cp' if hosted_cp else ''}"
+        )["out"]
+        return [_version["raw_id"] for _version in versions]
+
+    def _list_hypershift_regions(self):
+        return [
+            _region["id"] for _region in self.execute(command="list regions")["out"] if _region["supports_hypershift"]
+        ]
+
+    def delete_cluster(self, cluster_name, cluster_id, hypershift, oidc_config_id=None):
+        """
+        Returns:
+            list: `rosa` commands to remove the cluster AWS leftovers once the cluster is uninstalled.
+        """
+        res = self.execute(command=f"delete cluster --cluster={cluster_name}")
+        leftovers = re.search(
+            r"INFO: Once the cluster is uninstalled use the following commands to"
+            r" remove"
+            r" the above "
+            r"aws resources(.*?)INFO:",
+            res.get("out", ""),
+            re.DOTALL,
+        )
+        leftover_commands = []
+        if leftovers:
+            for line in leftovers.group(1).splitlines():
+                _line = line.strip()
+                if _line.startswith("rosa"):
+                    base_command = _line.split(maxsplit=1)[-1]
+                    command = base_command.replace("-c ", "--cluster=")
+                    command = command.replace("--prefix ", "--prefix=")
+                    command = command.replace("--oidc-config-id ", "--oidc-config-id=")
+                    leftover_commands.append(command)
+
+        return leftover_commands
+
+    def create_htpasswd_idp(self, cluster_id, idp_name, username, password):
+        self.execute(
+            command=f"create idp -c {cluster_id} --type htpasswd --name {idp_name} --username={username} --password={password}"
+        )
+
+    def grant_cluster_admin(self, cluster_id, username):
+        self.execute(command=f"grant user cluster-admin --user={username} --cluster={cluster_id}")
+
+
+class OcmApiRosaBackend(RosaCliBackend):
+    """
+    ROSA operations with direct OCM API calls through the shared OCM client, no `rosa` process and login.
+
+    Operations without an OCM API equivalent (cluster create, OIDC config, operator roles) and OCM API
+    failures fall back to the `rosa` cli.
+    """
+
+    def _fallback_to_cli(self, operation, ex):
+        LOGGER.warning(f"OCM API {operation} failed, falling back to rosa cli: {ex}")
+
+    def _list_versions(self, channel_group, hosted_cp):
+        search = f"enabled = 'true' and rosa_enabled = 'true' and channel_group = '{channel_group}'"
+        if hosted_cp:
+            search += " and hosted_control_plane_enabled = 'true'"
+
+        versions = []
+        page = 1
+        try:
+            while True:
+                _versions = self.ocm_client.api_clusters_mgmt_v1_versions_get(
+                    search=search, page=page, size=OCM_SEARCH_PAGE_SIZE
+                ).items
+                versions.extend(_version.raw_id for _version in _versions)
+                if len(_versions) < OCM_SEARCH_PAGE_SIZE:
+                    return versions
+
+                page += 1
+
+        except ApiException as ex:
+            self._fallback_to_cli(operation="list versions", ex=ex)
+            return super()._list_versions(channel_group=channel_group, hosted_cp=hosted_cp)
+
+    def _list_hypershift_regions(self):
+        try:
+            regions = self.ocm_client.api_clusters_mgmt_v1_cloud_providers_cloud_provider_id_regions_get(
+                cloud_provider_id="aws", size=OCM_SEARCH_PAGE_SIZE
+            ).items
+            return [_region.id for _region in regions if getattr(_region, "supports_hypershift", False)]
+
+        except ApiException as ex:
+            self._fallback_to_cli(operation="list regions", ex=ex)
+            return super()._list_hypershift_regions()
+
+    def delete_cluster(self, cluster_name, cluster_id, hypershift, oidc_config_id=None):
+        if not cluster_id:
+            return super().delete_cluster(
+                cluster_name=cluster_name, cluster_id=cluster_id, hypershift=hypershift, oidc_config_id=oidc_config_id
+            )
+
+        try:
+            self.ocm_client.api_clusters_mgmt_v1_clusters_cluster_id_delete(cluster_id=cluster_id, deprovision=True)
+
+        except ApiException as ex:
+            self._fallback_to_cli(operation="delete cluster", ex=ex)
+            return super().delete_cluster(
+                cluster_name=cluster_name, cluster_id=cluster_id, hypershift=hypershift, oidc_config_id=oidc_config_id
+            )
+
+        # Same AWS leftovers `rosa delete cluster` asks to remove
+        if hypershift:
+            return [f"delete oidc-provider --oidc-config-id={oidc_config_id}"] if oidc_config_id else []
+
+        return [f"delete operator-roles --cluster={cluster_id}", f"delete oidc-provider --cluster={cluster_id}"]
+
+    def create_htpasswd_idp(self, cluster_id, idp_name, username, password):
+        try:
+            self.ocm_client.api_clusters_mgmt_v1_clusters_cluster_id_identity_providers_post(
+                cluster_id=cluster_id,
+                identity_provider=IdentityProvider(
+                    name=idp_name,
+                    type=IdentityProviderType("HTPasswdIdentityProvider"),
+                    mapping_method=IdentityProviderMappingMethod("claim"),
+                    htpasswd=HTPasswdIdentityProvider(username=username, password=password),
+                ),
+            )
+
+        except ApiException as ex:
+            self._fallback_to_cli(operation="create idp", ex=ex)
+            super().create_htpasswd_idp(cluster_id=cluster_id, idp_name=idp_name, username=username, password=password)
+
+    def grant_cluster_admin(self, cluster_id, username):
+        try:
+            self.ocm_client.api_clusters_mgmt_v1_clusters_cluster_id_groups_group_id_users_post(
+                cluster_id=cluster_id, group_id="cluster-admins", user=User(id=username)
+            )
+
+        except ApiException as ex:
+            self._fallback_to_cli(operation="grant user", ex=ex)
+            super().grant_cluster_admin(cluster_id=cluster_id, username=username)
+
+
+def get_rosa_backend(backend_name, ocm_client, aws_region, ocm_env=None, query_cache=None):
+    backend_class = OcmApiRosaBackend if backend_name == OCM_API_ROSA_BACKEND_STR else RosaCliBackend
+    return backend_class(ocm_client=ocm_client, aws_region=aws_region, ocm_env=ocm_env, query_cache=query_cache)
@@ -0,0 +1,59 @@
+import re
+
+import rosa.cli
+from rosa.cli import CommandExecuteError
+from simple_logger.logger import get_logger
+
+from openshift_cli_installer.utils.const import (
+    OCM_THROTTLING_RETRIES,
+    ROSA_COMMAND_OCM_CALLS,
+    ROSA_READ_ONLY_COMMANDS,
+)
+from openshift_cli_installer.utils.rate_limiter import get_ocm_rate_limiter
+
+LOGGER = get_logger(name=__name__)
+
+# OCM API errors are reported as `status is <HTTP status>, identifier is '<id>', code is '<OCM code>'`
+THROTTLING_ERROR_REGEX = re.compile(r"\bstatus is 429\b")
+
+
+def is_read_only_rosa_command(command):
+    return command.split(maxsplit=1)[0] in ROSA_READ_ONLY_COMMANDS
+
+
+def execute_rosa_command(command, aws_region, ocm_client):
+    """
+    Execute ROSA cli command, rate limited with the process-wide OCM rate limiter.
+
+    Read-only commands which fail because OCM throttled the request (HTTP 429) are retried, other commands may
+    have already changed state before being throttled and are not.
+
+    Args:
+        command (str): ROSA cli command.
+        aws_region (str): AWS region.
+        ocm_client (DefaultApi): OCM client used to log in.
+
+    Returns:
+        dict: {'out': stdout, 'err': stderr}
+    """
+    rate_limiter = get_ocm_rate_limiter()
+    retries = OCM_THROTTLING_RETRIES if is_read_only_rosa_command(command=command) else 0
+    for attempt in range(retries + 1):
+        # ROSA cli logs in, runs the command and logs out
+        rate_limiter.acquire(weight=ROSA_COMMAND_OCM_CALLS)
+        try:
+            res = rosa.cli.execute(command=command, aws_region=aws_region, ocm_client=ocm_client)
+
+        except CommandExecuteError as ex:
+            if not THROTTLING_ERROR_REGEX.search(str(ex)):
+                raise
+
+            rate_limiter.throttled()
+            if attempt == retries:
+                raise
+
+            LOGGER.warning(f"ROSA command throttled by OCM, retrying [attempt {attempt + 1}/{retries}]")
+            continue
+
+        rate_limiter.succeeded()
+        return res
@@ -0,0 +1,41 @@
+import heapq
+
+from simple_logger.logger import get_logger
+
+LOGGER = get_logger(name=__name__)
+
+
+def schedule_longest_job_first(jobs, slots, deadline):
+    """
+    Order jobs longest-first and simulate running them on `slots` workers.
+
+    High priority jobs are always scheduled before low priority jobs.
+    Low priority jobs which cannot finish before the deadline are skipped.
+
+    Args:
+        jobs (list): Tuples of (job, expected duration in seconds, low priority bool).
+        slots (int): Number of jobs which can run concurrently.
+        deadline (int): Run deadline in seconds.
+
+    Returns:
+        tuple: List of jobs in start order, list of skipped jobs.
+    """
+    scheduled_jobs = []
+    skipped_jobs = []
+    # Time (in seconds from run start) each slot becomes free
+    slots_free_time = [0] * max(slots, 1)
+
+    for low_priority in (False, True):
+        for job, duration, _ in sorted(
+            [_job for _job in jobs if _job[2] is low_priority], key=lambda _job: _job[1], reverse=True
+        ):
+            start_time = slots_free_time[0]
+            if low_priority and start_time + duration > deadline:
+                skipped_jobs.append(job)
+                continue
+
+            heapq.heapreplace(slots_free_time, start_time + duration)
+            scheduled_jobs.append(job)
+
+    LOGGER.info(f"Expected run makespan: {max(slots_free_time)} seconds, deadline: {deadline} seconds")
+    return scheduled_jobs, skipped_jobs
@@ -0,0 +1,76 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from simple_logger.logger import get_logger
+
+LOGGER = get_logger(name=__name__)
+
+
+class TaskGraphError(Exception):
+    """
+    Raised when tasks of the graph failed.
+
+    Attributes:
+        errors (dict): Failed task name to its exception.
+        results (dict): Succeeded task name to its result.
+        skipped (set): Names of the tasks which did not run since a dependency failed.
+    """
+
+    def __init__(self, errors, results, skipped):
+        self.errors = errors
+        self.results = results
+        self.skipped = skipped
+        super().__init__(f"Failed tasks: {errors}, skipped tasks: {sorted(skipped)}")
+
+    @property
+    def started(self):
+        return set(self.errors) | set(self.results)
+
+
+def run_task_graph(tasks, max_workers=None):
+    """
+    Run tasks concurrently, every task starts as soon as all its dependencies succeeded.
+
+    A failed task does not stop the running tasks; tasks depending on it (directly or not) are skipped.
+
+    Args:
+        tasks (dict): Task name to a (func, dependencies names) tuple, `func` is called without arguments.
+        max_workers (int): Maximum tasks to run in parallel, defaults to the number of tasks.
+
+    Returns:
+        dict: Task name to its result.
+
+    Raises:
+        TaskGraphError: If any task failed.
+    """
+    pending = dict(tasks)
+    running = {}
+    results, errors, skipped = {}, {}, set()
+    with ThreadPoolExecutor(max_workers=max_workers or max(len(tasks), 1)) as executor:
+        while pending or running:
+            for _name, (_func, _dependencies) in list(pending.items()):
+                if any(_dependency in errors or _dependency in skipped for _dependency in _dependencies):
+                    pending.pop(_name)
+                    skipped.add(_name)
+
+                elif all(_dependency in results for _dependency in _dependencies):
+                    pending.pop(_name)
+                    running[executor.submit(_func)] = _name
+
+            if not running:
+                # Dependencies which are not tasks can never be satisfied
+                skipped.update(pending)
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for _future in done:
+                _name = running.pop(_future)
+                try:
+                    results[_name] = _future.result()
+                except Exception as ex:
+                    LOGGER.error(f"Task {_name} failed: {ex}")
+                    errors[_name] = ex
+
+    if errors or skipped:
+        raise TaskGraphError(errors=errors, results=results, skipped=skipped)
+
+    return results
@@ -0,0 +1,101 @@
+import fcntl
+import hashlib
+import os
+import shutil
+from pathlib import Path
+
+from python_terraform import Terraform
+from simple_logger.logger import get_logger
+
+from openshift_cli_installer.utils.const import TERRAFORM_CACHE_DIRECTORY
+
+LOGGER = get_logger(name=__name__)
+
+TERRAFORM_LOCK_FILENAME = ".terraform.lock.hcl"
+TERRAFORM_DATA_DIRNAME = ".terraform"
+
+
+class TerraformInitError(Exception):
+    pass
+
+
+def configure_terraform_plugin_cache(cache_dir=TERRAFORM_CACHE_DIRECTORY):
+    """
+    Share downloaded Terraform providers between all working directories and runs, unless the user already
+    configured a plugin cache directory.
+    """
+    plugin_cache_dir = os.environ.setdefault("TF_PLUGIN_CACHE_DIR", os.path.join(cache_dir, "plugin-cache"))
+    # Working directories copied from the template have a lock file, fresh ones do not
+    os.environ.setdefault("TF_PLUGIN_CACHE_MAY_BREAK_DEPENDENCY_LOCK_FILE", "true")
+    Path(plugin_cache_dir).mkdir(parents=True, exist_ok=True)
+
+
+def get_terraform_template_dir(manifest_path, cache_dir=TERRAFORM_CACHE_DIRECTORY):
+    """
+    Get a shared Terraform working directory for the manifest, initialized (modules and providers downloaded)
+    only once for all runs.
+
+    Args:
+        manifest_path (str): Terraform manifest path.
+        cache_dir (str): Terraform cache directory.
+
+    Returns:
+        str: Initialized template working directory.
+
+    Raises:
+        TerraformInitError: If the template directory initialization failed.
+    """
+    configure_terraform_plugin_cache(cache_dir=cache_dir)
+    with open(manifest_path, "rb") as fd:
+        manifest_hash = hashlib.sha256(fd.read()).hexdigest()[:16]
+
+    template_dir = os.path.join(cache_dir, "templates", manifest_hash)
+    initialized_marker = os.path.join(template_dir, ".initialized")
+    if os.path.exists(initialized_marker):
+        return template_dir
+
+    Path(template_dir).mkdir(parents=True, exist_ok=True)
+    with open(os.path.join(cache_dir, "templates", f"{manifest_hash}.lock"), "w") as lock_fd:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX)
+        try:
+            # Another process or thread may have initialized the template while we waited for the lock
+            if os.path.exists(initialized_marker):
+                return template_dir
+
+            LOGGER.info(f"Initializing shared Terraform template directory {template_dir}")
+            shutil.copy(manifest_path, template_dir)
+            rc, out, err = Terraform(working_dir=template_dir).init()
+            if rc != 0:
+                raise TerraformInitError(f"Terraform template init failed. Err: {err}, Out: {out}")
+
+            Path(initialized_marker).touch()
+            return template_dir
+
+        finally:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+
+
+def prepare_terraform_working_dir(manifest_path, working_dir, cache_dir=TERRAFORM_CACHE_DIRECTORY):
+    """
+    Copy the manifest and the pre-vendored modules and providers of the shared template directory to
+    `working_dir`, `terraform init` in `working_dir` then does not download anything.
+
+    Args:
+        manifest_path (str): Terraform manifest path.
+        working_dir (str): Terraform working directory.
+        cache_dir (str): Terraform cache directory.
+
+    Raises:
+        TerraformInitError: If the template directory initialization failed.
+    """
+    template_dir = get_terraform_template_dir(manifest_path=manifest_path, cache_dir=cache_dir)
+    shutil.copy(manifest_path, working_dir)
+    shutil.copytree(
+        os.path.join(template_dir, TERRAFORM_DATA_DIRNAME),
+        os.path.join(working_dir, TERRAFORM_DATA_DIRNAME),
+        symlinks=True,
+        dirs_exist_ok=True,
+    )
+    template_lock_file = os.path.join(template_dir, TERRAFORM_LOCK_FILENAME)
+    if os.path.exists(template_lock_file):
+        shutil.copy(template_lock_file, working_dir)